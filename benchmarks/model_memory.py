@@ -0,0 +1,109 @@
+"""
+Measure the memory used by Products loaded from a large response.
+
+Products are created from decoded JSON as they are when loading Product Ranges,
+once keeping their JSON and once without it. They are compared with the same
+attributes held in an instance dict, as Products were before they used slots.
+
+Usage: python -m benchmarks.model_memory [count]
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+
+from ccapi import cc_objects
+
+PRODUCT_COUNT = 100_000
+
+PRODUCT = {
+    "isChecked": False,
+    "isListed": True,
+    "SupplierSKU": None,
+    "ID": 0,
+    "Name": "Product",
+    "FullName": "Product - Size: Small",
+    "Description": "Product description.",
+    "ManufacturerSKU": "ABC-123-DEF",
+    "BasePrice": 4.99,
+    "VatRateID": 5,
+    "Barcode": "5000000000000",
+    "RangeID": 0,
+    "RangeName": "Product",
+    "PreOrder": 0,
+    "EndOfLine": 0,
+    "StockLevel": 10,
+    "PseudoStockType": 0,
+    "PseudoStockLevel": None,
+    "StatusID": 0,
+    "ProductType": 0,
+    "LengthMM": 0,
+    "WidthMM": 0,
+    "HeightMM": 0,
+    "LengthCM": 0,
+    "WidthCM": 0,
+    "HeightCM": 0,
+    "LargeLetterCompatible": 1,
+    "ExternalProductId": 0,
+    "AdditionalShippingLabel": 0,
+    "defaultImageUrl": None,
+    "DeliveryLeadTimeDays": None,
+    "ProductTemplateId": None,
+    "ProductTemplateMode": 0,
+    "AdditionalBarcodes": None,
+    "WeightGM": 100,
+    "HSCode": None,
+    "Locations": None,
+    "Dimensions": None,
+}
+
+
+class DictProduct:
+    """The attributes of a Product held in an instance dict."""
+
+    def __init__(self, data):
+        """Copy the attributes of a Product created from data."""
+        product = cc_objects.Product(data)
+        for name in cc_objects.Product.__slots__:
+            setattr(self, name, getattr(product, name))
+
+
+def get_payload(count):
+    """Return a JSON response containing count products."""
+    return json.dumps(
+        [dict(PRODUCT, ID=i, ManufacturerSKU=f"SKU-{i}") for i in range(count)]
+    )
+
+
+def measure(payload, product_class):
+    """Return the memory in bytes held by products loaded from payload."""
+    gc.collect()
+    tracemalloc.start()
+    products = [product_class(data) for data in json.loads(payload)]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del products
+    return size
+
+
+def main(count=PRODUCT_COUNT):
+    """Print the memory used to load count products."""
+    payload = get_payload(count)
+    results = []
+    for name, product_class, keep in (
+        ("Instance dict, JSON kept", DictProduct, True),
+        ("Slots, JSON kept", cc_objects.Product, True),
+        ("Slots, JSON dropped", cc_objects.Product, False),
+    ):
+        with cc_objects.keep_json(keep):
+            results.append((name, measure(payload, product_class)))
+    baseline = results[0][1]
+    print(f"Memory used by {count} Products:")
+    for name, size in results:
+        print(f"{name:<26} {size / 2**20:8.1f} MiB {size / baseline:6.0%}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
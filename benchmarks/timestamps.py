@@ -0,0 +1,69 @@
+"""
+Measure the time taken to parse Cloud Commerce timestamps.
+
+Timestamps are parsed as they are for a page of orders for dispatch, where
+dispatch dates repeat heavily, and as all distinct values. The shared parser is
+compared with splitting each timestamp as the models did before it was used.
+
+Usage: python -m benchmarks.timestamps [count]
+"""
+
+import datetime
+import sys
+import timeit
+
+from ccapi.timestamps import parse_timestamp, parse_timestamps
+
+TIMESTAMP_COUNT = 10_000
+REPEAT = 5
+
+
+def split_timestamp(timestamp_string):
+    """Parse a timestamp by splitting it, without caching."""
+    date, time = timestamp_string.split(" ")
+    day, month, year = date.split("/")
+    hour, minute = time.split(":")
+    return datetime.datetime(
+        day=int(day),
+        month=int(month),
+        year=int(year),
+        hour=int(hour),
+        minute=int(minute),
+    )
+
+
+def get_timestamps(count, distinct):
+    """Return count timestamps with distinct different values."""
+    start = datetime.datetime(2020, 1, 1)
+    return [
+        (start + datetime.timedelta(minutes=i % distinct)).strftime("%d/%m/%Y %H:%M")
+        for i in range(count)
+    ]
+
+
+def measure(func, timestamps):
+    """Return the fastest time in seconds taken to parse timestamps with func."""
+
+    def run():
+        parse_timestamp.cache_clear()
+        func(timestamps)
+
+    return min(timeit.repeat(run, number=1, repeat=REPEAT))
+
+
+def main(count=TIMESTAMP_COUNT):
+    """Print the time taken to parse count timestamps."""
+    print(f"Time to parse {count} timestamps:")
+    for workload, distinct in (("Repeated", 10), ("Distinct", count)):
+        timestamps = get_timestamps(count, distinct)
+        for name, func in (
+            ("split", lambda values: [split_timestamp(value) for value in values]),
+            ("parse_timestamp", lambda values: [parse_timestamp(v) for v in values]),
+            ("parse_timestamps", parse_timestamps),
+        ):
+            elapsed = measure(func, timestamps)
+            print(f"{workload:<9} {name:<17} {elapsed * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
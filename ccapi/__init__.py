@@ -5,6 +5,8 @@ import logging  # isort:skip
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 from .ccapi import CCAPI  # NOQA isort:skip
+from .asyncccapi import AsyncCCAPI  # NOQA isort:skip
+from .bulk import BulkExecutor, BulkResult  # NOQA isort:skip
 from .cc_objects import (  # NOQA isort:skip
     MultipackInfo,
     MultipackItem,
@@ -17,6 +19,9 @@ from .urls import URLs  # NOQA isort:skip
 
 __all__ = [
     "CCAPI",
+    "AsyncCCAPI",
+    "BulkExecutor",
+    "BulkResult",
     "MultipackInfo",
     "MultipackItem",
     "ProductOptions",
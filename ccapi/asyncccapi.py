@@ -0,0 +1,119 @@
+"""This module contains the AsyncCCAPI class for ccapi."""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+from .ccapi import CCAPI
+from .requests import CloudCommerceAPISession
+
+
+class AsyncCCAPI:
+    """
+    Asyncio interface for the Cloud Commerce Pro API.
+
+    Provides a coroutine for every public method of ccapi.CCAPI with the same name
+    and arguments. Calls are made on a bounded thread pool so the request classes
+    are shared with the synchronous API, and every call uses the same logged in
+    session. Methods returning generators are consumed in the thread pool and
+    their results returned as lists.
+
+    Args:
+        username: Login username.
+        password: Login password.
+
+    Kwargs:
+        domain: Cloud Commerce domain.
+        session: A ccapi.requests.CloudCommerceAPISession to use. If None a new
+            session is created with a connection pool sized for max_concurrency.
+            Default: None.
+        max_concurrency: The maximum number of requests to run at once. Default: 10.
+        **session_options: Connection pool options passed to
+            ccapi.requests.CloudCommerceAPISession.
+    """
+
+    MAX_CONCURRENCY = 10
+
+    def __init__(
+        self,
+        username=None,
+        password=None,
+        *,
+        domain=None,
+        session=None,
+        max_concurrency=MAX_CONCURRENCY,
+        **session_options,
+    ):
+        """Create an asyncio Cloud Commerce Pro API session."""
+        if session is None:
+            session_options.setdefault("pool_maxsize", max_concurrency)
+            session = CloudCommerceAPISession(**session_options)
+        self.session = session
+        self.session.get_session(domain=domain, username=username, password=password)
+        self.max_concurrency = max_concurrency
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="ccapi"
+        )
+        self._semaphores = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Shut down the thread pool."""
+        self.executor.shutdown(wait=True)
+
+    def _get_semaphore(self):
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
+
+    async def run(self, func, *args, **kwargs):
+        """Run func in the thread pool using this instance's session."""
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore():
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(
+                self.executor,
+                functools.partial(
+                    context.run, self._call_with_session, func, *args, **kwargs
+                ),
+            )
+
+    async def request(self, request_class, *args, **kwargs):
+        """Send a request and return the processed response.
+
+        Args:
+            request_class: The ccapi.requests.APIRequest subclass to send.
+            *args, **kwargs: Arguments for the request.
+        """
+        request = request_class.prepare(*args, **kwargs)
+        return await self.run(request.send, session=self.session)
+
+    def _call_with_session(self, func, *args, **kwargs):
+        with self.session.activate():
+            result = func(*args, **kwargs)
+            if inspect.isgenerator(result):
+                result = list(result)
+            return result
+
+
+def _async_method(name):
+    method = getattr(CCAPI, name)
+
+    @functools.wraps(method)
+    async def async_method(self, *args, **kwargs):
+        return await self.run(getattr(CCAPI, name), *args, **kwargs)
+
+    return async_method
+
+
+for _name, _method in inspect.getmembers(CCAPI, callable):
+    if not _name.startswith("_") and not hasattr(AsyncCCAPI, _name):
+        setattr(AsyncCCAPI, _name, _async_method(_name))
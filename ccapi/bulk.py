@@ -0,0 +1,124 @@
+"""This module contains classes for making many Cloud Commerce requests at once."""
+
+import collections
+import contextvars
+import itertools
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .requests import CloudCommerceAPISession
+
+logger = logging.getLogger(__name__)
+
+
+class BulkResult:
+    """
+    The result of one call made by BulkExecutor.
+
+    Attributes:
+        index: The position of the arguments in the input.
+        arguments: The arguments the call was made with.
+        result: The value returned by the call, or None if it failed.
+        exception: The exception raised by the call, or None if it succeeded.
+    """
+
+    def __init__(self, index, arguments, result=None, exception=None):
+        """Create a bulk result."""
+        self.index = index
+        self.arguments = arguments
+        self.result = result
+        self.exception = exception
+
+    def __repr__(self):
+        if self.exception is not None:
+            return f"<BulkResult {self.index}: {self.exception!r}>"
+        return f"<BulkResult {self.index}: {self.result!r}>"
+
+    @property
+    def ok(self):
+        """Return True if the call succeeded."""
+        return self.exception is None
+
+
+class BulkExecutor:
+    """
+    Make calls for many sets of arguments on a bounded thread pool.
+
+    Each set of arguments may be a dict of keyword arguments, a tuple or list of
+    positional arguments or a single positional argument.
+
+    Kwargs:
+        max_workers: The maximum number of calls to make at once. Default: 10.
+        session: The ccapi.requests.CloudCommerceAPISession used by the calls. If
+            None the current session is used. Default: None.
+    """
+
+    MAX_WORKERS = 10
+
+    def __init__(self, *, max_workers=MAX_WORKERS, session=None):
+        """Create a bulk executor."""
+        self.max_workers = max_workers
+        if session is None:
+            session = CloudCommerceAPISession.current()
+        self.session = session
+
+    def map(self, func, arguments, *, ordered=True):
+        """
+        Call func with each set of arguments and yield a BulkResult for each call.
+
+        Exceptions raised by func are stored on the result rather than raised, so one
+        failure does not stop the remaining calls. No more than twice max_workers
+        calls are queued at once so arguments are consumed lazily.
+
+        Args:
+            func: The callable to call, for example a CCAPI method or a
+                ccapi.requests.APIRequest subclass.
+            arguments: An iterable of argument sets.
+
+        Kwargs:
+            ordered: If True results are yielded in the order of arguments,
+                otherwise as they are completed. Default: True.
+
+        """
+        arguments = enumerate(arguments)
+        window = self.max_workers * 2
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="ccapi-bulk"
+        ) as executor:
+            pending = collections.deque(
+                self._submit(executor, func, index, argument_set)
+                for index, argument_set in itertools.islice(arguments, window)
+            )
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                for future in done:
+                    yield future.result()
+                for index, argument_set in itertools.islice(arguments, len(done)):
+                    pending.append(self._submit(executor, func, index, argument_set))
+
+    def _submit(self, executor, func, index, argument_set):
+        context = contextvars.copy_context()
+        return executor.submit(context.run, self._call, func, index, argument_set)
+
+    def _call(self, func, index, argument_set):
+        args, kwargs = self._split_arguments(argument_set)
+        try:
+            with self.session.activate():
+                result = func(*args, **kwargs)
+        except Exception as e:
+            logger.exception(e)
+            return BulkResult(index, argument_set, exception=e)
+        return BulkResult(index, argument_set, result=result)
+
+    @staticmethod
+    def _split_arguments(argument_set):
+        if isinstance(argument_set, dict):
+            return (), argument_set
+        if isinstance(argument_set, (tuple, list)):
+            return tuple(argument_set), {}
+        return (argument_set,), {}
@@ -15,6 +15,7 @@ from .productoptions import (
     ProductOptionValue,
 )
 from .productrange import ProductRange
+from .rawjson import keep_json, keeping_json, retained_json, set_keep_json
 from .saleschannel import SalesChannel
 from .vatrates import VatRates
 from .warehouse import Warehouse, WarehouseBay, Warehouses
@@ -43,4 +44,8 @@ __all__ = [
     "ProductOption",
     "ProductOptions",
     "ProductOptionValue",
+    "keep_json",
+    "keeping_json",
+    "retained_json",
+    "set_keep_json",
 ]
@@ -0,0 +1,27 @@
+"""This module contains the APIObject class."""
+
+import ccapi
+
+
+class APIObject:
+    """
+    Base class for Cloud Commerce objects with methods making requests.
+
+    Objects keep the session which was active when they were created and make
+    their requests with it, so objects returned by a ccapi.CCAPI instance use
+    that instance's session. Objects created when no session was active use the
+    current session.
+    """
+
+    __slots__ = ("session",)
+
+    def __init__(self):
+        """Store the active session."""
+        self.session = ccapi.requests.CloudCommerceAPISession.active()
+
+    @property
+    def api(self):
+        """Return ccapi.CCAPI, making requests with this object's session."""
+        if self.session is None:
+            return ccapi.CCAPI
+        return ccapi.CCAPI._for_session(self.session)
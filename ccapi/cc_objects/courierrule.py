@@ -1,12 +1,14 @@
 """Containers for Shipping Rules."""
 
+from .rawjson import retained_json
+
 
 class CourierRules:
     """Container for courier rules."""
 
     def __init__(self, courier_rule_data):
         """Add rules."""
-        self.json = courier_rule_data
+        self.json = retained_json(courier_rule_data)
         self.rules = [CourierRule(rule) for rule in courier_rule_data]
 
     def __iter__(self):
@@ -20,6 +22,49 @@ class CourierRules:
 class CourierRule:
     """Courier Rule."""
 
+    __slots__ = (
+        "json",
+        "id",
+        "active_rules",
+        "selected",
+        "rule_applied",
+        "label_type_enum",
+        "send_csv_enum",
+        "vat_evavluate_type_enum",
+        "brand_id",
+        "courier_services_group_id",
+        "front_end_price",
+        "name",
+        "status_id",
+        "status_id_enum",
+        "courier_services_rule_id",
+        "baseline_cost",
+        "brand_courier_selection_type",
+        "country_id",
+        "except_country_selected",
+        "additional_shipping_label",
+        "initial_weight",
+        "cost_per_kg",
+        "label_type",
+        "send_csv",
+        "bonus_score",
+        "label_template",
+        "vat_value",
+        "vat_evaluation_type",
+        "customer_facing_name",
+        "customer_facing_description",
+        "signature_value",
+        "page_size_override",
+        "baseline_weight",
+        "rule_courier_account",
+        "estimated_delivery_days",
+        "is_priority",
+        "priority_days_to_deliver",
+        "baseline_weight_max",
+        "copied_from_id",
+        "is_default_rule",
+    )
+
     def __init__(self, data=None):
         """
         Create CourierRule.
@@ -35,7 +80,7 @@ class CourierRule:
 
     def load_from_request(self, data):
         """Set attributes based on GetDispatchMethodsForOrder request."""
-        self.json = data
+        self.json = retained_json(data)
         self.id = data["ID"]
         if data["ActiveRules"] is None:
             self.active_rules = []
@@ -83,6 +128,20 @@ class CourierRule:
 class ActiveRule:
     """Container for active Cloud Commerce shipping rules."""
 
+    __slots__ = (
+        "json",
+        "id",
+        "brand_id",
+        "brand_courier_selection_id",
+        "name",
+        "field",
+        "operator",
+        "value",
+        "status_id",
+        "status_id_enum",
+        "is_optional",
+    )
+
     def __init__(self, data=None):
         """
         Create ShippingRule.
@@ -95,7 +154,7 @@ class ActiveRule:
 
     def load_from_request(self, data):
         """Set attributes based on data from getOrdersForDispatch request."""
-        self.json = data
+        self.json = retained_json(data)
         self.id = data["id"]
         self.brand_id = data["BrandID"]
         self.brand_courier_selection_id = data["BrandCourierSelectionID"]
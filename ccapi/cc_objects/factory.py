@@ -1,13 +1,14 @@
 """Containers for Cloud Commerce factories."""
 
-from ccapi import ccapi
+from .apiobject import APIObject
 
 
-class Factory:
+class Factory(APIObject):
     """Container for factories."""
 
     def __init__(self, data):
         """Set object attributes."""
+        super().__init__()
         self.load_from_data(data)
 
     def load_from_data(self, data):
@@ -26,15 +27,15 @@ class Factory:
 
     def delete(self):
         """Delete this factory."""
-        return ccapi.CCAPI.delete_factory(self.id)
+        return self.api.delete_factory(self.id)
 
     def delete_product_links(self):
         """Delete all product links for this factory."""
-        return ccapi.CCAPI.delete_product_factory_links(self.id)
+        return self.api.delete_product_factory_links(self.id)
 
     def update_product_link(self, product_id, dropship=False, supplier_sku="", price=0):
         """Update or create product link."""
-        return ccapi.CCAPI.update_product_factory_link(
+        return self.api.update_product_factory_link(
             product_id=product_id,
             factory_id=self.id,
             dropship=dropship,
@@ -43,11 +44,12 @@ class Factory:
         )
 
 
-class Factories:
+class Factories(APIObject):
     """Container for multiple Factory objects."""
 
     def __init__(self, factories):
         """Set factory list."""
+        super().__init__()
         self.factories = factories
         self.names = {f.name: f for f in factories}
         self.ids = {f.id: f for f in factories}
@@ -64,17 +66,18 @@ class Factories:
 
     def create_factory(self, name):
         """Create new factory."""
-        factory = ccapi.CCAPI.create_factory(name)
+        factory = self.api.create_factory(name)
         self.factories.append(factory)
         self.names[factory.name] = factory
         self.ids[factory.id] = factory
 
 
-class FactoryLink:
+class FactoryLink(APIObject):
     """Container for Factory Links."""
 
     def __init__(self, data):
         """Set factory link attributes from API data."""
+        super().__init__()
         self.link_id = int(data["LinkID"])
         self.order_price = float(data["OrderPrice"])
         self.price_precision = float(data["PricePrecision"])
@@ -99,7 +102,7 @@ class FactoryLink:
 
     def delete(self):
         """Delete this Product factory link."""
-        return ccapi.CCAPI.delete_product_factory_link(self.link_id)
+        return self.api.delete_product_factory_link(self.link_id)
 
 
 class FactoryLinks:
@@ -1,26 +1,73 @@
 """This module contains the Product class."""
 
-import ccapi
-
+from .apiobject import APIObject
 from .productoptions import ProductOption, ProductOptionValue
+from .rawjson import retained_json
 from .vatrates import VatRates
 from .warehouse import WarehouseBay
 
 
-class Product:
+class Product(APIObject):
     """Product class containing data and methods for working with Products."""
 
-    _options = None
-    bays = None
+    __slots__ = (
+        "json",
+        "is_checked",
+        "is_listed",
+        "supplier_sku",
+        "id",
+        "name",
+        "full_name",
+        "description",
+        "sku",
+        "base_price",
+        "vat_rate_id",
+        "vat_rate",
+        "barcode",
+        "range_id",
+        "range_name",
+        "pre_order",
+        "end_of_line",
+        "stock_level",
+        "pseudo_stock_type",
+        "pseudo_stock_level",
+        "status_id",
+        "product_type",
+        "length_mm",
+        "width_mm",
+        "height_mm",
+        "length_cm",
+        "width_cm",
+        "height_cm",
+        "large_letter_compatible",
+        "external_product_id",
+        "additional_shipping_label",
+        "default_image_url",
+        "delivery_lead_time",
+        "product_template_id",
+        "product_template_mode",
+        "additional_barcodes",
+        "weight",
+        "hs_code",
+        "bays",
+        "dimensions",
+        "_options",
+    )
 
     def __init__(self, data):
         """
         Create Product object.
 
+        The JSON is kept as the json attribute unless disabled with
+        ccapi.cc_objects.set_keep_json or ccapi.cc_objects.keep_json.
+
         Args:
             data: Cloud Commerce Product JSON object.
         """
-        self.json = data
+        super().__init__()
+        self.json = retained_json(data)
+        self._options = None
+        self.bays = None
         self.is_checked = data["isChecked"]
         self.is_listed = data["isListed"]
         self.supplier_sku = data["SupplierSKU"]
@@ -73,7 +120,7 @@ class Product:
 
     def get_sales_channels(self):
         """Get Sales Channels for this Product Range."""
-        return ccapi.CCAPI.get_sales_channels_for_range(self.range_id)
+        return self.api.get_sales_channels_for_range(self.range_id)
 
     def get_sales_channel_ids(self):
         """Get IDs of Sales Channels on which this Product Range is listed."""
@@ -88,16 +135,16 @@ class Product:
         applied to this Product.
         """
         if self._options is None:
-            self._options = ccapi.CCAPI.get_options_for_product(self.id)
+            self._options = self.api.get_options_for_product(self.id)
         return self._options
 
     def get_range(self):
         """Return ProductRange for Range to which this Product belongs."""
-        return ccapi.CCAPI.get_range(self.range_id)
+        return self.api.get_range(self.range_id)
 
     def set_hs_code(self, hs_code):
         """Set the product's HS Code."""
-        ccapi.CCAPI.set_hs_code(product_IDs=[self.id], HS_code=hs_code)
+        self.api.set_hs_code(product_IDs=[self.id], HS_code=hs_code)
         self.hs_code = hs_code
 
     def set_option_value(self, option, value, create=False):
@@ -116,19 +163,18 @@ class Product:
         if isinstance(option, ProductOption):
             option_id = option.id
         else:
-            option = self.options[option]
-            option_id = option.id
+            option_id = self.api.get_product_option_id(option)
+            if option_id is None:
+                raise Exception("Product Option does not exist.")
         if isinstance(value, ProductOptionValue):
             value_id = value.id
         else:
-            try:
-                value_id = option[value].id
-            except KeyError:
-                if create is True:
-                    value_id = ccapi.CCAPI.create_option_value(option_id, value)
-                else:
-                    raise Exception("Product Option Value does not exist.")
-        ccapi.CCAPI.set_product_option_value([self.id], option_id, value_id)
+            value_id = self.api.get_option_value_id(option_id, value, create=create)
+            if value_id is None:
+                raise Exception("Product Option Value does not exist.")
+        self.api.set_product_option_value(
+            product_ids=[self.id], option_id=option_id, option_value_id=value_id
+        )
 
     def set_product_scope(
         self,
@@ -166,7 +212,7 @@ class Product:
             self.large_letter_compatible = large_letter_compatible
         if external_id is not None:
             self.external_product_id = external_id
-        return ccapi.CCAPI.set_product_scope(
+        return self.api.set_product_scope(
             product_id=self.id,
             weight=self.weight,
             height=self.height_mm,
@@ -194,13 +240,11 @@ class Product:
 
     def set_base_price(self, price):
         """Set Product base price."""
-        ccapi.CCAPI.set_product_base_price(product_id=self.id, price=price)
+        self.api.set_product_base_price(product_id=self.id, price=price)
 
     def set_vat_rate(self, vat_rate):
         """Set VAT rate for product."""
-        return ccapi.CCAPI.set_product_vat_rate(
-            product_ids=[self.id], vat_rate=vat_rate
-        )
+        return self.api.set_product_vat_rate(product_ids=[self.id], vat_rate=vat_rate)
 
     def set_handling_time(self, handling_time, update_channels=True):
         """
@@ -213,7 +257,7 @@ class Product:
             update_channels: If True will update handling time on channels.
                 Default: True.
         """
-        ccapi.CCAPI.set_product_handling_time(
+        self.api.set_product_handling_time(
             product_id=self.id,
             handling_time=handling_time,
             update_channels=update_channels,
@@ -232,7 +276,7 @@ class Product:
         """
         if old_stock_level is None:
             old_stock_level = self.stock_level
-        ccapi.CCAPI.update_product_stock_level(
+        self.api.update_product_stock_level(
             product_id=self.id,
             new_stock_level=new_stock_level,
             old_stock_level=old_stock_level,
@@ -240,9 +284,9 @@ class Product:
 
     def set_name(self, name):
         """Set name of Product."""
-        ccapi.CCAPI.set_product_name(name=name, product_ids=[self.id])
+        self.api.set_product_name(name=name, product_ids=[self.id])
         sales_channels = self.get_sales_channel_ids()
-        ccapi.CCAPI.update_product_on_sales_channel(
+        self.api.update_product_on_sales_channel(
             range_id=self.range_id,
             product_ids=[self.id],
             request_type="name",
@@ -252,9 +296,7 @@ class Product:
 
     def set_description(self, description):
         """Set description for Product."""
-        ccapi.CCAPI.set_product_description(
-            product_ids=[self.id], description=description
-        )
+        self.api.set_product_description(product_ids=[self.id], description=description)
 
     def add_bay(self, bay):
         """Add product to Warehouse Bay."""
@@ -262,7 +304,7 @@ class Product:
             bay_id = bay.id
         else:
             bay_id = bay
-        ccapi.CCAPI.add_warehouse_bay_to_product(self.id, bay_id)
+        self.api.add_warehouse_bay_to_product(self.id, bay_id)
 
     def remove_bay(self, bay):
         """Remove product from Warehouse Bay."""
@@ -270,29 +312,29 @@ class Product:
             bay_id = bay.id
         else:
             bay_id = bay
-        ccapi.CCAPI.remove_warehouse_bay_from_product(self.id, bay_id)
+        self.api.remove_warehouse_bay_from_product(self.id, bay_id)
 
     def get_images(self):
         """Get images for Product."""
-        return ccapi.CCAPI.get_product_images(self.range_id, self.id)
+        return self.api.get_product_images(self.range_id, self.id)
 
     def add_image(self, image, channel_ids=[]):
         """Add image to Product."""
-        return ccapi.CCAPI.upload_image(
+        return self.api.upload_image(
             product_ids=[self.id], channel_ids=channel_ids, image_file=image
         )
 
     def set_image_order(self, image_ids=[]):
         """Set order of Product Images."""
-        return ccapi.CCAPI.set_image_order(product_id=self.id, image_ids=image_ids)
+        return self.api.set_image_order(product_id=self.id, image_ids=image_ids)
 
     def get_factory_links(self):
         """Get factory links."""
-        return ccapi.CCAPI.get_product_factory_links(self.id)
+        return self.api.get_product_factory_links(self.id)
 
     def update_factory_link(self, factory_id, dropship=False, supplier_sku="", price=0):
         """Update or create Factory link."""
-        return ccapi.CCAPI.update_product_factory_link(
+        return self.api.update_product_factory_link(
             product_id=self.id,
             factory_id=factory_id,
             dropship=dropship,
@@ -1,7 +1,6 @@
 """Containers for product export data."""
 
-
-import datetime
+from ccapi.timestamps import parse_timestamp
 
 
 class ProductExportUpdateResponse:
@@ -79,16 +78,7 @@ class BaseProductExport:
     @staticmethod
     def parse_date(date_string):
         """Return datetime.datetime for date string in the format '04/10/2016 11:31'."""
-        date, time = date_string.split(" ")
-        day, month, year = date.split("/")
-        hour, minute = time.split(":")
-        return datetime.datetime(
-            day=int(day),
-            month=int(month),
-            year=int(year),
-            hour=int(hour),
-            minute=int(minute),
-        )
+        return parse_timestamp(date_string)
 
     @property
     def failed(self):
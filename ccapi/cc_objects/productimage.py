@@ -1,9 +1,9 @@
 """ProductImage class."""
 
-from ccapi import ccapi
+from .apiobject import APIObject
 
 
-class ProductImage:
+class ProductImage(APIObject):
     """Container for a Product Image."""
 
     def __init__(self, url, image_id, image_name):
@@ -13,6 +13,7 @@ class ProductImage:
         Args:
             url: URL for Product Image.
         """
+        super().__init__()
         self.url = url
         self.filename = url.split("/")[-1]
         self.id = self.filename.split(".")[0]
@@ -22,4 +23,4 @@ class ProductImage:
 
     def delete(self):
         """Delete this Product Image."""
-        return ccapi.CCAPI.delete_image(self.id)
+        return self.api.delete_image(self.id)
@@ -1,6 +1,6 @@
 """This module contains classes for working with Product Options."""
 
-from ccapi import ccapi
+from .apiobject import APIObject
 
 
 class ProductOptions:
@@ -31,7 +31,7 @@ class ProductOptions:
         return "{} product options".format(len(self.options))
 
 
-class ProductOption:
+class ProductOption(APIObject):
     """Wrapper for Product Options."""
 
     _values = None
@@ -44,6 +44,7 @@ class ProductOption:
         Args:
             result: Cloud Commerce Product Option JSON object.
         """
+        super().__init__()
         self.json = result
         self.id = result["ID"]
         self.option_name = result["OptionName"]
@@ -110,32 +111,41 @@ class ProductOption:
                 ProductOptionValue(value) for value in values["optionValues"]
             ]
         else:
-            self._values = ccapi.CCAPI.get_option_values(self.id)
+            self._values = self.api.get_option_values(self.id)
         self._value_names = self.load_value_names()
 
     def add_value(self, value):
         """
         Create Product Option Value for this Product Option.
 
+        The value is checked and created while holding the lock of the current
+        session's ccapi.requests.OptionIndex, so concurrent callers cannot create
+        it twice.
+
         Args:
             value: New value.
 
         Returns: (str) ID of new Product Option Value.
 
         """
-        if ccapi.CCAPI.get_option_value_id(self.id, value) is not None:
-            raise Exception(
-                "Option Value {} already exists for product option {}".format(
-                    self.option_name, value
+        option_index = self.api.get_option_index(self.id)
+        with option_index.lock:
+            if option_index.get_value(self.id, value) is not None:
+                raise Exception(
+                    "Option Value {} already exists for product option {}".format(
+                        self.option_name, value
+                    )
                 )
-            )
-        ccapi.CCAPI.create_option_value(self.id, value)
-        self.reload_values()
-        return ccapi.CCAPI.get_product_option_id(value)
+            value_id = self.api.create_option_value(self.id, value)
+        self._values = None
+        self._value_names = None
+        return value_id
 
     def get_value(self, value, create=False):
         """
-        Get ID of Product Option Value by name for this Product Option.
+        Get Product Option Value by name for this Product Option.
+
+        Values are found using the current session's ccapi.requests.OptionIndex.
 
         Args:
             value: Product Option Value to find.
@@ -144,15 +154,17 @@ class ProductOption:
             create: If True the Product Option Value will be added to the
                 Product Option. Default: False.
 
-        Returns: (str) ID of Product Option Value or None.
+        Returns: ccapi.cc_objects.ProductOptionValue.
 
         """
-        if value in self.value_names:
-            return self.value_names[value]
-        if create is True:
-            self.add_value(value)
-            self.reload_values()
-            return self._value_names[value]
+        option_index = self.api.get_option_index(self.id)
+        with option_index.lock:
+            option_value = option_index.get_value(self.id, value)
+            if option_value is None and create is True:
+                self.add_value(value)
+                option_value = option_index.get_value(self.id, value)
+        if option_value is not None:
+            return option_value
         raise Exception(
             "Option value {} does not exist for product option {}".format(
                 value, self.option_name
@@ -160,7 +172,7 @@ class ProductOption:
         )
 
 
-class ProductOptionValue:
+class ProductOptionValue(APIObject):
     """Class for working with Product Option Values."""
 
     def __init__(self, result):
@@ -170,6 +182,7 @@ class ProductOptionValue:
         Args:
             result: Cloud Commerce Product Option Value JSON object.
         """
+        super().__init__()
         self.json = result
         self.id = result["ID"]
         self.value = result["OptionValue"]
@@ -186,7 +199,7 @@ class ProductOptionValue:
 
     def delete(self):
         """Delete this Product Option Value."""
-        ccapi.CCAPI.delete_product_option_value(self.id)
+        self.api.delete_product_option_value(self.id)
         del self
 
 
@@ -1,15 +1,49 @@
 """This module contains the ProductRange class."""
 
-from ccapi import ccapi
-
+from .apiobject import APIObject
 from .product import Product
 from .productoptions import ProductOption, ProductOptions
+from .rawjson import retained_json
 
 
-class ProductRange:
+class ProductRange(APIObject):
     """Class containing data and methods for working with ProductRanges."""
 
-    _options = None
+    __slots__ = (
+        "json",
+        "id",
+        "name",
+        "sku",
+        "products",
+        "child_id",
+        "brand_id",
+        "brand_company_name",
+        "brand_trading_name",
+        "neck_shape",
+        "pre_order",
+        "end_of_line",
+        "last_stock_check",
+        "thumb_nail",
+        "linked",
+        "grouped",
+        "on_sales_channel",
+        "season_id",
+        "season_name",
+        "status_id",
+        "edit_url",
+        "base_url",
+        "product_ids",
+        "shop_id",
+        "item_count",
+        "listing_errors",
+        "listings_pending",
+        "listed_count",
+        "multi_listings_count",
+        "single_listings_count",
+        "pseudo_stock_level_type",
+        "cdiscout_listings",
+        "_options",
+    )
 
     def __init__(self, result):
         """
@@ -18,7 +52,9 @@ class ProductRange:
         Args:
             result: Cloud Commerce Product Range JSON object.
         """
-        self.json = result
+        super().__init__()
+        self.json = retained_json(result)
+        self._options = None
         self.id = result["ID"]
         self.name = result["Name"]
         self.sku = result["ManufacturerSKU"]
@@ -56,7 +92,7 @@ class ProductRange:
 
     def get_sales_channels(self):
         """Get Sales Channels for this Product Range."""
-        return ccapi.CCAPI.get_sales_channels_for_range(self.id)
+        return self.api.get_sales_channels_for_range(self.id)
 
     def get_sales_channel_ids(self):
         """Get IDs of Sales Channels on which this Product Range is listed."""
@@ -77,7 +113,7 @@ class ProductRange:
             option_id = option.id
         else:
             option_id = ProductOptions[option].id
-        ccapi.CCAPI.add_option_to_product(range_id=self.id, option_id=option_id)
+        self.api.add_option_to_product(range_id=self.id, option_id=option_id)
         if drop_down is True:
             self.set_option_drop_down(option_id, True)
         self._options = None
@@ -97,7 +133,7 @@ class ProductRange:
             option_id = option.id
         else:
             option_id = self.options[option].id
-        ccapi.CCAPI.remove_option_from_product(range_id=self.id, option_id=option_id)
+        self.api.remove_option_from_product(range_id=self.id, option_id=option_id)
         self._options = None
         if update_channels:
             self.update_on_sales_channel(
@@ -116,7 +152,7 @@ class ProductRange:
             option_id = option.id
         else:
             option_id = option
-        ccapi.CCAPI.set_range_option_drop_down(self.id, option_id, value)
+        self.api.set_range_option_drop_down(self.id, option_id, value)
         if update_channels is True:
             self.update_on_sales_channel(
                 option_id=option_id, request_type="option", act="remove", value=value
@@ -125,7 +161,7 @@ class ProductRange:
     def update_on_sales_channel(self, *, option_id, request_type, act, value=""):
         """Update this range's info on selling channels."""
         channel_ids = self.get_sales_channel_ids()
-        ccapi.CCAPI.update_range_on_sales_channel(
+        self.api.update_range_on_sales_channel(
             range_id=self.id,
             request_type=request_type,
             act=act,
@@ -143,7 +179,7 @@ class ProductRange:
         applied to this Product Range.
         """
         if self._options is None:
-            self._options = ccapi.CCAPI.get_options_for_range(self.id)
+            self._options = self.api.get_options_for_range(self.id)
         return self._options
 
     def add_product(self, name, barcode, sku=None, description=None, vat_rate=20):
@@ -164,14 +200,14 @@ class ProductRange:
         Returns: (ccapi.cc_objects.Product) New Product.
 
         """
-        product_id = ccapi.CCAPI.create_product(
+        product_id = self.api.create_product(
             self.id, name, barcode, sku=sku, description=description, vat_rate=vat_rate
         )
-        return ccapi.CCAPI.get_product(product_id)
+        return self.api.get_product(product_id)
 
     def delete(self):
         """Delete this Product Range."""
-        ccapi.CCAPI.delete_range(self.id)
+        self.api.delete_range(self.id)
 
     def update_range_settings(
         self,
@@ -202,7 +238,7 @@ class ProductRange:
             channels = self.get_sales_channel_ids()
         else:
             channels = []
-        ccapi.CCAPI.update_range_settings(
+        self.api.update_range_settings(
             self.id,
             current_name=self.name,
             current_sku=self.sku,
@@ -241,9 +277,9 @@ class ProductRange:
     def set_description(self, description, update_channels=True):
         """Set description for Product Range."""
         product_ids = [p.id for p in self.products]
-        ccapi.CCAPI.set_product_description(description, product_ids)
+        self.api.set_product_description(description, product_ids)
         if update_channels is True:
-            ccapi.CCAPI.update_product_on_sales_channel(
+            self.api.update_product_on_sales_channel(
                 "desc",
                 self.id,
                 product_ids=[p.id for p in self.products],
@@ -0,0 +1,51 @@
+"""This module controls whether Cloud Commerce objects keep their source JSON."""
+
+import contextlib
+import contextvars
+
+_keep_json_default = True
+_keep_json = contextvars.ContextVar("ccapi_keep_json", default=None)
+
+
+def set_keep_json(keep):
+    """
+    Set whether Cloud Commerce objects keep the JSON they were created from.
+
+    Objects created while this is False have a json attribute of None, which
+    greatly reduces the memory used when loading many objects.
+
+    Args:
+        keep: If False objects do not keep their JSON.
+    """
+    global _keep_json_default
+    _keep_json_default = bool(keep)
+
+
+@contextlib.contextmanager
+def keep_json(keep):
+    """
+    Set whether objects created within the context keep their JSON.
+
+    This overrides the value set with set_keep_json for the context.
+
+    Args:
+        keep: If False objects do not keep their JSON.
+    """
+    token = _keep_json.set(bool(keep))
+    try:
+        yield
+    finally:
+        _keep_json.reset(token)
+
+
+def keeping_json():
+    """Return True if objects created now should keep their JSON."""
+    keep = _keep_json.get()
+    if keep is None:
+        return _keep_json_default
+    return keep
+
+
+def retained_json(data):
+    """Return data if objects created now should keep their JSON, else None."""
+    return data if keeping_json() else None
@@ -1,6 +1,7 @@
 """This module contains classes for working with Warehouses."""
 
-from ccapi import ccapi
+from .apiobject import APIObject
+from .rawjson import retained_json
 
 
 class Warehouses:
@@ -36,11 +37,26 @@ class Warehouses:
         return self.warehouse_names.items()
 
 
-class Warehouse:
+class Warehouse(APIObject):
     """Wrapper for Warehouses."""
 
-    _bays = None
-    _bay_names = None
+    __slots__ = (
+        "json",
+        "id",
+        "name",
+        "description",
+        "date_created",
+        "date_updated",
+        "warehouse_type_enum",
+        "sales_channel_inbound_links",
+        "sales_channel_outbound_links",
+        "warehouse_type",
+        "brand_details_id",
+        "status_id",
+        "address_id",
+        "_bay_names",
+        "_bays",
+    )
 
     def __init__(self, data):
         """
@@ -49,7 +65,10 @@ class Warehouse:
         Args:
             data: Cloud Commerce Warehouse JSON object.
         """
+        super().__init__()
         self.json = data
+        self._bays = None
+        self._bay_names = None
         self.id = data["ID"]
         self.name = data["Name"]
         if "ShortDescription" in data:
@@ -80,7 +99,7 @@ class Warehouse:
     def bays(self):
         """Return list of Bays in this Warehouse."""
         if self._bays is None:
-            self.reload_bays()
+            self.load_bays()
         return self._bays
 
     @property
@@ -94,13 +113,17 @@ class Warehouse:
         """Return dict organising Bays by name."""
         return {bay.name: bay for bay in self.bays}
 
-    def reload_bays(self):
-        """Get Bays for this Warehouse."""
-        self._bays = ccapi.CCAPI.get_bays_for_warehouse(self.id)
-        for bay in self._bays:
-            bay.warehouse = self
+    def load_bays(self):
+        """Get Bays for this Warehouse from the current session's Warehouse index."""
+        warehouse_index = self.api.get_warehouse_index(self.id)
+        self._bays = warehouse_index.get_bays(self.id)
         self._bay_names = self.load_bay_names()
 
+    def reload_bays(self):
+        """Download Bays for this Warehouse."""
+        self.api.get_warehouse_index().clear(self.id)
+        self.load_bays()
+
     def add_bay(
         self, bay, bay_number=0, aisle="", shelf="", warehouse_bay_type="Default"
     ):
@@ -117,7 +140,7 @@ class Warehouse:
             raise Exception(
                 "Warehouse Bay {} already exists in Warehouse {}".format(bay, self.name)
             )
-        ccapi.CCAPI.add_bay_to_warehouse(
+        bay_id = self.api.add_bay_to_warehouse(
             self.id,
             bay,
             bay_number=bay_number,
@@ -125,8 +148,8 @@ class Warehouse:
             shelf=shelf,
             warehouse_bay_type=warehouse_bay_type,
         )
-        self.reload_bays()
-        return self.bay_names[bay].id
+        self.load_bays()
+        return bay_id
 
     def get_bay(self, bay, create=False):
         """
@@ -146,16 +169,33 @@ class Warehouse:
             return self.bay_names[bay]
         if create is True:
             self.add_bay(bay)
-            self.reload_bays()
             return self.bay_names[bay]
         raise Exception(
             "Warehouse Bay {}  does not exist for Warehouse {}".format(bay, self.name)
         )
 
 
-class WarehouseBay:
+class WarehouseBay(APIObject):
     """Contains data and methods for working with Warehouse Bays."""
 
+    __slots__ = (
+        "json",
+        "id",
+        "name",
+        "warehouse_id",
+        "bay_number",
+        "aisle",
+        "shelf",
+        "available_stock",
+        "warehouse_bay_type",
+        "warehouse_bay_type_enum",
+        "status_id",
+        "statud_id_enum",
+        "too_many_products",
+        "products",
+        "warehouse",
+    )
+
     def __init__(self, data):
         """
         Create WarehouseBay object.
@@ -163,11 +203,12 @@ class WarehouseBay:
         Args:
             data: Cloud Commerce Warehouse Bay JSON object.
         """
+        super().__init__()
         self.load_json(data)
 
     def load_json(self, data):
         """Load data from dict."""
-        self.json = data
+        self.json = retained_json(data)
         self.id = data.get("ID", None)
         self.name = data.get("Name", None)
         self.warehouse_id = data.get("WarehouseID", None)
@@ -198,7 +239,7 @@ class WarehouseBay:
 
     def delete(self):
         """Delete this bay."""
-        ccapi.CCAPI.delete_bay(self.id)
+        self.api.delete_bay(self.id)
 
     @property
     def empty(self):
@@ -209,13 +250,15 @@ class WarehouseBay:
 class BayProduct:
     """Container for Products in Bays."""
 
+    __slots__ = ("json", "image_url", "id", "end_of_line", "sku", "name")
+
     def __init__(self, data):
         """Load product data."""
         self.load_json(data)
 
     def load_json(self, data):
         """Load product data from API."""
-        self.json = data
+        self.json = retained_json(data)
         self.image_url = data["ProductImage"]
         self.id = data["ID"]
         self.end_of_line = bool(data["EndOfLine"])
@@ -3,10 +3,46 @@
 import datetime
 
 from . import requests
-from .cc_objects import ProductExportUpdateResponse, VatRates
+from .bulk import BulkExecutor
+from .cc_objects import ProductExportUpdateResponse, VatRates, WarehouseBay
 from .requests import CloudCommerceAPISession
 
 
+class _SessionCall:
+    """Callable calling a CCAPI method with a session active."""
+
+    __slots__ = ("session", "method")
+
+    def __init__(self, session, method):
+        """Create a session call."""
+        self.session = session
+        self.method = method
+
+    def __call__(self, *args, **kwargs):
+        with self.session.activate():
+            return self.method(*args, **kwargs)
+
+
+class _InstanceSessionMethod:
+    """
+    Descriptor for CCAPI methods.
+
+    Accessed on the class the method is returned unchanged. Accessed on an
+    instance it is wrapped so that it is called with the instance's session.
+    """
+
+    def __init__(self, method):
+        """Wrap a staticmethod or classmethod."""
+        self.method = method
+        self.__doc__ = method.__doc__
+
+    def __get__(self, instance, owner=None):
+        method = self.method.__get__(instance, owner)
+        if instance is None:
+            return method
+        return _SessionCall(instance.session, method)
+
+
 class CCAPI:
     """
     Main class of the ccapi package.
@@ -14,16 +50,52 @@ class CCAPI:
     Provides methods for interacting with the Cloud Commerce Pro API.
     """
 
-    def __init__(self, username, password):
+    PREFETCH_PAGES = 2
+
+    def __init__(
+        self,
+        username=None,
+        password=None,
+        *,
+        domain=None,
+        session=None,
+        **session_options,
+    ):
         """
         Create Cloud Commerce Pro API session.
 
+        Each CCAPI instance owns a ccapi.requests.CloudCommerceAPISession which is
+        used for every method called on the instance, and by the objects those
+        methods return. Methods called on the class use the current session.
+
         Args:
             username: Login username.
             password: Login password.
 
+        Kwargs:
+            domain: Cloud Commerce domain.
+            session: A ccapi.requests.CloudCommerceAPISession to use. If None a new
+                session is created. Default: None.
+            **session_options: Connection pool options passed to
+                ccapi.requests.CloudCommerceAPISession.
+
+        """
+        if session is None:
+            session = CloudCommerceAPISession(**session_options)
+        self.session = session
+        self.create_session(domain=domain, username=username, password=password)
+
+    @classmethod
+    def _for_session(cls, session):
+        """
+        Return a CCAPI instance using session without logging in.
+
+        Args:
+            session: The ccapi.requests.CloudCommerceAPISession to use.
         """
-        self.create_session(username, password)
+        api = cls.__new__(cls)
+        api.session = session
+        return api
 
     @staticmethod
     def create_session(domain=None, username=None, password=None):
@@ -35,19 +107,43 @@ class CCAPI:
             password: Login password.
 
         """
-        return CloudCommerceAPISession.get_session(
+        return CloudCommerceAPISession.current().get_session(
             domain=domain, username=username, password=password
         )
 
     @staticmethod
     def is_logged_in():
         """Check current session is valid."""
-        return CloudCommerceAPISession.check_login()
+        return CloudCommerceAPISession.current().check_login()
 
     @staticmethod
     def check_login():
         """Get new session if current session has expired."""
-        CloudCommerceAPISession.check_login()
+        CloudCommerceAPISession.current().check_login()
+
+    @staticmethod
+    def map(func, arguments, *, max_workers=BulkExecutor.MAX_WORKERS, ordered=True):
+        """
+        Call a method or request for many sets of arguments using a thread pool.
+
+        Args:
+            func: The callable to call, for example a CCAPI method such as
+                CCAPI.get_product or a request class such as
+                ccapi.requests.products.GetPendingStock.
+            arguments: An iterable of argument sets. Each may be a dict of keyword
+                arguments, a tuple or list of positional arguments or a single
+                positional argument.
+
+        Kwargs:
+            max_workers: The maximum number of calls to make at once. Default: 10.
+            ordered: If True results are yielded in the order of arguments,
+                otherwise as they are completed. Default: True.
+
+        Returns: generator of ccapi.bulk.BulkResult.
+
+        """
+        executor = BulkExecutor(max_workers=max_workers)
+        return executor.map(func, arguments, ordered=ordered)
 
     @staticmethod
     def search_products(search_text):
@@ -248,7 +344,33 @@ class CCAPI:
         Returns: (str) ID of new Product Option Value.
 
         """
-        return requests.productoption.AddOptionValue(option_id, value)
+        option_index = CloudCommerceAPISession.current().option_index
+        with option_index.lock:
+            value_id = requests.productoption.AddOptionValue(option_id, value)
+            option_index.add_value(option_id, value_id, value)
+        return value_id
+
+    @classmethod
+    def get_option_index(cls, option_id=None):
+        """
+        Return the Product Option index of the current session.
+
+        Product Options are added to the index if they have not been loaded.
+
+        Kwargs:
+            option_id: If not None the values of this Product Option are added to
+                the index if they have not been loaded. Default: None.
+
+        Returns: ccapi.requests.OptionIndex.
+
+        """
+        option_index = CloudCommerceAPISession.current().option_index
+        with option_index.lock:
+            if not option_index.options_loaded:
+                option_index.set_options(cls.get_product_options())
+            if option_id is not None and not option_index.values_loaded(option_id):
+                option_index.set_values(option_id, cls.get_option_values(option_id))
+        return option_index
 
     @classmethod
     def get_product_option_id(cls, option_name):
@@ -261,11 +383,10 @@ class CCAPI:
         Returns: (str) Product Option ID or None.
 
         """
-        options = cls.get_product_options()
-        for option in options:
-            if option.option_name.lower() == option_name.lower().strip():
-                return option.id
-        return None
+        option = cls.get_option_index().get_option(option_name)
+        if option is None:
+            return None
+        return option.id
 
     @classmethod
     def get_option_value_id(cls, option_id, value, create=False):
@@ -283,12 +404,13 @@ class CCAPI:
         Returns: (str) ID of Product Option Value or None.
 
         """
-        values = cls.get_option_values(option_id)
-        for option_value in values:
-            if option_value.value.strip().lower() == value.strip().lower():
+        option_index = cls.get_option_index(option_id)
+        with option_index.lock:
+            option_value = option_index.get_value(option_id, value)
+            if option_value is not None:
                 return option_value.id
-        if create is True:
-            return cls.create_option_value(option_id, value)
+            if create is True:
+                return cls.create_option_value(option_id, value)
         return None
 
     @staticmethod
@@ -475,27 +597,13 @@ class CCAPI:
     @staticmethod
     def get_bays_for_warehouse(warehouse_id):
         """Return list of Warehouse Bays for Warehouse."""
-        skip_records = 0
-        bays = []
-        ids = []
-        take_limit = 100
-        skip_records = 0
-        request = 1
-        while True:
-            data = requests.warehousebay.FindWarehouseBay(
-                warehouse_id=warehouse_id,
-                prog_type="normal",
-                skip_records=skip_records,
-                take_limit=take_limit,
-            )
-            if len(data) == 0:
-                return bays
-            for bay in data:
-                if bay.id not in ids:
-                    ids.append(bay.id)
-                    bays.append(bay)
-            request += 1
-            skip_records += take_limit
+        bays = requests.Paginator(
+            requests.warehousebay.FindWarehouseBay,
+            warehouse_id=warehouse_id,
+            prog_type="normal",
+            key=lambda bay: bay.id,
+        )
+        return list(bays)
 
     @staticmethod
     def get_bays_for_product(product_id):
@@ -528,24 +636,62 @@ class CCAPI:
         shelf="",
         warehouse_bay_type="Default",
     ):
-        """Add bay to warehouse."""
-        requests.warehousebay.SaveWarehouseBay(
-            warehouse_id,
-            bay_name,
-            bay_number=bay_number,
-            aisle=aisle,
-            shelf=shelf,
-            warehouse_bay_type=warehouse_bay_type,
-        )
-        bays = cls.get_bays_for_warehouse(warehouse_id)
-        for bay in bays:
-            if bay.name == bay_name:
+        """
+        Add bay to warehouse.
+
+        If the response contains the ID of the new bay it is added to the current
+        session's Warehouse index, otherwise the bays of the warehouse are loaded
+        again to find it. If the indexed bays of the warehouse were loaded from a
+        stored index they are loaded again first, and if a bay named bay_name was
+        created since its ID is returned without creating another.
+
+        Returns: (str) ID of the new Warehouse Bay.
+
+        """
+        warehouse_index = CloudCommerceAPISession.current().warehouse_index
+        with warehouse_index.lock:
+            if warehouse_index.bays_stored(warehouse_id):
+                warehouse_index.set_bays(
+                    warehouse_id, cls.get_bays_for_warehouse(warehouse_id)
+                )
+                bay = warehouse_index.get_bay(warehouse_id, bay_name)
+                if bay is not None:
+                    return bay.id
+            response = requests.warehousebay.SaveWarehouseBay(
+                warehouse_id,
+                bay_name,
+                bay_number=bay_number,
+                aisle=aisle,
+                shelf=shelf,
+                warehouse_bay_type=warehouse_bay_type,
+            )
+            bay_id = str(response).strip()
+            if bay_id.isdigit():
+                bay = WarehouseBay(
+                    {
+                        "ID": int(bay_id),
+                        "Name": bay_name,
+                        "WarehouseID": warehouse_id,
+                        "BayNumber": bay_number,
+                        "Aisle": aisle,
+                        "Shelf": shelf,
+                        "WarehouseBayType": warehouse_bay_type,
+                    }
+                )
+                warehouse_index.add_bay(warehouse_id, bay)
                 return bay.id
+            warehouse_index.set_bays(
+                warehouse_id, cls.get_bays_for_warehouse(warehouse_id)
+            )
+            bay = warehouse_index.get_bay(warehouse_id, bay_name)
+        if bay is not None:
+            return bay.id
 
     @staticmethod
     def delete_product_option_value(option_value_id):
         """Delete Product Option Value."""
         requests.productoption.DeleteOptionValue(option_value_id)
+        CloudCommerceAPISession.current().option_index.remove_value(option_value_id)
 
     @staticmethod
     def set_range_option_drop_down(*, range_id, option_id, drop_down):
@@ -573,10 +719,23 @@ class CCAPI:
         Returns: list containing ccapi.Product.
 
         """
-        products = []
-        for product_range in cls.get_ranges(*args, **kwargs):
-            products += product_range.products
-        return products
+        return list(cls.iter_products(*args, **kwargs))
+
+    @classmethod
+    def iter_products(cls, *args, **kwargs):
+        """
+        Search for products matching criteria, yielding products as they arrive.
+
+        Takes the same arguments as CCAPI.iter_ranges.
+
+        Returns: generator of ccapi.Product.
+
+        """
+        return (
+            product
+            for product_range in cls.iter_ranges(*args, **kwargs)
+            for product in product_range.products
+        )
 
     @classmethod
     def get_ranges(cls, *args, **kwargs):
@@ -590,36 +749,106 @@ class CCAPI:
         Returns: list containing ccapi.Range.
 
         """
-        kwargs["skip_records"] = 0
-        range_ids = []
-        while True:
-            response = requests.productmanager.GetProducts(*args, **kwargs)
-            for product in response:
-                range_id = product["RangeId"]
-                if range_id not in range_ids:
-                    range_ids.append(range_id)
-            if len(response) > 0:
-                kwargs["skip_records"] += len(response)
-                continue
-            return [cls.get_range(range_id) for range_id in range_ids]
+        return list(cls.iter_ranges(*args, **kwargs))
+
+    @classmethod
+    def iter_ranges(
+        cls, *args, max_workers=BulkExecutor.MAX_WORKERS, ordered=True, **kwargs
+    ):
+        """
+        Search for products matching criteria, yielding ranges as they arrive.
+
+        Pages of search results are requested as they are needed and each matching
+        range is requested once, with up to max_workers ranges requested at once.
+        If a range cannot be requested the exception is raised.
+
+        Kwargs:
+            search_text: Text to find in title or SKU.
+            option_matches_id: Option Value ID to match.
+            max_workers: The maximum number of ranges to request at once.
+                Default: 10.
+            ordered: If True ranges are yielded in the order they are found by the
+                search, otherwise as they are received. Default: True.
+
+        Returns: generator of ccapi.cc_objects.ProductRange.
+
+        """
+        session = CloudCommerceAPISession.current()
+        executor = BulkExecutor(max_workers=max_workers, session=session)
+        range_ids = cls._iter_range_ids(session, args, kwargs)
+        results = executor.map(cls.get_range, range_ids, ordered=ordered)
+        return (cls._bulk_result(result) for result in results)
+
+    @staticmethod
+    def _iter_range_ids(session, args, kwargs):
+        products = requests.Paginator(
+            requests.productmanager.GetProducts,
+            *args,
+            session=session,
+            short_pages=True,
+            **kwargs,
+        )
+        range_ids = set()
+        for product in products:
+            range_id = product["RangeId"]
+            if range_id not in range_ids:
+                range_ids.add(range_id)
+                yield range_id
+
+    @staticmethod
+    def _bulk_result(result):
+        if not result.ok:
+            raise result.exception
+        return result.result
 
     @staticmethod
     def delete_bay(bay_id):
         """Delete Warehouse Bay."""
-        return requests.warehousebay.FindWarehouseBay(
+        response = requests.warehousebay.FindWarehouseBay(
             warehouse_bay_id=bay_id, operation="removebay"
         )
+        CloudCommerceAPISession.current().warehouse_index.remove_bay(bay_id)
+        return response
+
+    @classmethod
+    def get_warehouse_index(cls, warehouse_id=None):
+        """
+        Return the Warehouse index of the current session.
+
+        Warehouses are added to the index if they have not been loaded.
+
+        Kwargs:
+            warehouse_id: If not None the bays of this Warehouse are added to the
+                index if they have not been loaded. Default: None.
+
+        Returns: ccapi.requests.WarehouseIndex.
+
+        """
+        warehouse_index = CloudCommerceAPISession.current().warehouse_index
+        with warehouse_index.lock:
+            if not warehouse_index.warehouses_loaded:
+                warehouse_index.set_warehouses(cls.get_warehouses())
+            if warehouse_id is not None and not warehouse_index.bays_loaded(
+                warehouse_id
+            ):
+                warehouse_index.set_bays(
+                    warehouse_id, cls.get_bays_for_warehouse(warehouse_id)
+                )
+        return warehouse_index
 
     @classmethod
     def get_bay_id(cls, bay_name, warehouse_name, create=False):
         """Get ID for Warehouse Bay."""
-        warehouses = cls.get_warehouses()
-        warehouse = warehouses[warehouse_name]
-        if bay_name in warehouse.bay_names:
-            return warehouse[bay_name].id
-        if create is True:
-            bay_id = warehouse.add_bay(bay_name)
-            return bay_id
+        warehouse = cls.get_warehouse_index().get_warehouse(warehouse_name)
+        if warehouse is None:
+            raise KeyError(warehouse_name)
+        warehouse_index = cls.get_warehouse_index(warehouse.id)
+        with warehouse_index.lock:
+            bay = warehouse_index.get_bay(warehouse.id, bay_name)
+            if bay is not None:
+                return bay.id
+            if create is True:
+                return cls.add_bay_to_warehouse(warehouse.id, bay_name)
         return None
 
     @staticmethod
@@ -642,22 +871,41 @@ class CCAPI:
         """Get addresses for order."""
         return requests.orderdetails.GetOrderAddresses(order_id, customer_id)
 
-    @staticmethod
-    def get_orders_for_dispatch(*args, **kwargs):
+    @classmethod
+    def get_orders_for_dispatch(cls, *args, **kwargs):
         """Get orders for dispatch."""
-        kwargs["skip_records"] = 0
-        kwargs["take_limit"] = 200
-        orders = []
-        while True:
-            new_orders = requests.orderhandlers.GetOrdersForDispatch(*args, **kwargs)
-            new_orders = [
-                o for o in new_orders if o.order_id not in (o.order_id for o in orders)
-            ]
-            orders += new_orders
-            if len(new_orders) > 0:
-                kwargs["skip_records"] += kwargs["take_limit"]
-            else:
-                return orders
+        return list(cls.iter_orders_for_dispatch(*args, **kwargs))
+
+    @classmethod
+    def iter_orders_for_dispatch(cls, *args, prefetch=PREFETCH_PAGES, **kwargs):
+        """
+        Get orders for dispatch, yielding each page of orders as it is received.
+
+        While the orders of one page are processed the following pages are
+        requested concurrently using a ccapi.requests.Paginator. Orders are
+        yielded once, in page order, until a page is not full or contains no new
+        orders. Takes the same arguments as
+        ccapi.requests.orderhandlers.GetOrdersForDispatch.
+
+        Kwargs:
+            prefetch: The number of pages to request ahead of the page being
+                processed. Default: 2.
+            lazy: If True LazyDispatchOrder views are yielded, which decode their
+                attributes when first accessed and are faster to create if few
+                attributes are used. Default: False.
+
+        Returns: generator of
+            ccapi.requests.orderhandlers.getordersfordispatch.DispatchOrder.
+
+        """
+        orders = requests.Paginator(
+            requests.orderhandlers.GetOrdersForDispatch,
+            *args,
+            prefetch=prefetch,
+            key=lambda order: order.order_id,
+            **kwargs,
+        )
+        return iter(orders)
 
     @staticmethod
     def update_range_settings(
@@ -1321,3 +1569,8 @@ class CCAPI:
     def get_stock_control_check(range_id):
         """Return a stock check report for a product range."""
         return requests.reports.StockControlCheck(range_id=range_id)
+
+
+for _name, _method in list(vars(CCAPI).items()):
+    if not _name.startswith("_") and isinstance(_method, (staticmethod, classmethod)):
+        setattr(CCAPI, _name, _InstanceSessionMethod(_method))
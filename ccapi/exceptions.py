@@ -31,6 +31,22 @@ class CloudCommerceNoResponseError(BaseCloudCommerceAPIError):
         super().__init__("Cloud Commerce Pro did not respond")
 
 
+class CloudCommerceDeadlineExceededError(BaseCloudCommerceAPIError):
+    """Raised when a request cannot be completed before its deadline."""
+
+    def __init__(self, uri):
+        """Raise exception."""
+        super().__init__(f"Deadline exceeded for request to {uri}.")
+
+
+class RecordedResponseNotFoundError(BaseCloudCommerceAPIError):
+    """Raised when a replayed request was not recorded."""
+
+    def __init__(self, method, url):
+        """Raise exception."""
+        super().__init__(f"No recorded response for {method} {url}.")
+
+
 class ProductNotFoundError(BaseCloudCommerceAPIError):
     """Raised when retrieving product information fails."""
 
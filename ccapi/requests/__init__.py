@@ -2,9 +2,13 @@
 
 from .accounts import CreatePayment
 from .apirequest import APIRequest
+from .cache import ResponseCache, fresh_reads
+from .cassette import Cassette, RecordingAdapter, ReplayAdapter
 from .ccapisession import CloudCommerceAPISession
+from .coalesce import RequestCoalescer
 from .configuration import ShippingRules
 from .customers import GetLogs
+from .decoder import JSONDecoder, OrjsonDecoder
 from .exports import GetProductExportUpdate, RequestProductExport, ViewFile
 from .factory import Factory, FindFactories, UpdProductFactoryLink
 from .handlers import (
@@ -17,8 +21,11 @@ from .handlers import (
     GetProductsForRange,
     PreEmployee,
 )
+from .metrics import Metrics
+from .optionindex import OptionIndex
 from .orderdetails import GetOrderAddresses
 from .orderhandlers import GetDispatchMethodsForOrder, GetOrdersForDispatch
+from .paginator import Paginator
 from .printqueue import FindPrintQueue
 from .productbarcode import ProductBarcodeInUse
 from .productmanager import GetProducts
@@ -52,6 +59,7 @@ from .products import (
     UpdateProductVatRate,
     UploadImage,
 )
+from .profiling import RequestProfiler, request_hooks
 from .program_type_requests import (
     Customer,
     GetPaymentTerms,
@@ -68,14 +76,37 @@ from .range import (
     UpdateRangeOnSalesChannel,
     UpdateRangeSettings,
 )
+from .ratelimit import FileTokenBucket, RateLimiter, TokenBucket
 from .reports import StockControlCheck
+from .retry import RetryPolicy
 from .sales_channels import GetProductChannelLinks
+from .sessioncache import SessionCache
 from .warehouse import FindWarehouse
 from .warehousebay import FindWarehouseBay, SaveWarehouseBay
+from .warehouseindex import WarehouseIndex
 
 __all__ = [
     "CloudCommerceAPISession",
     "APIRequest",
+    "RetryPolicy",
+    "RateLimiter",
+    "TokenBucket",
+    "FileTokenBucket",
+    "SessionCache",
+    "Cassette",
+    "RecordingAdapter",
+    "ReplayAdapter",
+    "Metrics",
+    "JSONDecoder",
+    "OrjsonDecoder",
+    "RequestCoalescer",
+    "ResponseCache",
+    "OptionIndex",
+    "WarehouseIndex",
+    "Paginator",
+    "fresh_reads",
+    "RequestProfiler",
+    "request_hooks",
     "CreatePayment",
     "ShippingRules",
     "GetLogs",
@@ -29,7 +29,7 @@ class CreatePayment(APIRequest):
     CURRENCY_CODE = "CurrencyCode"
     EXCHANGE_RATE = "exchangeRate"
 
-    def __new__(
+    def __init__(
         self,
         *,
         customer_id,
@@ -89,7 +89,7 @@ class CreatePayment(APIRequest):
         self.currency_code = currency_code
         self.exchange_rate = exchange_rate
         self.brand_id = brand_id
-        return super().__new__(self)
+        super().__init__()
 
     def get_headers(self):
         """Return headers to be sent with the request."""
@@ -119,4 +119,4 @@ class CreatePayment(APIRequest):
         """Handle request response."""
         print(response)
         print(response.text)
-        self.raise_for_non_200(self, response, "Failed to create payment.")
+        self.raise_for_non_200(response, "Failed to create payment.")
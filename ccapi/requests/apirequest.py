@@ -11,25 +11,106 @@ from requests.exceptions import HTTPError
 from ccapi import exceptions
 from ccapi.exceptions import CloudCommerceResponseError
 
+from . import profiling
 from .ccapisession import CloudCommerceAPISession
 
 error_logger = logging.getLogger("errors")
 
 
 class APIRequest:
-    """Base class for Cloud Commerce Pro API requests."""
+    """
+    Base class for Cloud Commerce Pro API requests.
+
+    Calling a request class creates a new instance holding the arguments for that
+    call, sends it and returns the processed response. As all request state is held
+    by the instance, requests can be made concurrently from multiple threads.
+
+    Subclasses store their arguments in __init__ and implement get_data, get_params,
+    get_headers, get_files and process_response as required. Response JSON should
+    be decoded with decode_json so the session's decoder is used.
+
+    Requests which only read data set idempotent to True so they are retried after
+    transient failures. Requests which are expected to take longer than usual to
+    respond set read_timeout to override the session's default. Identical
+    idempotent requests in flight at the same time share one response unless
+    coalescable is False, as it is for reads returning a different result for
+    every call such as generated SKUs.
+
+    Idempotent requests for slowly changing reference data set cache_ttl to the
+    number of seconds their responses may be cached for by a
+    ccapi.requests.ResponseCache. Requests which change data set invalidates to
+    declare the cached responses they make stale. It maps the names of cached
+    request classes to a dict of their parameter or data fields to the names of the
+    attributes holding the values to match, or to None to remove every response to
+    the class. Requests which only change data for some operations make
+    invalidates a property, as they do idempotent.
+
+    Requests returning one page of a list of results set skip_argument and
+    take_argument to the names of the arguments selecting the page, so they can
+    be iterated over with a ccapi.requests.Paginator.
+    """
 
     uri = None
-
-    def __new__(self):
-        """Create new API request."""
-        self.headers = self.get_headers(self)
-        self.data = self.get_data(self)
-        self.params = self.get_params(self)
-        self.files = self.get_files(self)
+    idempotent = False
+    connect_timeout = None
+    read_timeout = None
+    cache_ttl = None
+    invalidates = {}
+    skip_argument = None
+    take_argument = None
+
+    @property
+    def coalescable(self):
+        """Return True if identical requests can share a response."""
+        return self.idempotent
+
+    def __new__(cls, *args, **kwargs):
+        """Create and send a new API request, returning the processed response."""
+        request = cls.prepare(*args, **kwargs)
+        return request.send()
+
+    @classmethod
+    def prepare(cls, *args, **kwargs):
+        """Return a new request instance without sending it."""
+        request = super().__new__(cls)
+        request.__init__(*args, **kwargs)
+        return request
+
+    def send(self, session=None, retry=None, deadline=None, fresh=False):
+        """
+        Send the request and return the processed response.
+
+        Kwargs:
+            session: The ccapi.requests.CloudCommerceAPISession used to make the
+                request. If None the current session is used. Default: None.
+            retry: If True the request may be retried after a transient failure,
+                if False it will not be. If None the request is retried only if it
+                is idempotent. Default: None.
+            deadline: The maximum time in seconds allowed for the request,
+                including any retries. If None only the deadline set with
+                CloudCommerceAPISession.deadline applies. Default: None.
+            fresh: If True a cached response is not used. Default: False.
+
+        The time taken by each phase of the request is reported to the session's
+        request hooks and any added with ccapi.requests.profiling.request_hooks.
+        """
+        if session is None:
+            session = CloudCommerceAPISession.current()
+        self.session = session
+        self.timer = profiling.RequestTimer(self, session.get_request_hooks())
+        with self.timer.phase(profiling.BUILD):
+            self.headers = self.get_headers()
+            self.data = self.get_data()
+            self.params = self.get_params()
+            self.files = self.get_files()
         try:
-            response = CloudCommerceAPISession.api_request(self)
-            return self.process_response(self, response)
+            with self.timer.phase(profiling.NETWORK):
+                response = session.api_request(
+                    self, retry=retry, deadline=deadline, fresh=fresh
+                )
+            self.response = response
+            with self.timer.phase(profiling.PROCESS):
+                return self.process_response(response)
         except http.client.RemoteDisconnected as e:
             error_logger.critical(e)
             raise exceptions.CloudCommerceNoResponseError from e
@@ -53,6 +134,13 @@ class APIRequest:
         """Handle request response."""
         raise NotImplementedError("No method to process response.")
 
+    def decode_json(self, response):
+        """Return the JSON body of response decoded with the session's decoder."""
+        session = getattr(self, "session", None) or CloudCommerceAPISession.current()
+        timer = getattr(self, "timer", None) or profiling.RequestTimer(self, ())
+        with timer.phase(profiling.DECODE):
+            return session.json_decoder.decode_response(response)
+
     def raise_for_non_200(self, response, message):
         """Raise exception if response status code is not 200."""
         try:
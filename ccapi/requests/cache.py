@@ -0,0 +1,247 @@
+"""This module contains the ResponseCache class."""
+
+import collections
+import contextlib
+import contextvars
+import json
+import threading
+import time
+
+_fresh_reads = contextvars.ContextVar("ccapi_fresh_reads", default=False)
+
+
+@contextlib.contextmanager
+def fresh_reads():
+    """
+    Bypass response caches for requests made within the context.
+
+    Responses received in the context are still stored in the cache.
+    """
+    token = _fresh_reads.set(True)
+    try:
+        yield
+    finally:
+        _fresh_reads.reset(token)
+
+
+def fresh_reads_requested():
+    """Return True if called within a fresh_reads context."""
+    return _fresh_reads.get()
+
+
+class _CacheEntry:
+    def __init__(self, request, response, expires):
+        self.request_name = type(request).__name__
+        self.params = request.params if isinstance(request.params, dict) else {}
+        self.data = request.data if isinstance(request.data, dict) else {}
+        self.response = response
+        self.expires = expires
+
+
+class ResponseCache:
+    """
+    Size bounded cache of responses to requests for slowly changing data.
+
+    Only coalescable request classes with a cache_ttl are cached, keyed by request
+    class, parameters, headers and data. Entries expire after the TTL of their
+    request class and the least recently used entries are removed once max_size
+    is reached.
+    Responses are cached rather than processed results, so each caller receives
+    its own objects.
+
+    Each request class has a generation which is advanced whenever its responses
+    are invalidated. Callers record the generation when a request is sent and
+    pass it to set, so a response to a request sent before an invalidation is not
+    cached after it.
+
+    Kwargs:
+        max_size: The maximum number of responses stored. Default: 1024.
+        ttls: A dict of request classes or request class names to the time in
+            seconds their responses are cached for, overriding the cache_ttl of
+            the request class. A TTL of 0 or None disables caching for the class.
+            Default: None.
+    """
+
+    MAX_SIZE = 1024
+
+    def __init__(self, max_size=MAX_SIZE, ttls=None):
+        """Create a response cache."""
+        self.max_size = max_size
+        self.ttls = {}
+        for request_class, ttl in (ttls or {}).items():
+            self.set_ttl(request_class, ttl)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._generations = collections.Counter()
+        self._clears = 0
+
+    @staticmethod
+    def _name(request_class):
+        if isinstance(request_class, str):
+            return request_class
+        return request_class.__name__
+
+    def set_ttl(self, request_class, ttl):
+        """Set the time in seconds responses to request_class are cached for."""
+        self.ttls[self._name(request_class)] = ttl
+
+    def get_ttl(self, request):
+        """Return the time in seconds the response to request is cached for."""
+        name = type(request).__name__
+        if name in self.ttls:
+            return self.ttls[name]
+        return getattr(request, "cache_ttl", None)
+
+    def is_cacheable(self, request):
+        """Return True if the response to request can be cached."""
+        if not getattr(request, "coalescable", False) or request.files:
+            return False
+        return bool(self.get_ttl(request))
+
+    @staticmethod
+    def get_key(request):
+        """Return the cache key for request."""
+        return (
+            type(request).__name__,
+            json.dumps(request.params, sort_keys=True, default=str),
+            json.dumps(request.headers, sort_keys=True, default=str),
+            json.dumps(request.data, sort_keys=True, default=str),
+        )
+
+    def get(self, request):
+        """Return the cached response to request or None."""
+        if not self.is_cacheable(request):
+            return None
+        key = self.get_key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.response
+
+    def generation(self, request):
+        """Return the current generation of cached responses to request's class."""
+        with self._lock:
+            return (self._clears, self._generations[type(request).__name__])
+
+    def set(self, request, response, generation=None):
+        """
+        Store the response to request if it can be cached.
+
+        Args:
+            request: The request the response was received for.
+            response: The requests.Response to store.
+
+        Kwargs:
+            generation: The value returned by generation when request was sent.
+                If responses to the request class have been invalidated since the
+                response is not stored. If None the response is always stored.
+                Default: None.
+        """
+        if not self.is_cacheable(request) or not response.ok:
+            return
+        key = self.get_key(request)
+        entry = _CacheEntry(request, response, time.monotonic() + self.get_ttl(request))
+        with self._lock:
+            if generation is not None and generation != (
+                self._clears,
+                self._generations[entry.request_name],
+            ):
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, request_class, match=None):
+        """
+        Remove cached responses to request_class.
+
+        Args:
+            request_class: The request class or request class name.
+
+        Kwargs:
+            match: A dict of values which must all be present in the parameters
+                or data of a request for its response to be removed. A list of
+                values matches any of them. If None all responses to
+                request_class are removed. Default: None.
+
+        Returns: The number of responses removed.
+        """
+        name = self._name(request_class)
+        with self._lock:
+            self._generations[name] += 1
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if entry.request_name == name and self._matches(entry, match)
+            ]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def invalidate_for(self, request):
+        """
+        Remove cached responses made stale by request.
+
+        The responses removed are declared by the invalidates attribute of the
+        request class.
+
+        Returns: The number of responses removed.
+        """
+        removed = 0
+        for request_name, fields in getattr(request, "invalidates", {}).items():
+            match = None
+            if fields is not None:
+                match = {
+                    field: getattr(request, attribute)
+                    for field, attribute in fields.items()
+                }
+            removed += self.invalidate(request_name, match)
+        return removed
+
+    def invalidate_request(self, request):
+        """Remove the cached response to request."""
+        with self._lock:
+            self._generations[type(request).__name__] += 1
+            self._entries.pop(self.get_key(request), None)
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self._clears += 1
+            self._entries.clear()
+
+    def stats(self):
+        """Return a dict of the number of hits, misses and cached responses."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def _matches(entry, match):
+        if not match:
+            return True
+        for field, value in match.items():
+            sent = str(entry.params.get(field, entry.data.get(field)))
+            if isinstance(value, (list, tuple, set)):
+                if sent not in {str(item) for item in value}:
+                    return False
+            elif sent != str(value):
+                return False
+        return True
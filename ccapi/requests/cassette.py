@@ -0,0 +1,275 @@
+"""This module contains classes for recording and replaying Cloud Commerce requests.
+
+A Cassette holds recorded request and response pairs. A RecordingAdapter can be
+used as the transport for a CloudCommerceAPISession to record the requests it
+makes and a ReplayAdapter replays them without a network connection.
+"""
+
+import base64
+import collections
+import gzip
+import json
+import re
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode
+
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from ccapi.exceptions import RecordedResponseNotFoundError
+
+
+class Cassette:
+    """
+    Recorded Cloud Commerce requests and responses.
+
+    Cassettes are stored as JSON, compressed with gzip if path ends with .gz.
+    Login credentials are removed from requests, and session cookies from
+    responses, before they are recorded. Requests are matched by method, URL,
+    body and the headers set by the request, other than those in
+    UNMATCHED_HEADERS. Fields in IGNORED_FIELDS, such as dates which default to
+    the current date, are not matched.
+
+    Args:
+        path: The path of the cassette file.
+    """
+
+    REDACTED = "REDACTED"
+    REDACTED_FIELDS = ("usernameInput", "passwordInput", "Username", "Password")
+    REDACTED_HEADERS = ("set-cookie",)
+    IGNORED = "IGNORED"
+    IGNORED_FIELDS = ("Date", "PaymentDate", "transactionDate")
+    UNMATCHED_HEADERS = (
+        "accept",
+        "accept-encoding",
+        "connection",
+        "content-length",
+        "content-type",
+        "cookie",
+        "user-agent",
+    )
+    BOUNDARY = "ccapi-cassette-boundary"
+
+    def __init__(self, path):
+        """Create a cassette, loading any existing recording from path."""
+        self.path = str(path)
+        self.interactions = []
+        self._lock = threading.Lock()
+        try:
+            self.load()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.save()
+
+    def _open(self, mode):
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, mode + "t", encoding="utf8")
+        return open(self.path, mode, encoding="utf8")
+
+    def load(self):
+        """Load interactions from the cassette file."""
+        with self._open("r") as cassette_file:
+            self.interactions = json.load(cassette_file)["interactions"]
+
+    def save(self):
+        """Write the recorded interactions to the cassette file."""
+        with self._lock:
+            interactions = list(self.interactions)
+        with self._open("w") as cassette_file:
+            json.dump(
+                {"interactions": interactions}, cassette_file, separators=(",", ":")
+            )
+
+    def record(self, request, response, elapsed):
+        """Add a request and its response to the cassette."""
+        interaction = {
+            "request": self.serialise_request(request),
+            "response": {
+                "status_code": response.status_code,
+                "reason": response.reason,
+                "url": response.url,
+                "headers": self.serialise_headers(response.headers),
+                "content": base64.b64encode(response.content).decode("ascii"),
+                "elapsed": elapsed,
+            },
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def serialise_headers(self, headers):
+        """Return response headers as a dict without session cookies."""
+        return {
+            key: self.REDACTED if key.lower() in self.REDACTED_HEADERS else value
+            for key, value in headers.items()
+        }
+
+    def serialise_request(self, request):
+        """Return a dict identifying a requests.PreparedRequest."""
+        return {
+            "method": request.method,
+            "url": request.url,
+            "headers": {
+                key: value
+                for key, value in request.headers.items()
+                if key.lower() not in self.UNMATCHED_HEADERS
+            },
+            "body": self.normalise_body(request),
+        }
+
+    def normalise_body(self, request):
+        """Return the body of request without credentials, dates or boundaries."""
+        body = request.body or ""
+        if isinstance(body, bytes):
+            body = body.decode("utf8", errors="replace")
+        content_type = request.headers.get("Content-Type", "")
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            fields = [
+                (key, self.normalise_field(key, value))
+                for key, value in parse_qsl(body, keep_blank_values=True)
+            ]
+            return urlencode(fields)
+        boundary = re.search(r"boundary=([^;]+)", content_type)
+        if boundary is not None:
+            body = body.replace(boundary.group(1), self.BOUNDARY)
+        return body
+
+    def normalise_field(self, key, value):
+        """Return the recorded value of a form field."""
+        if key in self.REDACTED_FIELDS:
+            return self.REDACTED
+        if key in self.IGNORED_FIELDS:
+            return self.IGNORED
+        return value
+
+    @staticmethod
+    def get_key(serialised_request):
+        """Return the key used to match a serialised request."""
+        headers = {
+            key.lower(): value
+            for key, value in serialised_request.get("headers", {}).items()
+        }
+        return (
+            serialised_request["method"],
+            serialised_request["url"],
+            json.dumps(headers, sort_keys=True),
+            serialised_request["body"],
+        )
+
+
+class RecordingAdapter(BaseAdapter):
+    """
+    Transport adapter which records requests made through another adapter.
+
+    Args:
+        cassette: The ccapi.requests.Cassette to record to.
+
+    Kwargs:
+        adapter: The adapter used to send requests. If None a
+            requests.adapters.HTTPAdapter is used. Default: None.
+    """
+
+    def __init__(self, cassette, adapter=None):
+        """Create a recording adapter."""
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter or HTTPAdapter()
+
+    def send(self, request, **kwargs):
+        """Send request and record the response."""
+        start = time.perf_counter()
+        response = self.adapter.send(request, **kwargs)
+        self.cassette.record(request, response, time.perf_counter() - start)
+        return response
+
+    def close(self):
+        """Close the wrapped adapter."""
+        self.adapter.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Transport adapter which returns responses recorded in a cassette.
+
+    Requests are matched as described by ccapi.requests.Cassette. Identical
+    requests receive the recorded responses in the order they were recorded,
+    after which the last response is repeated. A request with no recorded
+    response raises ccapi.exceptions.RecordedResponseNotFoundError.
+
+    Args:
+        cassette: The ccapi.requests.Cassette to replay.
+
+    Kwargs:
+        latency: A delay in seconds added to every response, or a callable taking
+            the request and returning the delay. Default: None.
+        recorded_latency: If True each response is delayed by the time taken by
+            the recorded request. Default: False.
+    """
+
+    def __init__(self, cassette, latency=None, recorded_latency=False):
+        """Create a replay adapter."""
+        super().__init__()
+        self.cassette = cassette
+        self.latency = latency
+        self.recorded_latency = recorded_latency
+        self._lock = threading.Lock()
+        self._responses = collections.defaultdict(list)
+        for interaction in cassette.interactions:
+            key = cassette.get_key(interaction["request"])
+            self._responses[key].append(interaction["response"])
+        self._played = collections.Counter()
+
+    def send(self, request, **kwargs):
+        """Return the recorded response to request."""
+        recorded = self.get_recorded_response(request)
+        delay = self.get_delay(request, recorded)
+        if delay:
+            time.sleep(delay)
+        return self.build_response(request, recorded)
+
+    def get_recorded_response(self, request):
+        """Return the next recorded response for request."""
+        key = self.cassette.get_key(self.cassette.serialise_request(request))
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                raise RecordedResponseNotFoundError(request.method, request.url)
+            index = min(self._played[key], len(responses) - 1)
+            self._played[key] += 1
+        return responses[index]
+
+    def get_delay(self, request, recorded):
+        """Return the time to wait before returning a response."""
+        delay = 0
+        if self.recorded_latency:
+            delay += recorded.get("elapsed", 0)
+        if callable(self.latency):
+            delay += self.latency(request)
+        elif self.latency:
+            delay += self.latency
+        return delay
+
+    @staticmethod
+    def build_response(request, recorded):
+        """Return a requests.Response for a recorded response."""
+        response = Response()
+        response.status_code = recorded["status_code"]
+        response.reason = recorded["reason"]
+        response.url = recorded["url"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = base64.b64decode(recorded["content"])
+        response._content_consumed = True
+        response.request = request
+        return response
+
+    def close(self):
+        """Close the adapter."""
+        pass
@@ -1,36 +1,258 @@
 """This module contains the CloudCommerceAPISession class."""
 
+import contextlib
+import contextvars
 import logging
 import os
+import threading
+import time
 from datetime import datetime, timedelta
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+
+from ccapi.exceptions import CloudCommerceDeadlineExceededError
+
+from .cache import fresh_reads_requested
+from .coalesce import RequestCoalescer
+from .decoder import get_default_decoder
+from .metrics import Metrics, RequestSample
+from .optionindex import OptionIndex
+from .profiling import get_active_hooks
+from .retry import RetryPolicy
+from .warehouseindex import WarehouseIndex
 
 logger = logging.getLogger(__name__)
 error_logger = logging.getLogger("ccapi_errors")
 
+_active_session = contextvars.ContextVar("ccapi_active_session", default=None)
+_active_deadline = contextvars.ContextVar("ccapi_active_deadline", default=None)
+
 
 class CloudCommerceAPISession:
-    """Contains session object."""
+    """
+    Logged in session with Cloud Commerce.
+
+    Each instance holds its own credentials, login state and connection pool, so
+    several sessions can be used in one process. Requests are sent using the
+    current session, which is the session activated with
+    CloudCommerceAPISession.activate or, if none is active, the default session.
+
+    Kwargs:
+        domain: Cloud Commerce domain.
+        username: Login username.
+        password: Login password.
+        pool_connections: The number of per host connection pools to keep.
+            Default: 10.
+        pool_maxsize: The maximum number of connections kept open for each host.
+            Default: 10.
+        pool_block: If True requests will wait for a free connection when the pool
+            is full, otherwise an extra connection is opened and discarded after
+            use. Default: False.
+        keep_alive: If False connections are closed after each request.
+            Default: True.
+        retry_policy: The ccapi.requests.RetryPolicy used to retry failed requests.
+            If None the default RetryPolicy is used. Default: None.
+        rate_limiter: A ccapi.requests.RateLimiter used to pace requests. If None
+            requests are not rate limited. Default: None.
+        refresh_before_expiry: A datetime.timedelta. If not None the session is
+            logged in again in a background thread once it is within this time of
+            expiring. Default: None.
+        connect_timeout: The default time in seconds to wait for a connection to
+            Cloud Commerce. Default: 10.
+        read_timeout: The default time in seconds to wait for a response from
+            Cloud Commerce. Request classes may override this. Default: 60.
+        transport: A requests transport adapter, such as a
+            ccapi.requests.RecordingAdapter or ccapi.requests.ReplayAdapter, used
+            to send all requests. If None requests are sent with a pooled
+            requests.adapters.HTTPAdapter. Default: None.
+        metrics: The ccapi.requests.Metrics, or any object with a record method
+            accepting a ccapi.requests.metrics.RequestSample, to which each
+            request is reported. If None a new Metrics is created. Default: None.
+        request_hooks: A list of callables called with a
+            ccapi.requests.profiling.PhaseTiming after each phase of every
+            request made with the session. Default: None.
+        json_decoder: The ccapi.requests.JSONDecoder used to decode responses. If
+            None an OrjsonDecoder is used when orjson is installed, as it is by
+            the orjson extra (pip install ccapi[orjson]), otherwise a
+            JSONDecoder. Default: None.
+        coalesce_requests: If True identical coalescable requests made while one
+            is in flight share its response. Default: True.
+        response_cache: A ccapi.requests.ResponseCache used to cache responses to
+            reference data requests. If None responses are not cached.
+            Default: None.
+        session_cache: A ccapi.requests.SessionCache. If not None logins are stored
+            in the cache and reused by later sessions with the same domain and
+            username instead of logging in again. Default: None.
+        option_index: The ccapi.requests.OptionIndex used to look up Product
+            Options and Product Option Values by name. If None a new OptionIndex
+            is created. Default: None.
+        warehouse_index: The ccapi.requests.WarehouseIndex used to look up
+            Warehouses and Warehouse Bays by name. If None a new WarehouseIndex
+            is created which is kept in memory. Default: None.
+    """
 
     login_handler_uri = "/Handlers/loginHandler.ashx"
-    last_login = datetime.now() - timedelta(days=5)
     timeout = timedelta(hours=1)
+    REDIRECT_STATUSES = (301, 302, 303, 307, 308)
     YAMLFILE = "cc_login.yaml"
     PROTOCOL = "http://"
-    session = requests.Session()
 
-    domain = None
-    username = None
-    password = None
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 10
+    CONNECT_TIMEOUT = 10
+    READ_TIMEOUT = 60
+
+    default_session = None
+    _default_session_lock = threading.Lock()
+
+    def __init__(
+        self,
+        *,
+        domain=None,
+        username=None,
+        password=None,
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=False,
+        keep_alive=True,
+        retry_policy=None,
+        rate_limiter=None,
+        refresh_before_expiry=None,
+        connect_timeout=CONNECT_TIMEOUT,
+        read_timeout=READ_TIMEOUT,
+        transport=None,
+        metrics=None,
+        request_hooks=None,
+        json_decoder=None,
+        coalesce_requests=True,
+        response_cache=None,
+        session_cache=None,
+        option_index=None,
+        warehouse_index=None,
+    ):
+        """Create a Cloud Commerce session."""
+        self.domain = None
+        self.username = None
+        self.password = None
+        self.last_login = None
+        self.last_activity = None
+        self.add_credentials(domain=domain, username=username, password=password)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.refresh_before_expiry = refresh_before_expiry
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.transport = transport
+        self.metrics = Metrics() if metrics is None else metrics
+        self.request_hooks = list(request_hooks or [])
+        self.json_decoder = json_decoder or get_default_decoder()
+        self.coalescer = RequestCoalescer() if coalesce_requests else None
+        self.response_cache = response_cache
+        self.session_cache = session_cache
+        self.option_index = option_index or OptionIndex()
+        self.warehouse_index = warehouse_index or WarehouseIndex()
+        self._login_lock = threading.RLock()
+        self._refresh_thread_lock = threading.Lock()
+        self._refresh_thread = None
+        self.session = self.create_requests_session()
+
+    @classmethod
+    def get_default(cls):
+        """Return the default session, creating it if necessary."""
+        with cls._default_session_lock:
+            if cls.default_session is None:
+                cls.default_session = cls()
+            return cls.default_session
 
     @classmethod
-    def get_session(cls, *, domain=None, username=None, password=None):
-        """Create logged in session with Cloud Commerce."""
-        cls.get_credentials(domain=domain, username=username, password=password)
-        if not all([cls.domain, cls.username, cls.password]):
+    def current(cls):
+        """Return the active session or the default session if none is active."""
+        session = _active_session.get()
+        if session is None:
+            session = cls.get_default()
+        return session
+
+    @staticmethod
+    def active():
+        """Return the session activated with activate, or None if none is active."""
+        return _active_session.get()
+
+    @contextlib.contextmanager
+    def activate(self):
+        """Use this session for requests made within the context."""
+        token = _active_session.set(self)
+        try:
+            yield self
+        finally:
+            _active_session.reset(token)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def deadline(seconds):
+        """
+        Limit the time taken by every request made within the context.
+
+        The deadline applies to all requests made in the context combined, so a
+        method making several requests must complete them all within seconds.
+        Nested deadlines cannot extend an outer deadline.
+        """
+        deadline = time.monotonic() + seconds
+        outer = _active_deadline.get()
+        if outer is not None:
+            deadline = min(deadline, outer)
+        token = _active_deadline.set(deadline)
+        try:
+            yield deadline
+        finally:
+            _active_deadline.reset(token)
+
+    def get_request_hooks(self):
+        """Return the hooks to call with the phase timings of requests."""
+        return tuple(self.request_hooks) + get_active_hooks()
+
+    def create_requests_session(self):
+        """Return a requests.Session with a connection pool sized for this session."""
+        session = requests.Session()
+        adapter = self.transport
+        if adapter is None:
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                pool_block=self.pool_block,
+            )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def get_session(
+        self,
+        *,
+        domain=None,
+        username=None,
+        password=None,
+        use_cache=True,
+        deadline=None,
+    ):
+        """
+        Create logged in session with Cloud Commerce.
+
+        If the session has a session_cache containing a valid login it is restored
+        without contacting Cloud Commerce unless use_cache is False. Login requests
+        are sent with the session's default timeouts and must complete before
+        deadline, the time.monotonic value returned by get_deadline. If deadline is
+        None the active deadline applies.
+        """
+        self.get_credentials(domain=domain, username=username, password=password)
+        if not all([self.domain, self.username, self.password]):
             raise AttributeError(
                 (
                     "Login credentials are missing. One or all of the "
@@ -39,46 +261,149 @@ class CloudCommerceAPISession:
                     "method or are present in the cc_login.yaml file."
                 )
             )
-        login_post_data = {"usernameInput": cls.username, "passwordInput": cls.password}
-        login_url = cls.domain_url()
+        login_post_data = {
+            "usernameInput": self.username,
+            "passwordInput": self.password,
+        }
+        login_url = self.domain_url()
+        if deadline is None:
+            deadline = self.get_deadline()
+        with self._login_lock:
+            if use_cache and self.restore_cached_login():
+                return self.session
+            try:
+                self.session.post(
+                    login_url,
+                    data=login_post_data,
+                    timeout=self.get_timeout(deadline=deadline),
+                )
+                self.login_handler(self.username, self.password, deadline=deadline)
+            except Exception as e:
+                error_logger.error(e)
+                raise e
+            else:
+                self.last_login = datetime.now()
+                logger.info(f"Logged in to {self.domain}.")
+                self.save_cached_login()
+        return self.session
+
+    def restore_cached_login(self):
+        """
+        Restore a login from the session cache, returning True if one was found.
+
+        Cached logins no newer than the session's current login are not restored.
+        """
+        if self.session_cache is None:
+            return False
+        cached = self.session_cache.load(self.domain, self.username)
+        if cached is None:
+            return False
+        if self.last_login is not None and cached["last_login"] <= self.last_login:
+            return False
+        for cookie in cached["cookies"]:
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie["domain"],
+                path=cookie["path"],
+                secure=cookie["secure"],
+                expires=cookie["expires"],
+            )
+        self.last_login = cached["last_login"]
+        logger.info(f"Restored cached login to {self.domain}.")
+        return True
+
+    def save_cached_login(self):
+        """Store the current login in the session cache."""
+        if self.session_cache is None:
+            return
         try:
-            cls.session.post(login_url, data=login_post_data)
-            cls.login_handler(cls.username, cls.password)
-        except Exception as e:
-            error_logger.error(e)
-            raise e
-        else:
-            cls.last_login = datetime.now()
-            logger.info(f"Logged in to {domain}.")
-        return cls.session
+            self.session_cache.save(
+                self.domain,
+                self.username,
+                cookies=self.session.cookies,
+                last_login=self.last_login,
+                expires=self.last_login + self.timeout,
+            )
+        except OSError as e:
+            logger.warning(f"Could not save session cache: {e}")
 
-    @classmethod
-    def add_credentials(cls, *, domain=None, username=None, password=None):
+    def relogin(self, rejected_login, deadline=None):
+        """
+        Log in again after a request was rejected as not logged in.
+
+        Any cached login is discarded. If another thread has already logged in
+        since rejected_login no new login is made.
+
+        Args:
+            rejected_login: The value of last_login when the rejected request was
+                sent.
+
+        Kwargs:
+            deadline: The time.monotonic value by which the login must complete.
+                If None the active deadline applies. Default: None.
+        """
+        with self._login_lock:
+            if self.last_login != rejected_login:
+                return
+            if self.session_cache is not None:
+                self.session_cache.invalidate(self.domain, self.username)
+            self.session.cookies.clear()
+            self.get_session(
+                domain=self.domain,
+                username=self.username,
+                password=self.password,
+                use_cache=False,
+                deadline=deadline,
+            )
+
+    def login_rejected(self, response):
+        """
+        Return True if response shows the request was not logged in.
+
+        Cloud Commerce responds to requests made with an expired session either
+        with 401 Unauthorized or by redirecting to the login page.
+        """
+        if response.status_code == 401:
+            return True
+        if response.status_code in self.REDIRECT_STATUSES:
+            return self.is_login_url(response.headers.get("Location", ""))
+        if response.history:
+            return self.is_login_url(response.url)
+        return False
+
+    def is_login_url(self, url):
+        """Return True if url is the Cloud Commerce login page."""
+        parsed = urlparse(url)
+        if parsed.netloc and parsed.netloc.lower() != str(self.domain).lower():
+            return False
+        path = parsed.path.strip("/").lower()
+        return path == "" or "login" in path
+
+    def add_credentials(self, *, domain=None, username=None, password=None):
         """Set the domain, username and password."""
         if domain is not None:
-            cls.domain = domain
+            self.domain = domain
         if username is not None:
-            cls.username = username
+            self.username = username
         if password is not None:
-            cls.password = password
+            self.password = password
 
-    @classmethod
-    def get_credentials(cls, *, domain=None, username=None, password=None):
+    def get_credentials(self, *, domain=None, username=None, password=None):
         """Load the domain, username and password for login."""
-        cls.get_credentials_from_yaml(
+        self.get_credentials_from_yaml(
             domain=domain, username=username, password=password
         )
-        cls.add_credentials(domain=domain, username=username, password=password)
+        self.add_credentials(domain=domain, username=username, password=password)
 
-    @classmethod
-    def get_credentials_from_yaml(cls, *, domain=None, username=None, password=None):
+    def get_credentials_from_yaml(self, *, domain=None, username=None, password=None):
         """Load login credentials from a cc_login.yaml file."""
-        yaml_config_path = cls.find_yaml()
+        yaml_config_path = self.find_yaml()
         if yaml_config_path is not None:
             with open(yaml_config_path, "r") as yaml_file:
                 config = yaml.load(yaml_file, Loader=yaml.FullLoader)
             try:
-                cls.add_credentials(**config)
+                self.add_credentials(**config)
             except Exception as e:
                 raise e
                 raise Exception(f"Could not load config from {yaml_config_path}.")
@@ -95,36 +420,92 @@ class CloudCommerceAPISession:
         else:
             return cls.find_yaml(directory=os.path.dirname(directory))
 
-    @classmethod
-    def domain_url(cls):
+    def domain_url(self):
         """Return the domain with the protocol prefix."""
-        return f"{cls.PROTOCOL}{cls.domain}"
+        return f"{self.PROTOCOL}{self.domain}"
 
-    @classmethod
-    def login_handler(cls, username, password):
-        """Perform login handler request to set session parameters."""
-        login_handler_url = f"{cls.domain_url()}{cls.login_handler_uri}"
+    def login_handler(self, username, password, deadline=None):
+        """
+        Perform login handler request to set session parameters.
+
+        The request must complete before deadline, the time.monotonic value
+        returned by get_deadline. If deadline is None the active deadline applies.
+        """
+        login_handler_url = f"{self.domain_url()}{self.login_handler_uri}"
         params = {"Username": username, "Password": password}
-        response = cls.session.post(login_handler_url, data=params)
+        if deadline is None:
+            deadline = self.get_deadline()
+        response = self.session.post(
+            login_handler_url,
+            data=params,
+            timeout=self.get_timeout(deadline=deadline),
+        )
         response.raise_for_status()
 
-    @classmethod
-    def api_request(cls, request):
-        """Perform API request."""
-        cls.check_login()
-        url = urljoin(cls.domain_url(), request.uri)
-        logger.info("CCAPI Request to {}.".format(request.uri))
+    def api_request(self, request, retry=None, deadline=None, fresh=False):
+        """
+        Perform API request.
+
+        Transient failures are retried according to the session's retry policy. If
+        the response shows the session has expired, either a 401 response or a
+        redirect to the login page, the session logs in again and the request is
+        sent once more. Coalescable requests identical to one already in flight
+        wait for and return its response. If the session has a response_cache a
+        cached response is returned when available and cached responses made stale
+        by the request are removed. Responses to requests sent before such an
+        invalidation are neither cached nor shared with requests made after it.
+
+        Args:
+            request: The ccapi.requests.APIRequest to send.
+
+        Kwargs:
+            retry: If True or False overrides whether the request may be retried.
+                If None only idempotent requests are retried. Default: None.
+            deadline: The maximum time in seconds allowed for the request,
+                including retries. Default: None.
+            fresh: If True a cached response will not be used. Requests made in
+                a ccapi.requests.fresh_reads context are always fresh.
+                Default: False.
+        """
+        cache = self.response_cache
+        if cache is not None and not (fresh or fresh_reads_requested()):
+            response = cache.get(request)
+            if response is not None:
+                logger.debug(f"CCAPI Cached response used for {request.uri}.")
+                return response
+        deadline = self.get_deadline(deadline)
+        self.check_login(deadline=deadline)
+        generation = None if cache is None else cache.generation(request)
         try:
-            response = cls.session.post(
-                url,
-                headers=request.headers,
-                params=request.params,
-                data=request.data,
-                files=request.files,
-            )
+            if self.coalescer is not None and self.coalescer.can_coalesce(request):
+                response = self.coalescer.call(
+                    request,
+                    lambda: self._api_request(request, retry, deadline),
+                    deadline=deadline,
+                )
+            else:
+                response = self._api_request(request, retry, deadline)
+        finally:
+            if request.invalidates:
+                if self.coalescer is not None:
+                    self.coalescer.invalidate_for(request)
+                if cache is not None:
+                    cache.invalidate_for(request)
+        if cache is not None:
+            cache.set(request, response, generation=generation)
+        return response
+
+    def _api_request(self, request, retry, deadline):
+        sample = RequestSample(request)
+        started = time.perf_counter()
+        try:
+            response = self._request(request, retry, deadline, sample)
         except Exception as e:
-            logger.exception(e)
+            sample.exception = e
             raise e
+        finally:
+            sample.latency = time.perf_counter() - started
+            self.metrics.record(sample)
         try:
             response.raise_for_status()
         except Exception:
@@ -150,23 +531,186 @@ class CloudCommerceAPISession:
             )
         return response
 
-    @classmethod
-    def session_timed_out(cls):
-        """Check current session is valid."""
-        if cls.last_login:
-            login_expires = cls.last_login + cls.timeout
+    @staticmethod
+    def get_deadline(seconds=None):
+        """
+        Return the time.monotonic value by which a request must be complete.
+
+        Args:
+            seconds: The time allowed for the request. If None only the active
+                deadline applies.
+
+        Returns: float or None if there is no deadline.
+        """
+        deadline = _active_deadline.get()
+        if seconds is not None:
+            call_deadline = time.monotonic() + seconds
+            deadline = (
+                call_deadline if deadline is None else min(deadline, call_deadline)
+            )
+        return deadline
+
+    def get_timeout(self, request=None, deadline=None):
+        """
+        Return the (connect, read) timeout for an attempt at request.
+
+        If request is None the session's default timeouts are returned, as used
+        for logging in. Raises ccapi.exceptions.CloudCommerceDeadlineExceededError
+        if deadline has passed.
+        """
+        connect_timeout = self.connect_timeout
+        read_timeout = self.read_timeout
+        uri = self.login_handler_uri
+        if request is not None:
+            connect_timeout = request.connect_timeout or connect_timeout
+            read_timeout = request.read_timeout or read_timeout
+            uri = request.uri
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise CloudCommerceDeadlineExceededError(uri)
+            connect_timeout = min(connect_timeout or remaining, remaining)
+            read_timeout = min(read_timeout or remaining, remaining)
+        return (connect_timeout, read_timeout)
+
+    def _request(self, request, retry, deadline, sample):
+        url = urljoin(self.domain_url(), request.uri)
+        can_retry = self.retry_policy.allows_retry(request, retry=retry)
+        login = self.last_login
+        response = self._send(request, url, can_retry, deadline, sample)
+        if self.login_rejected(response):
+            logger.info(f"CCAPI Request to {request.uri} was not logged in.")
+            self.relogin(login, deadline=deadline)
+            response = self._send(request, url, can_retry, deadline, sample)
+        if response.ok and not self.login_rejected(response):
+            self.last_activity = datetime.now()
+        return response
+
+    def _send(self, request, url, can_retry, deadline, sample):
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            sample.attempts += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(request.uri, deadline=deadline)
+            timeout = self.get_timeout(request, deadline)
+            logger.info("CCAPI Request to {}.".format(request.uri))
+            try:
+                response = self.session.post(
+                    url,
+                    headers=request.headers,
+                    params=request.params,
+                    data=request.data,
+                    files=request.files,
+                    timeout=timeout,
+                )
+            except Exception as e:
+                if can_retry and self.retry_policy.is_retryable(exception=e):
+                    delay = self.retry_policy.get_retry_delay(
+                        attempt, started, deadline=deadline
+                    )
+                    if delay is not None:
+                        self._wait_for_retry(request, attempt, delay, e)
+                        continue
+                logger.exception(e)
+                raise e
+            sample.add_response(response)
+            if can_retry and self.retry_policy.is_retryable(response=response):
+                delay = self.retry_policy.get_retry_delay(
+                    attempt, started, deadline=deadline
+                )
+                if delay is not None:
+                    self._wait_for_retry(request, attempt, delay, response.status_code)
+                    continue
+            return response
+
+    def _wait_for_retry(self, request, attempt, delay, reason):
+        logger.warning(
+            (
+                f"CCAPI Request to {request.uri} failed on attempt {attempt} with "
+                f"{reason}, retrying in {delay:.2f} seconds."
+            )
+        )
+        time.sleep(delay)
+
+    def session_timed_out(self):
+        """
+        Check current session is valid.
+
+        Expired sessions are detected from responses to requests, so this is a
+        fallback which expires the session after timeout has passed without a
+        successful request.
+        """
+        if self.last_login:
+            login_expires = max(self.last_login, self.last_activity or self.last_login)
+            login_expires += self.timeout
             logger.debug(
-                f"Last Login: {cls.last_login} Timeout: {cls.timeout} Expires: {login_expires} Current: {datetime.now()}"
+                f"Last Login: {self.last_login} Timeout: {self.timeout} Expires: {login_expires} Current: {datetime.now()}"
             )
             if datetime.now() < login_expires:
                 return False
         return True
 
-    @classmethod
-    def check_login(cls):
-        """Get new session if current session has expired."""
-        if cls.session_timed_out():
-            logger.info("Timed out")
-            cls.get_session(
-                domain=cls.domain, username=cls.username, password=cls.password
+    def session_expires_soon(self):
+        """Return True if the session is due to be refreshed in the background."""
+        if self.refresh_before_expiry is None or self.last_login is None:
+            return False
+        refresh_at = self.last_login + self.timeout - self.refresh_before_expiry
+        return datetime.now() >= refresh_at
+
+    def check_login(self, deadline=None):
+        """
+        Get new session if current session has expired.
+
+        Only one login is made at a time. Callers finding the session expired while
+        another thread is logging in wait for that login rather than making their
+        own. If refresh_before_expiry is set a session close to expiry is refreshed
+        in a background thread without blocking the caller.
+
+        Kwargs:
+            deadline: The time.monotonic value by which a login must complete. If
+                None the active deadline applies. Default: None.
+        """
+        if not self.session_timed_out():
+            if self.session_expires_soon():
+                self.refresh_in_background()
+            return
+        with self._login_lock:
+            if self.session_timed_out():
+                logger.info("Timed out")
+                self.get_session(
+                    domain=self.domain,
+                    username=self.username,
+                    password=self.password,
+                    deadline=deadline,
+                )
+
+    def refresh_in_background(self):
+        """Start a background login unless one is already running."""
+        with self._refresh_thread_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh, name="ccapi-login-refresh", daemon=True
             )
+            self._refresh_thread.start()
+
+    def _refresh(self):
+        with self._login_lock:
+            if not self.session_expires_soon():
+                return
+            try:
+                self.get_session(
+                    domain=self.domain,
+                    username=self.username,
+                    password=self.password,
+                    use_cache=False,
+                )
+            except Exception as e:
+                logger.exception(e)
+
+    def close(self):
+        """Close all pooled connections and save the warehouse index."""
+        self.session.close()
+        self.warehouse_index.close()
@@ -0,0 +1,110 @@
+"""This module contains the RequestCoalescer class."""
+
+import json
+import threading
+import time
+
+from ccapi.exceptions import CloudCommerceDeadlineExceededError
+
+
+class _InFlightRequest:
+    def __init__(self, request_name):
+        self.request_name = request_name
+        self.done = threading.Event()
+        self.response = None
+        self.exception = None
+
+
+class RequestCoalescer:
+    """
+    Share the responses of identical requests made at the same time.
+
+    While a coalescable request is in flight, identical requests (with the same
+    URI, parameters, headers and data) wait for it to complete and receive the
+    same response rather than making another request. If the request fails the
+    exception is raised for every caller. Requests sending files are never
+    coalesced. Once a request invalidating responses to a request class has been
+    made, later requests do not wait for requests to that class already in flight.
+    """
+
+    def __init__(self):
+        """Create a request coalescer."""
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    @staticmethod
+    def can_coalesce(request):
+        """Return True if request can share the response of an identical request."""
+        return bool(getattr(request, "coalescable", False)) and not request.files
+
+    @staticmethod
+    def get_key(request):
+        """Return the key identifying identical requests."""
+        return (
+            request.uri,
+            json.dumps(request.params, sort_keys=True, default=str),
+            json.dumps(request.headers, sort_keys=True, default=str),
+            json.dumps(request.data, sort_keys=True, default=str),
+        )
+
+    def call(self, request, func, deadline=None):
+        """
+        Return the response to request, calling func only if it is not in flight.
+
+        Args:
+            request: The ccapi.requests.APIRequest being sent.
+            func: A callable which sends request and returns the response.
+
+        Kwargs:
+            deadline: The time.monotonic value by which a waiting caller must
+                receive the response. Default: None.
+        """
+        key = self.get_key(request)
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                in_flight = _InFlightRequest(type(request).__name__)
+                self._in_flight[key] = in_flight
+        if not leader:
+            return self._wait(request, in_flight, deadline)
+        try:
+            in_flight.response = func()
+        except BaseException as e:
+            in_flight.exception = e
+            raise
+        finally:
+            with self._lock:
+                if self._in_flight.get(key) is in_flight:
+                    del self._in_flight[key]
+            in_flight.done.set()
+        return in_flight.response
+
+    def invalidate_for(self, request):
+        """
+        Stop later requests waiting for in flight requests made stale by request.
+
+        The request classes affected are declared by the invalidates attribute of
+        request. Callers already waiting still receive the in flight response.
+        """
+        names = set(getattr(request, "invalidates", {}))
+        if not names:
+            return
+        with self._lock:
+            for key, in_flight in list(self._in_flight.items()):
+                if in_flight.request_name in names:
+                    del self._in_flight[key]
+
+    def in_flight(self):
+        """Return the number of requests in flight."""
+        with self._lock:
+            return len(self._in_flight)
+
+    @staticmethod
+    def _wait(request, in_flight, deadline):
+        timeout = None if deadline is None else max(0, deadline - time.monotonic())
+        if not in_flight.done.wait(timeout):
+            raise CloudCommerceDeadlineExceededError(request.uri)
+        if in_flight.exception is not None:
+            raise in_flight.exception
+        return in_flight.response
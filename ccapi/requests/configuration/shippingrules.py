@@ -13,12 +13,14 @@ class ShippingRules(APIRequest):
     """ShippingRules request."""
 
     uri = "/Handlers/Configuration/ShippingRules.ashx"
+    idempotent = True
+    cache_ttl = 3600
 
-    def __new__(self):
+    def __init__(self):
         """Create ShippingRules request."""
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
-        data = response.json()
+        data = self.decode_json(response)
         return CourierRules(data)
@@ -4,7 +4,8 @@ GetLogs request.
 Return a log of changes made to orders for a customer.
 """
 
-import datetime
+from ccapi.cc_objects import retained_json
+from ccapi.timestamps import parse_timestamp
 
 from ..apirequest import APIRequest
 
@@ -13,8 +14,11 @@ class GetLogs(APIRequest):
     """GetLogs request."""
 
     uri = "Handlers/Customers/GetLogs.ashx"
+    idempotent = True
 
-    def __new__(self, customer_id, added_by=None, log_type=None, number_of_records=100):
+    def __init__(
+        self, customer_id, added_by=None, log_type=None, number_of_records=100
+    ):
         """Create GetLogs request.
 
         args:
@@ -25,7 +29,7 @@ class GetLogs(APIRequest):
         self.added_by = added_by or 0
         self.log_type = log_type or 0
         self.number_of_records = number_of_records
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -39,13 +43,31 @@ class GetLogs(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        self.raise_for_non_200(self, response, "Error retrieving customer logs.")
-        return [CustomerLog(log) for log in response.json()]
+        self.raise_for_non_200(response, "Error retrieving customer logs.")
+        return [CustomerLog(log) for log in self.decode_json(response)]
 
 
 class CustomerLog:
     """Wrapper for Cloud Commerce customer log records."""
 
+    __slots__ = (
+        "raw",
+        "timestamp",
+        "customer_ID",
+        "note",
+        "note_snippet",
+        "name",
+        "customer_user_name",
+        "added_by_username",
+        "added_by_user_ID",
+        "log_type_ID",
+        "login_ID",
+        "status_ID",
+        "HTML_content",
+        "log_icon",
+        "message_ID",
+    )
+
     TIMESTAMP = "DateStampString"
     CUSTOMER_ID = "ID"
     NOTE = "Note"
@@ -63,7 +85,7 @@ class CustomerLog:
 
     def __init__(self, raw):
         """Create log record from API response."""
-        self.raw = raw
+        self.raw = retained_json(raw)
         self.timestamp = self.parse_timestamp(raw[self.TIMESTAMP])
         self.customer_ID = str(raw[self.CUSTOMER_ID])
         self.note = raw[self.NOTE]
@@ -86,10 +108,4 @@ class CustomerLog:
         Convert a timestamp in the format "05/11/2018 10:23" to a datetime.datetime
         object.
         """
-        date, time = timestamp_string.split(" ")
-        day, month, year = [int(_) for _ in date.split("/")]
-        hour, minute = [int(_) for _ in time.split(":")]
-        timestamp = datetime.datetime(
-            day=day, month=month, year=year, hour=hour, minute=minute
-        )
-        return timestamp
+        return parse_timestamp(timestamp_string)
@@ -0,0 +1,79 @@
+"""This module contains JSON decoders for Cloud Commerce responses.
+
+Responses are decoded directly from the response body bytes. If orjson is
+installed, for instance with the orjson extra (pip install ccapi[orjson]), it is
+used by default, otherwise the standard library json module is used.
+"""
+
+import codecs
+import json
+import re
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+CHARSET = re.compile(r"charset=([^;]+)", re.IGNORECASE)
+
+
+class JSONDecoder:
+    """
+    Decode JSON using the standard library json module.
+
+    Subclasses can use another JSON library by overriding loads, which must accept
+    bytes or str and raise a subclass of json.JSONDecodeError for invalid JSON.
+    """
+
+    name = "json"
+
+    def loads(self, content):
+        """Return the decoded value of the JSON content."""
+        return json.loads(content)
+
+    def decode_response(self, response):
+        """
+        Return the decoded JSON body of a requests.Response.
+
+        The body is decoded from the response bytes, without a byte order mark,
+        unless the Content-Type header declares a character set other than UTF-8.
+        """
+        if not self.uses_bytes(response):
+            return self.loads(response.text)
+        content = response.content
+        if content.startswith(codecs.BOM_UTF8):
+            content = content[len(codecs.BOM_UTF8) :]
+        return self.loads(content)
+
+    @staticmethod
+    def uses_bytes(response):
+        """Return True if the body of response can be decoded as bytes."""
+        charset = CHARSET.search(response.headers.get("Content-Type", ""))
+        if charset is None:
+            return True
+        try:
+            return codecs.lookup(charset.group(1).strip("'\" ")).name == "utf-8"
+        except LookupError:
+            return False
+
+
+class OrjsonDecoder(JSONDecoder):
+    """Decode JSON using orjson."""
+
+    name = "orjson"
+
+    def __init__(self):
+        """Create an orjson decoder."""
+        if orjson is None:  # pragma: no cover
+            raise RuntimeError("OrjsonDecoder requires orjson to be installed.")
+
+    def loads(self, content):
+        """Return the decoded value of the JSON content."""
+        return orjson.loads(content)
+
+
+def get_default_decoder():
+    """Return an OrjsonDecoder if orjson is installed, otherwise a JSONDecoder."""
+    if orjson is not None:
+        return OrjsonDecoder()
+    return JSONDecoder()
@@ -4,7 +4,6 @@ getProductExportUpdate request.
 Retrieve information about product exports.
 """
 
-
 from ..apirequest import APIRequest
 
 
@@ -16,6 +15,7 @@ class GetProductExportUpdate(APIRequest):
     """
 
     uri = "Handlers/Export/getProductExportUpdate.ashx"
+    idempotent = True
 
     def get_data(self):
         """Get data for request."""
@@ -23,5 +23,5 @@ class GetProductExportUpdate(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        self.raise_for_non_200(self, response, "Failed to retrive product exports.")
-        return response.json()
+        self.raise_for_non_200(response, "Failed to retrive product exports.")
+        return self.decode_json(response)
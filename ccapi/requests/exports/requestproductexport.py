@@ -4,7 +4,6 @@ requestProductExport request.
 Trigger a new product export.
 """
 
-
 from ..apirequest import APIRequest
 
 
@@ -16,10 +15,11 @@ class RequestProductExport(APIRequest):
     """
 
     uri = "Handlers/Export/requestProductExport.ashx"
+    read_timeout = 120
 
     COPY = "copy"
 
-    def __new__(self, copy_images=False):
+    def __init__(self, copy_images=False):
         """Trigger a new product export.
 
         Args:
@@ -30,7 +30,7 @@ class RequestProductExport(APIRequest):
 
         """
         self.copy_images = copy_images
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -38,5 +38,5 @@ class RequestProductExport(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        self.raise_for_non_200(self, response, "Failed to trigger product exports.")
+        self.raise_for_non_200(response, "Failed to trigger product exports.")
         return response.text == "OK"
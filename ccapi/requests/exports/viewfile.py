@@ -4,7 +4,6 @@ ViewFile request.
 Download a product export.
 """
 
-
 from ..apirequest import APIRequest
 
 
@@ -16,6 +15,8 @@ class ViewFile(APIRequest):
     """
 
     uri = "Handlers/Export/ViewFile.ashx"
+    idempotent = True
+    read_timeout = 300
 
     NAME = "name"
     DISP = "disp"
@@ -23,7 +24,7 @@ class ViewFile(APIRequest):
     DISP_VALUE = "attach"
     BRAND_ID_VALUE = "341"
 
-    def __new__(self, name):
+    def __init__(self, name):
         """
         Download a product export.
 
@@ -35,7 +36,7 @@ class ViewFile(APIRequest):
 
         """
         self.name = name
-        return super().__new__(self)
+        super().__init__()
 
     def get_params(self):
         """Get data for request."""
@@ -47,5 +48,5 @@ class ViewFile(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        self.raise_for_non_200(self, response, "Failed to download product export.")
+        self.raise_for_non_200(response, "Failed to download product export.")
         return response
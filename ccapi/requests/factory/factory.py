@@ -14,8 +14,9 @@ class Factory(APIRequest):
     DELETE_FACTORY = "delFactory"
 
     uri = "/Handlers/Factory/Factory.ashx"
+    invalidates = {"FindFactories": None}
 
-    def __new__(
+    def __init__(
         self,
         prog_type=None,
         comp_to_del=None,
@@ -37,7 +38,7 @@ class Factory(APIRequest):
         self.name = name
         self.nominal_code = nominal_code
         self.order_to_comp = order_to_comp
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -13,6 +13,8 @@ class FindFactories(APIRequest):
     """FindFactories request."""
 
     uri = "/Handlers/Factory/FindFactories.ashx"
+    idempotent = True
+    cache_ttl = 3600
 
     def get_data(self):
         """Get data for request."""
@@ -21,5 +23,5 @@ class FindFactories(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        data = response.json()
+        data = self.decode_json(response)
         return Factories([Factory(factory) for factory in data])
@@ -11,8 +11,9 @@ class UpdProductFactoryLink(APIRequest):
     """UpdProductFactoryLink request."""
 
     uri = "/Handlers/Factory/UpdProductFactoryLink.ashx"
+    invalidates = {"FindProductFactoryLinks": {"ProductID": "product_id"}}
 
-    def __new__(
+    def __init__(
         self, product_id=None, factory_id=None, dropship=False, supplier_sku="", price=0
     ):
         """Make UpdProductFactoryLink request."""
@@ -21,7 +22,7 @@ class UpdProductFactoryLink(APIRequest):
         self.dropship = dropship
         self.supplier_sku = supplier_sku
         self.price = price
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -48,7 +48,7 @@ class AddCustomer(APIRequest):
     LINK_TO_VALUE = 0
     OSCID_VALUE = 0
 
-    def __new__(
+    def __init__(
         self,
         *,
         customer_name,
@@ -154,7 +154,7 @@ class AddCustomer(APIRequest):
         self.vat_number = vat_number or ""
         self.special_instructions = special_instructions or ""
         self.credit_limit = credit_limit
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for get request."""
@@ -195,6 +195,6 @@ class AddCustomer(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self, response, f"Failed to add customer {self.customer_name}."
+            response, f"Failed to add customer {self.customer_name}."
         )
         return response.text.split("^^")[1]
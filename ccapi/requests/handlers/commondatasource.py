@@ -9,13 +9,14 @@ class CommonDataSource(APIRequest):
     """CommonDataSource request."""
 
     uri = "Handlers/Common/CommonDataSource.ashx"
+    idempotent = True
 
     SEARCH_TERM = "searchTerm"
 
-    def __new__(self, search_term):
+    def __init__(self, search_term):
         """Search for an HS Code."""
         self.search_term = search_term
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for get request."""
@@ -28,9 +29,9 @@ class CommonDataSource(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        self.raise_for_non_200(self, response, "Failed to get HS code options")
+        self.raise_for_non_200(response, "Failed to get HS code options")
         try:
-            codes = json.loads(response.json()["Data"])
+            codes = json.loads(self.decode_json(response)["Data"])
             return {item["Name"]: item["Description"] for item in codes}
         except Exception as e:
             raise Exception(f"Failed to parse response: {str(e)}")
@@ -42,7 +42,7 @@ class CreateOrder(APIRequest):
     EMAIL_RECIPIENT = "EmailRecipient"
     ITEM_NET_2DP = "ItemNet2DP"
 
-    def __new__(
+    def __init__(
         self,
         *,
         customer_id,
@@ -126,7 +126,7 @@ class CreateOrder(APIRequest):
         self.delivery_address_id = delivery_address_id
         self.billing_address_id = billing_address_id
         self.shipping_rule_id = shipping_rule_id
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for get request."""
@@ -161,8 +161,8 @@ class CreateOrder(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        self.raise_for_non_200(self, response, "Failed to create order.")
-        response = CreateOrderResponse(response.json())
+        self.raise_for_non_200(response, "Failed to create order.")
+        response = CreateOrderResponse(self.decode_json(response))
         if response.error != "":
             raise CloudCommerceResponseError(
                 f"Order creation returned error: {response.error}"
@@ -37,7 +37,7 @@ class CustomerAccounts(APIRequest):
 
     INSERT_PAYMENT = "InsertPayment"
 
-    def __new__(
+    def __init__(
         self,
         *,
         prog_type,
@@ -96,7 +96,7 @@ class CustomerAccounts(APIRequest):
         self.exchange_rate = exchange_rate
         self.bank_nominal = bank_nominal
         self.gateway_type_ID = gateway_type_id
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for get request."""
@@ -135,7 +135,7 @@ class CustomerAccounts(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         if self.prog_type == self.INSERT_PAYMENT:
-            self.raise_for_non_200(self, response, "Failed to create payment.")
+            self.raise_for_non_200(response, "Failed to create payment.")
         if "Inserted" in response.text:
             return True
         else:
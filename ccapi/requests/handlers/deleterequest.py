@@ -1,6 +1,5 @@
 """deleteRequest request."""
 
-
 from ccapi.requests import APIRequest
 
 
@@ -12,11 +11,11 @@ class DeleteRequest(APIRequest):
     ROWID = "rowid"
     NAME = "name"
 
-    def __new__(self, export_ID, export_name):
+    def __init__(self, export_ID, export_name):
         """Delete a product export."""
         self.export_ID = export_ID
         self.export_name = export_name
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for get request."""
@@ -25,5 +24,5 @@ class DeleteRequest(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        self.raise_for_non_200(self, response, "Failed to get HS code options")
+        self.raise_for_non_200(response, "Failed to get HS code options")
         return response
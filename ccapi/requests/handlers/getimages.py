@@ -3,6 +3,7 @@ getImages request.
 
 Gets images for a Product.
 """
+
 from bs4 import BeautifulSoup
 
 from ccapi.cc_objects import ProductImage
@@ -13,8 +14,9 @@ class GetImages(APIRequest):
     """getImages request."""
 
     uri = "Handlers/getImages.ashx"
+    idempotent = True
 
-    def __new__(self, range_id="", product_id=""):
+    def __init__(self, range_id="", product_id=""):
         """Create getImages request.
 
         Kwargs:
@@ -23,7 +25,7 @@ class GetImages(APIRequest):
         """
         self.range_id = range_id
         self.product_id = product_id
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
@@ -15,27 +15,28 @@ class GetProductsForRange(APIRequest):
     """GetProductsForRange request."""
 
     uri = "Handlers/getProductsForRange.ashx"
+    idempotent = True
 
     PRODUCT_RANGE_ID = "ProdRangeID"
     SALES_CHANNEL_ID = "salesChannelID"
     SALES_CHANNEL_ID_VALUE = "0"
 
-    def __new__(self, product_id):
+    def __init__(self, product_id):
         """Create GetProductsForRange request.
 
         Args:
             product_id: ID of range.
         """
         self.product_id = product_id
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self, response, "Error retriveing product details: {}".format(response.text)
+            response, "Error retriveing product details: {}".format(response.text)
         )
         try:
-            response_data = response.json()
+            response_data = self.decode_json(response)
         except json.JSONDecodeError:
             raise CloudCommerceResponseError(
                 "Recieved invalid response: {}".format(response.text)
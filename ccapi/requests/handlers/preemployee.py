@@ -13,11 +13,13 @@ class PreEmployee(APIRequest):
     """GetProductsForRange request."""
 
     uri = "/Handlers/PreEmployee.ashx"
+    idempotent = True
+    cache_ttl = 3600
 
-    def __new__(self, search_string=""):
+    def __init__(self, search_string=""):
         """Create FindPrintQueue request."""
         self.search_string = search_string
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
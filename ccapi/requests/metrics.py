@@ -0,0 +1,245 @@
+"""This module contains classes for collecting Cloud Commerce request metrics."""
+
+import bisect
+import threading
+
+
+class Histogram:
+    """
+    Histogram of observed values with fixed bucket boundaries.
+
+    Kwargs:
+        buckets: Ascending upper bounds of the buckets. Values greater than the
+            last bound are counted in an overflow bucket. Default: BUCKETS.
+    """
+
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+    def __init__(self, buckets=BUCKETS):
+        """Create a histogram."""
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        """Add value to the histogram."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self):
+        """Return a list of (upper bound, number of values at or below it)."""
+        bounds = self.buckets + (float("inf"),)
+        total = 0
+        cumulative = []
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            cumulative.append((bound, total))
+        return cumulative
+
+    def quantile(self, q):
+        """Return the upper bound of the bucket containing the quantile q."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        for bound, total in self.cumulative_counts():
+            if total >= rank:
+                return bound
+
+    def to_dict(self):
+        """Return a dict of the histogram's values."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(self.cumulative_counts()),
+        }
+
+
+class RequestSample:
+    """
+    Measurements of a single call to CloudCommerceAPISession.api_request.
+
+    Args:
+        request: The ccapi.requests.APIRequest being sent.
+    """
+
+    def __init__(self, request):
+        """Create a request sample."""
+        self.request_name = type(request).__name__
+        self.uri = request.uri
+        self.attempts = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = None
+        self.status_code = None
+        self.exception = None
+
+    @property
+    def retries(self):
+        """Return the number of times the request was retried."""
+        return max(0, self.attempts - 1)
+
+    @property
+    def error(self):
+        """Return True if the request raised an exception or failed."""
+        return self.exception is not None or (
+            self.status_code is not None and self.status_code >= 400
+        )
+
+    def add_response(self, response):
+        """Add the sizes of a response and the URL and body sent for it."""
+        if response.request is not None:
+            self.bytes_sent += len(response.request.url or "")
+            self.bytes_sent += len(response.request.body or b"")
+        self.bytes_received += len(response.content or b"")
+        self.status_code = response.status_code
+
+
+class EndpointMetrics:
+    """
+    Totals for requests made by one request class to one URI.
+
+    Args:
+        request_name: The name of the request class.
+        uri: The URI requested.
+
+    Kwargs:
+        buckets: The latency histogram buckets in seconds.
+            Default: Histogram.BUCKETS.
+    """
+
+    def __init__(self, request_name, uri, buckets=Histogram.BUCKETS):
+        """Create endpoint metrics."""
+        self.request_name = request_name
+        self.uri = uri
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = Histogram(buckets)
+
+    def add(self, sample):
+        """Add a ccapi.requests.metrics.RequestSample to the totals."""
+        self.calls += 1
+        self.errors += int(sample.error)
+        self.retries += sample.retries
+        self.bytes_sent += sample.bytes_sent
+        self.bytes_received += sample.bytes_received
+        self.latency.observe(sample.latency)
+
+    def to_dict(self):
+        """Return a dict of the endpoint's metrics."""
+        return {
+            "request": self.request_name,
+            "uri": self.uri,
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.to_dict(),
+        }
+
+
+class Metrics:
+    """
+    Thread safe collector of per endpoint request metrics.
+
+    Every CloudCommerceAPISession passes a ccapi.requests.metrics.RequestSample to
+    its metrics record method after each request. Any object with a record method
+    can be used in place of Metrics, and callables added with add_hook are called
+    with each sample.
+
+    Kwargs:
+        buckets: The latency histogram buckets in seconds.
+            Default: Histogram.BUCKETS.
+    """
+
+    PREFIX = "ccapi_request"
+
+    def __init__(self, buckets=Histogram.BUCKETS):
+        """Create a metrics collector."""
+        self.buckets = tuple(buckets)
+        self.hooks = []
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def add_hook(self, hook):
+        """Call hook with each ccapi.requests.metrics.RequestSample recorded."""
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook):
+        """Stop calling hook."""
+        self.hooks.remove(hook)
+
+    def record(self, sample):
+        """Add a ccapi.requests.metrics.RequestSample to the metrics."""
+        key = (sample.request_name, sample.uri)
+        with self._lock:
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                endpoint = EndpointMetrics(*key, buckets=self.buckets)
+                self._endpoints[key] = endpoint
+            endpoint.add(sample)
+        for hook in self.hooks:
+            hook(sample)
+
+    def reset(self):
+        """Remove all recorded metrics."""
+        with self._lock:
+            self._endpoints = {}
+
+    def snapshot(self):
+        """Return a list of dicts of the metrics for each endpoint."""
+        with self._lock:
+            return [endpoint.to_dict() for endpoint in self._endpoints.values()]
+
+    def to_prometheus(self):
+        """Return the metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+        counters = (
+            ("total", "calls", "Number of requests."),
+            ("errors_total", "errors", "Number of failed requests."),
+            ("retries_total", "retries", "Number of retried attempts."),
+            (
+                "sent_bytes_total",
+                "bytes_sent",
+                "Bytes sent in request URLs and bodies.",
+            ),
+            ("received_bytes_total", "bytes_received", "Bytes received."),
+        )
+        for suffix, key, description in counters:
+            name = f"{self.PREFIX}s_{suffix}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} counter")
+            for endpoint in snapshot:
+                lines.append(f"{name}{{{self._labels(endpoint)}}} {endpoint[key]}")
+        name = f"{self.PREFIX}_duration_seconds"
+        lines.append(f"# HELP {name} Request latency in seconds.")
+        lines.append(f"# TYPE {name} histogram")
+        for endpoint in snapshot:
+            labels = self._labels(endpoint)
+            latency = endpoint["latency"]
+            for bound, count in latency["buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {latency['sum']!r}")
+            lines.append(f"{name}_count{{{labels}}} {latency['count']}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _labels(endpoint):
+        def escape(value):
+            value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+            return value.replace("\n", "\\n")
+
+        return (
+            f'request="{escape(endpoint["request"])}",uri="{escape(endpoint["uri"])}"'
+        )
@@ -0,0 +1,151 @@
+"""This module contains the OptionIndex class."""
+
+import threading
+
+from ccapi.cc_objects import ProductOptionValue
+
+
+class OptionIndex:
+    """
+    In memory index of Product Options and Product Option Values.
+
+    Options are indexed by normalised name and by ID, and the values of each
+    option by normalised value and by ID. Names are normalised by stripping
+    whitespace and ignoring case. Options and the values of each option are loaded
+    once and then updated as values are added or deleted, so the index does not
+    see changes made by other sessions until it is cleared.
+
+    The lock attribute is a reentrant lock which callers hold while loading the
+    index or creating values so concurrent callers do not repeat the work.
+    """
+
+    def __init__(self):
+        """Create an empty option index."""
+        self.lock = threading.RLock()
+        self._options = None
+        self._option_names = None
+        self._values = {}
+        self._value_names = {}
+
+    @staticmethod
+    def normalise(name):
+        """Return name normalised for lookup."""
+        return str(name).strip().lower()
+
+    @property
+    def options_loaded(self):
+        """Return True if Product Options have been added to the index."""
+        return self._options is not None
+
+    def set_options(self, options):
+        """Index an iterable of ccapi.cc_objects.ProductOption."""
+        with self.lock:
+            options = list(options)
+            self._options = {str(option.id): option for option in options}
+            self._option_names = {
+                self.normalise(option.option_name): option for option in options
+            }
+
+    def get_option(self, option_name):
+        """Return the indexed Product Option named option_name or None."""
+        with self.lock:
+            return (self._option_names or {}).get(self.normalise(option_name))
+
+    def get_option_by_id(self, option_id):
+        """Return the indexed Product Option with ID option_id or None."""
+        with self.lock:
+            return (self._options or {}).get(str(option_id))
+
+    def values_loaded(self, option_id):
+        """Return True if the values of a Product Option have been indexed."""
+        with self.lock:
+            return str(option_id) in self._values
+
+    def set_values(self, option_id, values):
+        """Index an iterable of ccapi.cc_objects.ProductOptionValue for an option."""
+        with self.lock:
+            values = list(values)
+            self._values[str(option_id)] = {str(value.id): value for value in values}
+            self._value_names[str(option_id)] = {
+                self.normalise(value.value): value for value in values
+            }
+
+    def get_values(self, option_id):
+        """Return a list of the indexed values of a Product Option."""
+        with self.lock:
+            return list(self._values.get(str(option_id), {}).values())
+
+    def get_value(self, option_id, value):
+        """Return the indexed ProductOptionValue matching value or None."""
+        with self.lock:
+            return self._value_names.get(str(option_id), {}).get(self.normalise(value))
+
+    def get_value_by_id(self, option_id, value_id):
+        """Return the indexed ProductOptionValue with ID value_id or None."""
+        with self.lock:
+            return self._values.get(str(option_id), {}).get(str(value_id))
+
+    def add_value(self, option_id, value_id, value):
+        """
+        Add a newly created Product Option Value to the index.
+
+        The value is only added if the values of the option have been indexed, as
+        otherwise it is included when they are loaded.
+
+        Args:
+            option_id: ID of the Product Option.
+            value_id: ID of the new Product Option Value.
+            value: The new Product Option Value.
+
+        Returns: The indexed ccapi.cc_objects.ProductOptionValue or None.
+        """
+        with self.lock:
+            if not self.values_loaded(option_id):
+                return None
+            option = self.get_option_by_id(option_id)
+            option_value = ProductOptionValue(
+                {
+                    "ID": str(value_id),
+                    "OptionValue": value,
+                    "BrandID": None,
+                    "OptionID": option_id,
+                    "OptionValueTrans": value,
+                    "OptionsortOrder": None,
+                    "Selected": False,
+                    "ProductCount": 0,
+                    "OptionName": None if option is None else option.option_name,
+                }
+            )
+            self._values[str(option_id)][str(value_id)] = option_value
+            self._value_names[str(option_id)][self.normalise(value)] = option_value
+            return option_value
+
+    def remove_value(self, value_id):
+        """Remove a deleted Product Option Value from the index."""
+        with self.lock:
+            for option_id, values in self._values.items():
+                option_value = values.pop(str(value_id), None)
+                if option_value is None:
+                    continue
+                names = self._value_names[option_id]
+                name = self.normalise(option_value.value)
+                if names.get(name) is option_value:
+                    del names[name]
+
+    def clear(self, option_id=None):
+        """
+        Remove indexed options and values so they are loaded again when next used.
+
+        Kwargs:
+            option_id: If not None only the values of this Product Option are
+                removed. Default: None.
+        """
+        with self.lock:
+            if option_id is not None:
+                self._values.pop(str(option_id), None)
+                self._value_names.pop(str(option_id), None)
+                return
+            self._options = None
+            self._option_names = None
+            self._values.clear()
+            self._value_names.clear()
@@ -11,8 +11,9 @@ class GetOrderAddresses(APIRequest):
     """getOrderAddresses request."""
 
     uri = "/Handlers/OrderDetails/getOrderAddresses.ashx"
+    idempotent = True
 
-    def __new__(self, order_id, customer_id):
+    def __init__(self, order_id, customer_id):
         """Create getOrderAddresses request.
 
         args:
@@ -21,7 +22,7 @@ class GetOrderAddresses(APIRequest):
         """
         self.order_id = order_id
         self.customer_id = customer_id
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -34,7 +35,7 @@ class GetOrderAddresses(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        data = response.json()
+        data = self.decode_json(response)
         return Addresses(**data)
 
 
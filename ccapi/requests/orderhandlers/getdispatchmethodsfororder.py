@@ -13,12 +13,13 @@ class GetDispatchMethodsForOrder(APIRequest):
     """GetDispatchMethodsForOrder request."""
 
     uri = "/Handlers/OrderHandlers/GetDispatchMethodsForOrder.ashx"
+    idempotent = True
 
-    def __new__(self, order_id, analyse=True):
+    def __init__(self, order_id, analyse=True):
         """Create GetDispatchMethodsForOrder request."""
         self.order_id = order_id
         self.analyse = True
-        return super().__new__(self)
+        super().__init__()
 
     def get_params(self):
         """Get parameters for get request."""
@@ -26,7 +27,7 @@ class GetDispatchMethodsForOrder(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        data = response.json()
+        data = self.decode_json(response)
         return DispatchMethods(data)
 
 
@@ -6,6 +6,9 @@ Get orders ready for dispatch.
 
 import datetime
 
+from ccapi.cc_objects import retained_json
+from ccapi.timestamps import parse_timestamp
+
 from ..apirequest import APIRequest
 
 
@@ -13,8 +16,11 @@ class GetOrdersForDispatch(APIRequest):
     """getOrdersForDispatch request."""
 
     uri = "/Handlers/OrderHandlers/getOrdersForDispatch.ashx"
+    skip_argument = "skip_records"
+    take_argument = "take_limit"
+    idempotent = True
 
-    def __new__(
+    def __init__(
         self,
         date=None,
         order_type=1,
@@ -43,8 +49,15 @@ class GetOrdersForDispatch(APIRequest):
         take_limit=200,
         skip_records=0,
         issue_orders=False,
+        lazy=False,
     ):
-        """Create getOrdersForDispatch request."""
+        """
+        Create getOrdersForDispatch request.
+
+        Kwargs:
+            lazy: If True LazyDispatchOrder views are returned, which decode their
+                attributes when first accessed. Default: False.
+        """
         if date is None:
             self.date = datetime.datetime.now()
         else:
@@ -75,7 +88,8 @@ class GetOrdersForDispatch(APIRequest):
         self.take_limit = take_limit
         self.skip_records = skip_records
         self.issue_orders = issue_orders
-        return super().__new__(self)
+        self.lazy = lazy
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -125,13 +139,73 @@ class GetOrdersForDispatch(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        data = response.json()
-        return [DispatchOrder(order_data) for order_data in data]
+        data = self.decode_json(response)
+        order_class = LazyDispatchOrder if self.lazy else DispatchOrder
+        return [order_class(order_data) for order_data in data]
 
 
 class DispatchOrder:
     """Order for dispatch."""
 
+    __slots__ = (
+        "json",
+        "order_id",
+        "is_pick_list_printed",
+        "priority",
+        "customer_id",
+        "login_id",
+        "company_name",
+        "trading_name",
+        "date_recieved",
+        "dispatch_date",
+        "note",
+        "pick_list_printed",
+        "total_gross",
+        "total_gross_gbp",
+        "default_cs_rule_id",
+        "default_rule_cost_gbp",
+        "default_cs_rule_name",
+        "cancelled",
+        "unpaied",
+        "items_left_to_dispatch",
+        "items_count",
+        "intended_for_courier",
+        "predicted_order_weight",
+        "channel_name",
+        "external_order_type_name",
+        "sales_channel_name",
+        "country_code",
+        "delivery_country_code",
+        "delivery_name",
+        "delivery_name_from_udf",
+        "address_conflict",
+        "delilvery_address",
+        "delivery_user_id",
+        "has_unallocated_items",
+        "can_process_order",
+        "on_watch_list",
+        "watch_list_reason",
+        "pick_status",
+        "external_transaction_id",
+        "esimated_delivery_days",
+        "products",
+        "factory_ids",
+        "is_exported",
+        "exported_date",
+        "delivery_date",
+        "dispatch_order_by",
+        "delivery_from",
+        "delivery_to",
+        "ranged_delivery",
+        "customer_type",
+        "rule_base_weight",
+        "creation_date",
+        "hide_until_date",
+        "tracking_code",
+        "assigned_to_warehouse_id",
+        "item_summary",
+    )
+
     def __init__(self, data=None):
         """
         Create DispatchOrder.
@@ -144,7 +218,7 @@ class DispatchOrder:
 
     def load_from_request(self, data):
         """Set attributes based on data from getOrdersForDispatch request."""
-        self.json = data
+        self.json = retained_json(data)
         self.order_id = data["OrderID"]
         self.is_pick_list_printed = data["isPickListPrinted"]
         self.priority = data["Priority"]
@@ -203,21 +277,47 @@ class DispatchOrder:
 
     def to_datetime(self, date_time_string):
         """Return recieved date string as datetime.datetime object."""
-        date, time = date_time_string.split(" ")
-        day, month, year = date.split("/")
-        hour, minute = time.split(":")
-        return datetime.datetime(
-            day=int(day),
-            month=int(month),
-            year=int(year),
-            hour=int(hour),
-            minute=int(minute),
-        )
+        return parse_timestamp(date_time_string)
 
 
 class DispatchOrderProduct:
     """Product associated with an order ready for dispatch."""
 
+    __slots__ = (
+        "json",
+        "id",
+        "price",
+        "customer_order_id",
+        "product_id",
+        "product_range_id",
+        "product_name",
+        "product_full_name",
+        "barcode",
+        "image_url",
+        "customer_id",
+        "customer_name",
+        "pending_dispatch",
+        "sku",
+        "quantity",
+        "dispatched",
+        "allocated",
+        "can_process_item",
+        "amount_sent_to_channel",
+        "expected_delivery_date",
+        "item_handling_time",
+        "parent_product_id",
+        "parent_product_range_id",
+        "parent_product_name",
+        "order_item_product_type",
+        "current_stock_level",
+        "per_item_weight",
+        "gift_message",
+        "bay_locations",
+        "listing_id",
+        "pick_from_wearehouse_by_id",
+        "pick_from_warehouse_id",
+    )
+
     def __init__(self, data=None):
         """
         Create DispatchOrderProduct.
@@ -231,7 +331,7 @@ class DispatchOrderProduct:
 
     def load_from_request(self, data):
         """Set attributes based on data from DispatchOrderProduct request."""
-        self.json = data
+        self.json = retained_json(data)
         self.id = data["intID"]
         self.price = float(data["strPrice"])
         self.customer_order_id = data["strCustomerOrderID"]
@@ -263,3 +363,170 @@ class DispatchOrderProduct:
         self.listing_id = data["ListingID"]
         self.pick_from_wearehouse_by_id = data["PickFromWarehouseBayId"]
         self.pick_from_warehouse_id = data["PickFromWarehouseId"]
+
+
+class _LazyField:
+    """
+    Attribute of a lazy view decoded from its JSON when first accessed.
+
+    The decoded value is stored in the slot of the same name defined by the
+    class the view extends.
+
+    Args:
+        key: The key of the value in the JSON.
+
+    Kwargs:
+        convert: The name of a method of the view converting the value, or None
+            if it is used unchanged. Default: None.
+    """
+
+    def __init__(self, key, convert=None):
+        """Create a lazy field."""
+        self.key = key
+        self.convert = convert
+
+    def __set_name__(self, owner, name):
+        self.slot = next(
+            vars(base)[name] for base in owner.__mro__[1:] if name in vars(base)
+        )
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            pass
+        value = instance._data[self.key]
+        if self.convert is not None:
+            value = getattr(instance, self.convert)(value)
+        self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+
+class LazyDispatchOrder(DispatchOrder):
+    """
+    View of an order for dispatch which decodes attributes when first accessed.
+
+    The products of the order are created when the products attribute is first
+    used and are LazyDispatchOrderProduct views. Creating the view only stores
+    the order data, so it is much faster than creating a DispatchOrder when few
+    attributes of each order are used. The view keeps the order data for as long
+    as it exists.
+    """
+
+    __slots__ = ("_data",)
+
+    order_id = _LazyField("OrderID")
+    is_pick_list_printed = _LazyField("isPickListPrinted")
+    priority = _LazyField("Priority")
+    customer_id = _LazyField("CustomerID")
+    login_id = _LazyField("LoginID")
+    company_name = _LazyField("CompanyName")
+    trading_name = _LazyField("TradingName")
+    date_recieved = _LazyField("DateReceived", convert="to_datetime")
+    dispatch_date = _LazyField("DispatchDate", convert="to_datetime")
+    note = _LazyField("Note")
+    pick_list_printed = _LazyField("PickListPrinted")
+    total_gross = _LazyField("TotalGross")
+    total_gross_gbp = _LazyField("TotalGrossGBP")
+    default_cs_rule_id = _LazyField("DefaultCSRuleId")
+    default_rule_cost_gbp = _LazyField("DefaultCSRuleCostGBP")
+    default_cs_rule_name = _LazyField("DefaultCSRuleName")
+    cancelled = _LazyField("Cancelled")
+    unpaied = _LazyField("Unpaid")
+    items_left_to_dispatch = _LazyField("ItemsLeftToDispatch")
+    items_count = _LazyField("ItemsCount")
+    intended_for_courier = _LazyField("IntendedForCourier")
+    predicted_order_weight = _LazyField("PredictedOrderWeight")
+    channel_name = _LazyField("ChannelName")
+    external_order_type_name = _LazyField("ExternalOrderTypeName")
+    sales_channel_name = _LazyField("SalesChannelName")
+    country_code = _LazyField("countrycode")
+    delivery_country_code = _LazyField("deliverycountrycode")
+    delivery_name = _LazyField("DeliveryName")
+    delivery_name_from_udf = _LazyField("DeliveryNameFromUDF")
+    address_conflict = _LazyField("AddressConflict")
+    delilvery_address = _LazyField("DeliveryAddress")
+    delivery_user_id = _LazyField("DeliveryUserID")
+    has_unallocated_items = _LazyField("HasUnallocatedItems")
+    can_process_order = _LazyField("CanProcessOrder")
+    on_watch_list = _LazyField("OnWatchList")
+    watch_list_reason = _LazyField("WatchListReason")
+    pick_status = _LazyField("PickStatus")
+    external_transaction_id = _LazyField("ExternalTransactionID")
+    esimated_delivery_days = _LazyField("EstDeliveryDays")
+    products = _LazyField("Products", convert="_load_products")
+    factory_ids = _LazyField("FactoryIds")
+    is_exported = _LazyField("IsExported")
+    exported_date = _LazyField("ExportedDate")
+    delivery_date = _LazyField("DeliveryDate")
+    dispatch_order_by = _LazyField("DispatchOrderBy")
+    delivery_from = _LazyField("DeliveryFrom")
+    delivery_to = _LazyField("DeliveryTo")
+    ranged_delivery = _LazyField("RangedDelivery")
+    customer_type = _LazyField("CustomerType")
+    rule_base_weight = _LazyField("RuleBaseWeight")
+    creation_date = _LazyField("CreationDate")
+    hide_until_date = _LazyField("HideUntilDate")
+    tracking_code = _LazyField("TrackingCode")
+    assigned_to_warehouse_id = _LazyField("AssignedToWarehouseId")
+    item_summary = _LazyField("ItemSummary")
+
+    def load_from_request(self, data):
+        """Store data from getOrdersForDispatch request."""
+        self.json = retained_json(data)
+        self._data = data
+
+    def _load_products(self, products):
+        return [LazyDispatchOrderProduct(product) for product in products]
+
+
+class LazyDispatchOrderProduct(DispatchOrderProduct):
+    """View of a DispatchOrderProduct which decodes attributes when first accessed."""
+
+    __slots__ = ("_data",)
+
+    id = _LazyField("intID")
+    price = _LazyField("strPrice", convert="_parse_price")
+    customer_order_id = _LazyField("strCustomerOrderID")
+    product_id = _LazyField("strProductID")
+    product_range_id = _LazyField("strProductRangeID")
+    product_name = _LazyField("strProductName")
+    product_full_name = _LazyField("strProductFullName")
+    barcode = _LazyField("strBarCodeNumber")
+    image_url = _LazyField("strImageUrl")
+    customer_id = _LazyField("CustomerID")
+    customer_name = _LazyField("CustomerName")
+    pending_dispatch = _LazyField("pendingDispatch")
+    sku = _LazyField("SKU")
+    quantity = _LazyField("Quantity")
+    dispatched = _LazyField("Dispatched")
+    allocated = _LazyField("Allocated")
+    can_process_item = _LazyField("CanProcessItem")
+    amount_sent_to_channel = _LazyField("AmountSentToChannel")
+    expected_delivery_date = _LazyField("ExpectedDeliveryDate")
+    item_handling_time = _LazyField("ItemHandlingTime")
+    parent_product_id = _LazyField("ParentProductID")
+    parent_product_range_id = _LazyField("ParentProductRangeID")
+    parent_product_name = _LazyField("ParentProductName")
+    order_item_product_type = _LazyField("OrderItemProductType")
+    current_stock_level = _LazyField("CurrentStockLevel")
+    per_item_weight = _LazyField("PerItemWeight")
+    gift_message = _LazyField("GiftMessage")
+    bay_locations = _LazyField("BayLocations")
+    listing_id = _LazyField("ListingID")
+    pick_from_wearehouse_by_id = _LazyField("PickFromWarehouseBayId")
+    pick_from_warehouse_id = _LazyField("PickFromWarehouseId")
+
+    def load_from_request(self, data):
+        """Store data from DispatchOrderProduct request."""
+        self.json = retained_json(data)
+        self._data = data
+
+    @staticmethod
+    def _parse_price(price):
+        return float(price)
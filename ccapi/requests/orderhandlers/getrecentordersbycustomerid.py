@@ -13,11 +13,12 @@ class GetRecentOrdersByCustomerID(APIRequest):
     CUSTOMER_ID = "intCustomerID"
 
     uri = "Handlers/OrderHandlers/getRecentOrdersByCustomerID.ashx"
+    idempotent = True
 
-    def __new__(self, customer_ID):
+    def __init__(self, customer_ID):
         """Create getRecentOrdersByCustomerID request."""
         self.customer_ID = customer_ID
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -27,11 +28,12 @@ class GetRecentOrdersByCustomerID(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             f"Error retrieving recent orders for customer ID {self.customer_ID}.",
         )
-        return {str(order["ID"]): RecentOrder(order) for order in response.json()}
+        return {
+            str(order["ID"]): RecentOrder(order) for order in self.decode_json(response)
+        }
 
 
 class RecentOrder:
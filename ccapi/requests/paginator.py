@@ -0,0 +1,194 @@
+"""This module contains the Paginator class."""
+
+import collections
+import contextvars
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .ccapisession import CloudCommerceAPISession
+
+
+class _Page:
+    def __init__(self, skip, take, results, elapsed, size):
+        self.skip = skip
+        self.take = take
+        self.results = results
+        self.elapsed = elapsed
+        self.size = size
+
+
+class Paginator:
+    """
+    Lazily iterate over the results of a request which is paged by skip and take.
+
+    The request class must set skip_argument and take_argument to the names of
+    the arguments selecting the results to skip and the number to return.
+    Iteration stops after a page with fewer results than were requested, so no
+    request is made for an empty final page. For requests which may return fewer
+    results than were requested before the final page pass short_pages=True, so
+    the results skipped are advanced by the number received and iteration stops
+    at an empty page.
+
+    The page size is adjusted to the time taken to receive each page and its size
+    in bytes. It is halved, down to min_page_size, when a page takes longer than
+    target_page_time or is larger than max_page_bytes, and doubled, up to
+    max_page_size, when both are less than half their targets.
+
+    Args:
+        request_class: The ccapi.requests.APIRequest subclass to send.
+        *args, **kwargs: Arguments for the request.
+
+    Kwargs:
+        page_size: The number of results requested in the first page. If None the
+            take argument passed in kwargs or, if there is none, its default is
+            used. Default: None.
+        min_page_size: The smallest page size used. Default: 10.
+        max_page_size: The largest page size used. If None page_size is used.
+            Default: None.
+        target_page_time: The time in seconds each page should take.
+            Default: 5.
+        max_page_bytes: The largest response size in bytes wanted for a page.
+            Default: 2000000.
+        prefetch: The number of pages to request concurrently ahead of the page
+            being iterated over. Default: 0.
+        key: A callable returning a value identifying a result. If not None
+            results are yielded once and iteration stops after a page with no new
+            results. Default: None.
+        session: The ccapi.requests.CloudCommerceAPISession used to send requests.
+            If None the current session is used. Default: None.
+        short_pages: If True pages may hold fewer results than were requested.
+            Each page is requested after the previous page is received, so
+            prefetch is not used. Default: False.
+    """
+
+    MIN_PAGE_SIZE = 10
+    TARGET_PAGE_TIME = 5
+    MAX_PAGE_BYTES = 2_000_000
+
+    def __init__(
+        self,
+        request_class,
+        *args,
+        page_size=None,
+        min_page_size=MIN_PAGE_SIZE,
+        max_page_size=None,
+        target_page_time=TARGET_PAGE_TIME,
+        max_page_bytes=MAX_PAGE_BYTES,
+        prefetch=0,
+        key=None,
+        session=None,
+        short_pages=False,
+        **kwargs,
+    ):
+        """Create a paginator."""
+        if request_class.skip_argument is None or request_class.take_argument is None:
+            raise ValueError(f"{request_class.__name__} is not paged.")
+        self.request_class = request_class
+        self.args = args
+        kwargs.pop(request_class.skip_argument, None)
+        take = kwargs.pop(request_class.take_argument, None)
+        self.kwargs = kwargs
+        if page_size is None:
+            page_size = take
+        if page_size is None:
+            page_size = self.get_default_page_size(request_class)
+        self.page_size = page_size
+        self.min_page_size = min(min_page_size, page_size)
+        self.max_page_size = page_size if max_page_size is None else max_page_size
+        self.target_page_time = target_page_time
+        self.max_page_bytes = max_page_bytes
+        self.prefetch = prefetch
+        self.key = key
+        self.short_pages = short_pages
+        if session is None:
+            session = CloudCommerceAPISession.current()
+        self.session = session
+
+    @staticmethod
+    def get_default_page_size(request_class):
+        """Return the default value of the take argument of request_class."""
+        parameters = inspect.signature(request_class.__init__).parameters
+        return parameters[request_class.take_argument].default
+
+    def __iter__(self):
+        if self.short_pages:
+            return self._iter_short_pages()
+        return self._iter_pages()
+
+    def _iter_pages(self):
+        skip = 0
+        page_size = self.page_size
+        seen = set()
+        with ThreadPoolExecutor(
+            max_workers=self.prefetch + 1, thread_name_prefix="ccapi-pages"
+        ) as executor:
+
+            def submit():
+                nonlocal skip
+                context = contextvars.copy_context()
+                future = executor.submit(context.run, self._get_page, skip, page_size)
+                skip += page_size
+                return future
+
+            pending = collections.deque(submit() for _ in range(self.prefetch + 1))
+            try:
+                while pending:
+                    page = pending.popleft().result()
+                    new_results = self._new_results(page.results, seen)
+                    if len(page.results) < page.take or not new_results:
+                        yield from new_results
+                        return
+                    page_size = self.get_next_page_size(page_size, page)
+                    yield from new_results
+                    pending.append(submit())
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _iter_short_pages(self):
+        skip = 0
+        page_size = self.page_size
+        seen = set()
+        while True:
+            page = self._get_page(skip, page_size)
+            new_results = self._new_results(page.results, seen)
+            if not page.results or not new_results:
+                return
+            skip += len(page.results)
+            page_size = self.get_next_page_size(page_size, page)
+            yield from new_results
+
+    def get_next_page_size(self, page_size, page):
+        """Return the page size to use after receiving page."""
+        if page.elapsed > self.target_page_time or page.size > self.max_page_bytes:
+            return max(self.min_page_size, page_size // 2)
+        if (
+            page.elapsed < self.target_page_time / 2
+            and page.size < self.max_page_bytes / 2
+        ):
+            return min(self.max_page_size, page_size * 2)
+        return page_size
+
+    def _new_results(self, results, seen):
+        if self.key is None:
+            return list(results)
+        new_results = []
+        for result in results:
+            key = self.key(result)
+            if key not in seen:
+                seen.add(key)
+                new_results.append(result)
+        return new_results
+
+    def _get_page(self, skip, take):
+        kwargs = dict(self.kwargs)
+        kwargs[self.request_class.skip_argument] = skip
+        kwargs[self.request_class.take_argument] = take
+        request = self.request_class.prepare(*self.args, **kwargs)
+        started = time.perf_counter()
+        with self.session.activate():
+            results = request.send(session=self.session)
+        elapsed = time.perf_counter() - started
+        size = len(request.response.content or b"")
+        return _Page(skip, take, results, elapsed, size)
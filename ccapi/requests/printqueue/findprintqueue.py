@@ -4,7 +4,7 @@ FindPrintQueue request.
 Get the current contents of the Print Queue.
 """
 
-from datetime import datetime
+from ccapi.timestamps import parse_timestamp
 
 from ..apirequest import APIRequest
 
@@ -13,10 +13,11 @@ class FindPrintQueue(APIRequest):
     """GetProductsForRange request."""
 
     uri = "/Handlers/PrintQueue/FindPrintQueue.ashx"
+    idempotent = True
 
-    def __new__(self):
+    def __init__(self):
         """Create FindPrintQueue request."""
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -29,7 +30,7 @@ class FindPrintQueue(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        print_queue = [PrintQueueItem(item) for item in response.json()]
+        print_queue = [PrintQueueItem(item) for item in self.decode_json(response)]
         print_queue.sort()
         return print_queue
 
@@ -74,15 +75,4 @@ class PrintQueueItem:
 
     def to_datetime(self, date_time_string):
         """Convert Cloud Commerce date time string to datetime.datetime."""
-        date_string, time_string = date_time_string.split("T")
-        time_string = time_string.split(".")[0]
-        year, month, day = date_string.split("-")
-        hour, minute, second = time_string.split(":")
-        return datetime(
-            year=int(year),
-            month=int(month),
-            day=int(day),
-            hour=int(hour),
-            minute=int(minute),
-            second=int(second),
-        )
+        return parse_timestamp(date_time_string)
@@ -10,15 +10,16 @@ class ProductBarcodeInUse(APIRequest):
     """saveBarcode request class."""
 
     uri = "Handlers/ProductBarcode/ProductBarcodeInUse.ashx"
+    idempotent = True
 
-    def __new__(self, barcode):
+    def __init__(self, barcode):
         """Create saveBarcode request.
 
         Args:
             barcode: Barcode to set.
         """
         self.barcode = barcode
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -26,5 +27,5 @@ class ProductBarcodeInUse(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        self.raise_for_non_200(self, response, "Error checking if barcode is in use.")
-        return response.json()["Success"]
+        self.raise_for_non_200(response, "Error checking if barcode is in use.")
+        return self.decode_json(response)["Success"]
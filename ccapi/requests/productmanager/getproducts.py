@@ -13,8 +13,11 @@ class GetProducts(APIRequest):
     """GetProductsForRange request."""
 
     uri = "/Handlers/ProductManager/GetProducts.ashx"
+    skip_argument = "skip_records"
+    take_argument = "take_records"
+    idempotent = True
 
-    def __new__(
+    def __init__(
         self,
         search_text="",
         master_category_id=0,
@@ -73,7 +76,7 @@ class GetProducts(APIRequest):
         if self.option_matches_id is None:
             self.option_matches_id = 0
         self.multi_listings = multi_listings
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -112,7 +115,7 @@ class GetProducts(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        data = response.json()["Data"]
+        data = self.decode_json(response)["Data"]
         if data is None:
             return []
         return data
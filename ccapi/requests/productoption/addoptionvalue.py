@@ -7,8 +7,9 @@ class AddOptionValue(APIRequest):
     """Wrapper for AddOptionValueRequest."""
 
     uri = "Handlers/ProductOption/addOptionValue.ashx"
+    invalidates = {"GetOptionData": {"optid": "option_id"}}
 
-    def __new__(self, option_id, value):
+    def __init__(self, option_id, value):
         """
         Create AddOptionValue request.
 
@@ -18,7 +19,7 @@ class AddOptionValue(APIRequest):
         """
         self.option_id = option_id
         self.value = value
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
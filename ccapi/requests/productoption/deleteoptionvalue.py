@@ -11,15 +11,16 @@ class DeleteOptionValue(APIRequest):
     """deleteOptionValue request."""
 
     uri = "Handlers/ProductOption/deleteOptionValue.ashx"
+    invalidates = {"GetOptionData": None}
 
-    def __new__(self, value_id):
+    def __init__(self, value_id):
         """Create deleteOptionValue request.
 
         Args:
             value_id: ID of Product Option Value.
         """
         self.value_id = value_id
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
@@ -13,19 +13,21 @@ class GetOptionData(APIRequest):
     """Wrapper for GetOptionData request."""
 
     uri = "Handlers/ProductOption/getOptionData.ashx"
+    idempotent = True
+    cache_ttl = 900
 
-    def __new__(self, option_id):
+    def __init__(self, option_id):
         """Create GetOptionData request.
 
         Args:
             option_id: ID of option
         """
         self.option_id = option_id
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
-        results = response.json()
+        results = self.decode_json(response)
         return [ProductOptionValue(item) for item in results]
 
     def get_data(self):
@@ -12,10 +12,12 @@ class GetOptions(APIRequest):
     """Wrapper for GetOptions request."""
 
     uri = "Handlers/ProductOption/getOptions.ashx"
+    idempotent = True
+    cache_ttl = 900
 
     def process_response(self, response):
         """Handle request response."""
-        results = response.json()
+        results = self.decode_json(response)
         return ProductOptions([ProductOption(item) for item in results])
 
     def get_data(self):
@@ -12,8 +12,9 @@ class GetProductData(APIRequest):
     """Wrapper for GetProductData request."""
 
     uri = "Handlers/ProductOption/getProductData.ashx"
+    idempotent = True
 
-    def __new__(self, range_id, channel_id=0):
+    def __init__(self, range_id, channel_id=0):
         """Create GetProductData request.
 
         Args:
@@ -21,7 +22,7 @@ class GetProductData(APIRequest):
         """
         self.range_id = range_id
         self.channel_id = channel_id
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -33,7 +34,7 @@ class GetProductData(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        results = response.json()
+        results = self.decode_json(response)
         return GetProductDataResult(results)
 
 
@@ -13,7 +13,7 @@ class AddProduct(APIRequest):
 
     uri = "Handlers/Products/AddProduct.ashx"
 
-    def __new__(
+    def __init__(
         self, *, range_id, name, barcode, sku, description, vat_rate_id, hs_code=""
     ):
         """Create AddProduct request.
@@ -33,12 +33,12 @@ class AddProduct(APIRequest):
         self.description = description
         self.vat_rate_id = vat_rate_id
         self.hs_code = hs_code
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         error_message = 'Product "{}" was not created'.format(self.name)
-        self.raise_for_non_200(self, response, error_message)
+        self.raise_for_non_200(response, error_message)
         if "Success^^" in response.text:
             return response.text.split("^^")[1]
         raise CloudCommerceResponseError(error_message)
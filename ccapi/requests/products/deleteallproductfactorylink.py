@@ -11,12 +11,13 @@ class DeleteAllProductFactoryLink(APIRequest):
     """deleteAllProductFactoryLink request."""
 
     uri = "Handlers/Products/deleteAllProductFactoryLink.ashx"
+    invalidates = {"FindProductFactoryLinks": None}
 
-    def __new__(self, factory_id, corner_loader=True):
+    def __init__(self, factory_id, corner_loader=True):
         """Make deleteAllProductFactoryLink request."""
         self.factory_id = factory_id
         self.corner_loader = corner_loader
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -26,7 +27,6 @@ class DeleteAllProductFactoryLink(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             f"Factory links not deleted for factory with ID {self.factory_id}",
         )
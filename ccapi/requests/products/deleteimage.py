@@ -12,19 +12,19 @@ class DeleteImage(APIRequest):
 
     uri = "Handlers/Products/deleteImage.ashx"
 
-    def __new__(self, image_id):
+    def __init__(self, image_id):
         """Create deleteImage request.
 
         Args:
             image_id: ID of image to be deleted.
         """
         self.image_id = int(image_id)
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self, response, f"Image with ID {self.image_id} was not saved."
+            response, f"Image with ID {self.image_id} was not saved."
         )
         return response.text
 
@@ -11,11 +11,12 @@ class DeleteProductFactoryLink(APIRequest):
     """deleteProductFactoryLink request."""
 
     uri = "Handlers/Products/deleteProductFactoryLink.ashx"
+    invalidates = {"FindProductFactoryLinks": None}
 
-    def __new__(self, factory_link_id):
+    def __init__(self, factory_link_id):
         """Make deleteProductFactoryLink request."""
         self.factory_link_id = factory_link_id
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -24,7 +25,6 @@ class DeleteProductFactoryLink(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             'Factory link with ID "{}" was not deleted.'.format(self.factory_link_id),
         )
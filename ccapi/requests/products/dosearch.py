@@ -15,8 +15,9 @@ class DoSearch(APIRequest):
     SKU = "sku"
 
     uri = "Handlers/Products/doSearch.ashx"
+    idempotent = True
 
-    def __new__(self, text, channel_id=None, search_type=RANGE):
+    def __init__(self, text, channel_id=None, search_type=RANGE):
         """
         Create Do Search request.
 
@@ -33,14 +34,12 @@ class DoSearch(APIRequest):
         self.text = text
         self.channel_id = channel_id or ""
         self.search_type = search_type
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
-        self.raise_for_non_200(
-            self, response, 'Search for "{}" failed.'.format(self.text)
-        )
-        results = response.json()
+        self.raise_for_non_200(response, 'Search for "{}" failed.'.format(self.text))
+        results = self.decode_json(response)
         return [DoSearchResult(item) for item in results]
 
     def get_data(self):
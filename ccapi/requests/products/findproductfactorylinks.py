@@ -13,11 +13,12 @@ class FindProductFactoryLinks(APIRequest):
     """FindProductFactoryLinks request."""
 
     uri = "Handlers/Products/FindProductFactoryLinks.ashx"
+    idempotent = True
 
-    def __new__(self, product_id):
+    def __init__(self, product_id):
         """Make FindProductFactoryLinks request."""
         self.product_id = product_id
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -26,8 +27,7 @@ class FindProductFactoryLinks(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             'Error finding factory links for product ID "{}"'.format(self.product_id),
         )
-        return FactoryLinks([FactoryLink(link) for link in response.json()])
+        return FactoryLinks([FactoryLink(link) for link in self.decode_json(response)])
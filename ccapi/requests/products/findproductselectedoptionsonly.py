@@ -14,8 +14,9 @@ class FindProductSelectedOptionsOnly(APIRequest):
     """FindProductSelectedOptionsOnly request."""
 
     uri = "Handlers/Products/findProductSelectedOptionsOnly.ashx"
+    idempotent = True
 
-    def __new__(self, product_id, channel_id=0):
+    def __init__(self, product_id, channel_id=0):
         """
         Create FindProductSelectedOptionsOnly request.
 
@@ -24,7 +25,7 @@ class FindProductSelectedOptionsOnly(APIRequest):
         """
         self.product_id = product_id
         self.channel_id = channel_id
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -33,13 +34,12 @@ class FindProductSelectedOptionsOnly(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             'Error finding product information for product ID "{}"'.format(
                 self.product_id
             ),
         )
-        results = response.json()
+        results = self.decode_json(response)
         return FindProductSelectedOptionsOnlyResult(self.product_id, results)
 
 
@@ -11,8 +11,9 @@ class GetPendingStock(APIRequest):
     """
 
     uri = "Handlers/Products/GetPendingStock.ashx"
+    idempotent = True
 
-    def __new__(self, product_id):
+    def __init__(self, product_id):
         """
         Create GetPendingStock request.
 
@@ -20,18 +21,17 @@ class GetPendingStock(APIRequest):
             product_id: ID of Product to update.
         """
         self.product_id = product_id
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             'Error getting the pending stock level for product with ID "{}".'.format(
                 self.product_id
             ),
         )
-        return response.json()["TotalPending"]
+        return self.decode_json(response)["TotalPending"]
 
     def get_data(self):
         """Get data for request."""
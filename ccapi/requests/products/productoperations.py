@@ -7,13 +7,14 @@ class ProductOperations(APIRequest):
     """ProductOperations request."""
 
     uri = "Handlers/Products/ProductOperations.ashx"
+    coalescable = False
     GET_GENERATED_SKU = "getgeneratedsku"
     UPDATE_HS_CODE = "updatehscode"
 
     PRODUCT_IDS = "ProductIDs"
     HS_CODE = "HSCode"
 
-    def __new__(self, request_mode, product_IDs=[], HS_code=None):
+    def __init__(self, request_mode, product_IDs=[], HS_code=None):
         """Create ProductOperations request.
 
         Args:
@@ -23,7 +24,12 @@ class ProductOperations(APIRequest):
         self.request_mode = request_mode
         self.product_IDs = (product_IDs,)
         self.HS_code = HS_code
-        return super().__new__(self)
+        super().__init__()
+
+    @property
+    def idempotent(self):
+        """Return True if the request only generates an SKU."""
+        return self.request_mode == self.GET_GENERATED_SKU
 
     def get_headers(self):
         """Get headers for request."""
@@ -43,9 +49,9 @@ class ProductOperations(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self, response, "Product Operations request returned an error code."
+            response, "Product Operations request returned an error code."
         )
-        result = response.json()
+        result = self.decode_json(response)
         return ProductOperationsResult(result)
 
 
@@ -11,7 +11,7 @@ class SaveBarcode(APIRequest):
 
     uri = "Handlers/Products/saveBarcode.ashx"
 
-    def __new__(self, *, barcode, product_id):
+    def __init__(self, *, barcode, product_id):
         """Create saveBarcode request.
 
         Args:
@@ -20,12 +20,11 @@ class SaveBarcode(APIRequest):
         """
         self.barcode = barcode
         self.product_id = product_id
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             'Failed to save barcode for product with ID "{}"'.format(self.product_id),
         )
@@ -11,7 +11,7 @@ class SaveDescription(APIRequest):
 
     uri = "Handlers/Products/saveDescription.ashx"
 
-    def __new__(self, *, description, product_ids=[], channel_id=0):
+    def __init__(self, *, description, product_ids=[], channel_id=0):
         """Create saveDescription request.
 
         Args:
@@ -23,7 +23,7 @@ class SaveDescription(APIRequest):
         else:
             self.product_ids = [str(x) for x in product_ids]
         self.channel_id = channel_id
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for get request."""
@@ -41,7 +41,6 @@ class SaveDescription(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             'Error saving description for product IDs "{}".'.format(
                 ", ".join(self.product_ids)
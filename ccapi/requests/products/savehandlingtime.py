@@ -12,7 +12,7 @@ class SaveHandlingTime(APIRequest):
 
     uri = "Handlers/Products/saveHandlingTime.ashx"
 
-    def __new__(self, *, product_id, handling_time, update_channels=False):
+    def __init__(self, *, product_id, handling_time, update_channels=False):
         """
         Create saveHandlingTime request.
 
@@ -24,12 +24,11 @@ class SaveHandlingTime(APIRequest):
         self.product_id = product_id
         self.handling_time = handling_time
         self.update_channels = update_channels
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             'Error saving handling time for product ID "{}"'.format(self.product_id),
         )
@@ -12,7 +12,7 @@ class SaveProductName(APIRequest):
 
     uri = "Handlers/Products/saveProductName.ashx"
 
-    def __new__(self, *, name, product_ids):
+    def __init__(self, *, name, product_ids):
         """Create saveProductName request.
 
         Args:
@@ -25,7 +25,7 @@ class SaveProductName(APIRequest):
             self.product_ids = [str(product_ids)]
         else:
             self.product_ids = [str(x) for x in product_ids]
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -39,7 +39,6 @@ class SaveProductName(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             "Error saving name for product ID(s) {}".format(
                 ", ".join(self.product_ids)
@@ -12,7 +12,7 @@ class SetImageOrder(APIRequest):
 
     uri = "Handlers/Products/setImageOrder.ashx"
 
-    def __new__(self, *, product_id=None, image_ids=[]):
+    def __init__(self, *, product_id=None, image_ids=[]):
         """Create setImageOrder request.
 
         Kwargs:
@@ -21,12 +21,11 @@ class SetImageOrder(APIRequest):
         """
         self.product_id = product_id
         self.image_ids = [str(image_id) for image_id in image_ids]
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             f"Image order not saved for product with ID {self.product_id}.",
         )
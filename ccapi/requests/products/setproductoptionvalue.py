@@ -11,8 +11,9 @@ class SetProductOptionValue(APIRequest):
     """
 
     uri = "Handlers/Products/setProductOptionValue.ashx"
+    invalidates = {"FindProductSelectedOptionsOnly": {"ProductID": "product_ids"}}
 
-    def __new__(self, *, product_ids, option_id, option_value_id):
+    def __init__(self, *, product_ids, option_id, option_value_id):
         """
         Create setProductOptionValue request.
 
@@ -27,12 +28,11 @@ class SetProductOptionValue(APIRequest):
             self.product_ids = [str(x) for x in product_ids]
         self.option_id = option_id
         self.option_value_id = option_value_id
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             (
                 'Error setting product option value with ID "{}" for product '
@@ -15,7 +15,7 @@ class SetProductScope(APIRequest):
 
     uri = "Handlers/Products/setProductScope.ashx"
 
-    def __new__(
+    def __init__(
         self,
         *,
         product_id,
@@ -46,12 +46,11 @@ class SetProductScope(APIRequest):
         self.width = width
         self.large_letter_compatible = large_letter_compatible
         self.external_id = external_id
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             'Error setting product scope for product with ID "{}".'.format(
                 self.product_id
@@ -18,7 +18,7 @@ class SetProductType(APIRequest):
     STANDARD = 0
     MULTIPACK = 1
 
-    def __new__(self, *, product_id, type):
+    def __init__(self, *, product_id, type):
         """
         Create setProductType request.
 
@@ -35,12 +35,11 @@ class SetProductType(APIRequest):
         """
         self.product_id = product_id
         self.type = type
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             'Error setting product type for "{}".'.format(self.product_id),
         )
@@ -12,7 +12,7 @@ class UpdateCountryOfOrigin(APIRequest):
 
     uri = "Handlers/Products/updateCountryOfOrigin.ashx"
 
-    def __new__(self, *, product_id, country_id):
+    def __init__(self, *, product_id, country_id):
         """
         Create updateCountryOfOrigin request.
 
@@ -22,12 +22,11 @@ class UpdateCountryOfOrigin(APIRequest):
         """
         self.product_id = product_id
         self.country_id = country_id
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             'Error setting country of origin for product with ID "{}".'.format(
                 self.product_id
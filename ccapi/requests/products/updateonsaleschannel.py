@@ -12,7 +12,7 @@ class UpdateProductOnSalesChannel(APIRequest):
 
     uri = "Handlers/Products/updateOnSalesChannel.ashx"
 
-    def __new__(
+    def __init__(
         self,
         *,
         request_type,
@@ -44,19 +44,18 @@ class UpdateProductOnSalesChannel(APIRequest):
         self.value_1 = value_1
         self.value_2 = value_2
         self.channels = channels
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             (
                 "Sales Channel not updated for product"
                 f'ID(s) {", ".join(self.product_ids)}'
             ),
         )
-        return response.json()
+        return self.decode_json(response)
 
     def get_data(self):
         """Get data for request."""
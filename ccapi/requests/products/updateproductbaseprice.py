@@ -12,7 +12,7 @@ class UpdateProductBasePrice(APIRequest):
 
     uri = "Handlers/Products/updateProductBasePrice.ashx"
 
-    def __new__(self, *, product_id, price):
+    def __init__(self, *, product_id, price):
         """
         Create updateProductBasePrice request.
 
@@ -22,12 +22,11 @@ class UpdateProductBasePrice(APIRequest):
         """
         self.product_id = product_id
         self.price = price
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             'Error setting base price for product with ID "{}".'.format(
                 self.product_id
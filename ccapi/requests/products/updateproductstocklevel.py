@@ -10,8 +10,9 @@ class UpdateProductStockLevel(APIRequest):
     """UpdateProductStockLevel request."""
 
     uri = "Handlers/Products/UpdateProductStockLevel.ashx"
+    invalidates = {"FindProductSelectedOptionsOnly": {"ProductID": "product_id"}}
 
-    def __new__(self, *, product_id, new_stock_level, old_stock_level):
+    def __init__(self, *, product_id, new_stock_level, old_stock_level):
         """
         Create UpdateProductStockLevel request.
 
@@ -23,7 +24,7 @@ class UpdateProductStockLevel(APIRequest):
         self.product_id = product_id
         self.new_stock_level = new_stock_level
         self.old_stock_level = old_stock_level
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -37,7 +38,6 @@ class UpdateProductStockLevel(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             'Error updating stock level for prouduct with ID "{}".'.format(
                 self.product_id
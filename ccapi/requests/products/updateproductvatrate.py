@@ -11,7 +11,7 @@ class UpdateProductVatRate(APIRequest):
 
     uri = "Handlers/Products/updateProductVatRate.ashx"
 
-    def __new__(self, *, product_ids, vat_rate_id):
+    def __init__(self, *, product_ids, vat_rate_id):
         """
         Create updateProductVatRate request.
 
@@ -24,7 +24,7 @@ class UpdateProductVatRate(APIRequest):
         else:
             self.product_ids = [str(x) for x in product_ids]
         self.vat_rate_id = int(vat_rate_id)
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -36,7 +36,6 @@ class UpdateProductVatRate(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             'Error saving VAT rate for product IDs "{}".'.format(
                 ", ".join(self.product_ids)
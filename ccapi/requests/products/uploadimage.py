@@ -15,7 +15,7 @@ class UploadImage(APIRequest):
     uri = "Handlers/Products/uploadImage.ashx"
     SUCCESS_RESULT = "OK"
 
-    def __new__(self, *, product_ids, image_file, channel_ids=[]):
+    def __init__(self, *, product_ids, image_file, channel_ids=[]):
         """Create uploadImage request.
 
         Kwargs:
@@ -29,18 +29,17 @@ class UploadImage(APIRequest):
             self.product_ids = [str(x) for x in product_ids]
         self.channel_ids = [str(channel_id) for channel_id in channel_ids]
         self.image_file = image_file
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             'Error saving image for product ID(s) "{}".'.format(
                 ", ".join(self.product_ids)
             ),
         )
-        response_data = response.json()
+        response_data = self.decode_json(response)
         if response_data.get("result") == self.SUCCESS_RESULT:
             return response_data
         raise CloudCommerceResponseError(
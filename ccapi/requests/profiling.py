@@ -0,0 +1,200 @@
+"""This module contains classes for timing and profiling Cloud Commerce requests.
+
+Sending an APIRequest is split into four phases: building the request payload,
+network I/O, decoding the response JSON with APIRequest.decode_json and
+processing the response into objects.
+Request hooks are called with a PhaseTiming after each phase completes.
+"""
+
+import contextlib
+import contextvars
+import cProfile
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+
+BUILD = "build"
+NETWORK = "network"
+DECODE = "decode"
+PROCESS = "process"
+PHASES = (BUILD, NETWORK, DECODE, PROCESS)
+
+_active_hooks = contextvars.ContextVar("ccapi_request_hooks", default=())
+
+
+@contextlib.contextmanager
+def request_hooks(*hooks):
+    """Call hooks with each PhaseTiming of requests made within the context."""
+    token = _active_hooks.set(_active_hooks.get() + hooks)
+    try:
+        yield
+    finally:
+        _active_hooks.reset(token)
+
+
+def get_active_hooks():
+    """Return the request hooks added with request_hooks."""
+    return _active_hooks.get()
+
+
+class PhaseTiming:
+    """
+    The time taken by one phase of a request.
+
+    Args:
+        request: The ccapi.requests.APIRequest.
+        phase: The name of the phase.
+        duration: The time taken in seconds.
+    """
+
+    def __init__(self, request, phase, duration):
+        """Create a phase timing."""
+        self.request = request
+        self.phase = phase
+        self.duration = duration
+
+    @property
+    def request_name(self):
+        """Return the name of the request class."""
+        return type(self.request).__name__
+
+    def __repr__(self):
+        return f"<PhaseTiming {self.request_name} {self.phase} {self.duration:.6f}s>"
+
+
+class RequestTimer:
+    """
+    Time the phases of a request and report them to hooks.
+
+    If there are no hooks nothing is timed.
+
+    Args:
+        request: The ccapi.requests.APIRequest being sent.
+        hooks: Callables to call with each PhaseTiming.
+    """
+
+    def __init__(self, request, hooks):
+        """Create a request timer."""
+        self.request = request
+        self.hooks = tuple(hooks)
+        self.decode_time = 0
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Time the code run within the context as phase name."""
+        if not self.hooks:
+            yield
+            return
+        decode_time = self.decode_time
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            if name == DECODE:
+                self.decode_time += duration
+            elif name == PROCESS:
+                duration -= self.decode_time - decode_time
+            self.report(name, duration)
+
+    def report(self, phase, duration):
+        """Call each hook with the timing of phase."""
+        timing = PhaseTiming(self.request, phase, duration)
+        for hook in self.hooks:
+            hook(timing)
+
+
+class RequestProfiler:
+    """
+    Profile the requests made within a context.
+
+    Phase timings are collected for every request made in the context, including
+    those made by BulkExecutor and AsyncCCAPI worker threads. Optionally cProfile
+    statistics for the calling thread and tracemalloc memory statistics are
+    collected too.
+
+    Kwargs:
+        cprofile: If True profile the calling thread with cProfile. Default: False.
+        memory: If True trace memory allocations with tracemalloc. Default: False.
+
+    Example:
+        with RequestProfiler(cprofile=True) as profiler:
+            CCAPI.get_orders_for_dispatch()
+        print(profiler.report())
+    """
+
+    def __init__(self, *, cprofile=False, memory=False):
+        """Create a request profiler."""
+        self.cprofile = cprofile
+        self.memory = memory
+        self.timings = []
+        self.profile = None
+        self.memory_snapshot = None
+        self.peak_memory = None
+        self._lock = threading.Lock()
+        self._hooks = None
+        self._started_tracemalloc = False
+
+    def __enter__(self):
+        self._hooks = request_hooks(self.record)
+        self._hooks.__enter__()
+        if self.memory:
+            self._started_tracemalloc = not tracemalloc.is_tracing()
+            if self._started_tracemalloc:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        if self.cprofile:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        return self
+
+    def __exit__(self, *args):
+        if self.profile is not None:
+            self.profile.disable()
+        if self.memory:
+            self.memory_snapshot = tracemalloc.take_snapshot()
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+        self._hooks.__exit__(*args)
+
+    def record(self, timing):
+        """Add a PhaseTiming to the profile."""
+        with self._lock:
+            self.timings.append(timing)
+
+    def summary(self):
+        """
+        Return the total time spent in each phase by each request class.
+
+        Returns: dict of request class name to a dict of phase name to a dict
+            containing "count" and "total".
+        """
+        summary = {}
+        with self._lock:
+            timings = list(self.timings)
+        for timing in timings:
+            phases = summary.setdefault(timing.request_name, {})
+            phase = phases.setdefault(timing.phase, {"count": 0, "total": 0})
+            phase["count"] += 1
+            phase["total"] += timing.duration
+        return summary
+
+    def report(self, limit=20):
+        """Return a text report of the profile."""
+        lines = [f"{'Request':<40}" + "".join(f"{p:>12}" for p in PHASES)]
+        for request_name, phases in sorted(self.summary().items()):
+            totals = [phases.get(phase, {"total": 0})["total"] for phase in PHASES]
+            lines.append(f"{request_name:<40}" + "".join(f"{t:>12.4f}" for t in totals))
+        if self.profile is not None:
+            stream = io.StringIO()
+            stats = pstats.Stats(self.profile, stream=stream)
+            stats.sort_stats("cumulative").print_stats(limit)
+            lines.append(stream.getvalue())
+        if self.memory_snapshot is not None:
+            lines.append(f"Peak traced memory: {self.peak_memory} bytes")
+            for stat in self.memory_snapshot.statistics("lineno")[:limit]:
+                lines.append(str(stat))
+        return "\n".join(lines)
@@ -14,7 +14,7 @@ class Customer(ProgramTypeRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        super().process_response(self, response)
+        super().process_response(response)
         return response.text
 
 
@@ -22,6 +22,8 @@ class GetPaymentTerms(Customer):
     """Request to get payment term options."""
 
     PROGRAM_TYPE = "GetPaymentTerms"
+    idempotent = True
+    cache_ttl = 86400
 
     PAY_TERM_ID = "PayTermID"
 
@@ -59,7 +61,7 @@ class UpdateCustomerAddress(Customer):
 
     error_message = "Failed to add or update a customer address."
 
-    def __new__(
+    def __init__(
         self,
         *,
         customer_id,
@@ -116,6 +118,7 @@ class UpdateCustomerAddress(Customer):
             (str) Body text from the HTTP response.
 
         """
+        super().__init__()
         self.kwargs[self.CUSTOMER_ID] = customer_id
         self.kwargs[self.ADDRESS_TYPE] = address_type
         self.kwargs[self.COMPANY_NAME] = company_name
@@ -133,4 +136,3 @@ class UpdateCustomerAddress(Customer):
         self.kwargs[self.ADDRESS_ID] = address_id
         self.kwargs[self.CUSTOMER_ADD_LINK_ID] = customer_add_link_id
         self.kwargs[self.EMAIL] = email
-        return super().__new__(self)
@@ -16,8 +16,8 @@ class GetSimpleProductPackage(ProgramTypeRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        super().process_response(self, response)
-        return response.json()
+        super().process_response(response)
+        return self.decode_json(response)
 
 
 class SaveSimplePackage(GetSimpleProductPackage):
@@ -30,7 +30,7 @@ class SaveSimplePackage(GetSimpleProductPackage):
 
     error_message = "Failed to create multipack."
 
-    def __new__(self, multipack_product_id, *items):
+    def __init__(self, multipack_product_id, *items):
         """
         Set multipack items for a multipack product.
 
@@ -53,9 +53,9 @@ class SaveSimplePackage(GetSimpleProductPackage):
         )
         self.kwargs = {
             self.MULTIPACK_PRODUCT_ID: self.items[0].product_id,
-            self.DEFINITION: self.create_definition(self, self.items),
+            self.DEFINITION: self.create_definition(self.items),
         }
-        return super().__new__(self)
+        super().__init__()
 
     def create_definition(self, items):
         """
@@ -80,18 +80,21 @@ class GetSimplePackage(GetSimpleProductPackage):
     """Return multipack information for a multipack product."""
 
     PROGRAM_TYPE = "GetSimplePackage"
+    idempotent = True
 
     error_message = "Failed to get multipack item information."
 
     MULTIPACK_PRODUCT_ID = "ProductID"
 
-    def __new__(self, multipack_product_id):
+    def __init__(self, multipack_product_id):
         """Return multipack information for a multipack product."""
         self.multipack_product_id = multipack_product_id
         self.kwargs = {self.MULTIPACK_PRODUCT_ID: self.multipack_product_id}
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
-        super().process_response(self, response)
-        return MultipackInfo.load_json(self.multipack_product_id, response.json())
+        super().process_response(response)
+        return MultipackInfo.load_json(
+            self.multipack_product_id, self.decode_json(response)
+        )
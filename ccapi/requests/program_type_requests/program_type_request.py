@@ -11,11 +11,11 @@ class ProgramTypeRequest(APIRequest):
     kwargs = {}
     error_message = f"Error making request to {uri}"
 
-    def __new__(self, program_type=None, **kwargs):
+    def __init__(self, program_type=None, **kwargs):
         """Create addCustomer request."""
         self.program_type = program_type or self.PROGRAM_TYPE
-        self.kwargs = kwargs or self.kwargs
-        return super().__new__(self)
+        self.kwargs = dict(kwargs or self.kwargs)
+        super().__init__()
 
     def get_data(self):
         """Get data for get request."""
@@ -25,4 +25,4 @@ class ProgramTypeRequest(APIRequest):
 
     def process_response(self, response):
         """Handle request response."""
-        self.raise_for_non_200(self, response, self.error_message)
+        self.raise_for_non_200(response, self.error_message)
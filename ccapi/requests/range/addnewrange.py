@@ -12,7 +12,7 @@ class AddNewRange(APIRequest):
 
     uri = "Handlers/Range/addNewRange.ashx"
 
-    def __new__(
+    def __init__(
         self, *, range_name, sku, end_of_line=0, group_all_items=0, pre_order=0
     ):
         """Create AddNewRange request.
@@ -32,12 +32,12 @@ class AddNewRange(APIRequest):
         self.end_of_line = end_of_line
         self.group_all_items = group_all_items
         self.pre_order = pre_order
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self, response, f'Error creating product range "{self.range_name}"'
+            response, f'Error creating product range "{self.range_name}"'
         )
         return response.text
 
@@ -14,7 +14,7 @@ class AddRemProductOption(APIRequest):
     ADD = "add"
     REMOVE = "rem"
 
-    def __new__(self, *, range_id, option_id, add=False, remove=False):
+    def __init__(self, *, range_id, option_id, add=False, remove=False):
         """Create AddRemProductOption request.
 
         Args:
@@ -32,7 +32,7 @@ class AddRemProductOption(APIRequest):
             self.action = self.ADD
         else:
             self.action = self.REMOVE
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -58,4 +58,4 @@ class AddRemProductOption(APIRequest):
         error_message = (
             f'Product Option not updated for product range with ID "{self.range_id}"'
         )
-        self.raise_for_non_200(self, response, error_message)
+        self.raise_for_non_200(response, error_message)
@@ -13,15 +13,16 @@ class CheckRangesOnSalesChannel(APIRequest):
     """checkRangesOnSalesChannel request."""
 
     uri = "Handlers/Range/checkRangesOnSalesChannel.ashx"
+    idempotent = True
 
-    def __new__(self, range_id):
+    def __init__(self, range_id):
         """Create checkRangesOnSalesChannel request.
 
         Args:
             range_id: ID of Product Range.
         """
         self.range_id = range_id
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -31,11 +32,10 @@ class CheckRangesOnSalesChannel(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             (
                 "Error getting sales channels for product range with "
                 f'ID "{self.range_id}"'
             ),
         )
-        return [SalesChannel(channel) for channel in response.json()]
+        return [SalesChannel(channel) for channel in self.decode_json(response)]
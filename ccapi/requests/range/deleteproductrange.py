@@ -12,14 +12,14 @@ class DeleteProductRange(APIRequest):
 
     uri = "Handlers/Range/deleteProductRange.ashx"
 
-    def __new__(self, range_id):
+    def __init__(self, range_id):
         """Create deleteProductRange request.
 
         Args:
             range_id: ID of range.
         """
         self.range_id = range_id
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -33,5 +33,5 @@ class DeleteProductRange(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self, response, f'Product Range with ID "{self.range_id}" was not deleted.'
+            response, f'Product Range with ID "{self.range_id}" was not deleted.'
         )
@@ -12,7 +12,7 @@ class SetOptionSelect(APIRequest):
 
     uri = "Handlers/Range/setOptionSelect.ashx"
 
-    def __new__(self, *, range_id, option_id, drop_down):
+    def __init__(self, *, range_id, option_id, drop_down):
         """Create setOptionSelect request.
 
         Args:
@@ -23,7 +23,7 @@ class SetOptionSelect(APIRequest):
         self.range_id = range_id
         self.option_id = option_id
         self.drop_down = bool(drop_down)
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -37,7 +37,6 @@ class SetOptionSelect(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             (
                 "Product Option drop down setting was not set for Product "
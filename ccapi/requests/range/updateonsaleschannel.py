@@ -12,7 +12,7 @@ class UpdateRangeOnSalesChannel(APIRequest):
 
     uri = "Handlers/Range/updateOnSalesChannel.ashx"
 
-    def __new__(
+    def __init__(
         self, *, range_id, request_type, act, value=None, option_id=None, channel_ids=[]
     ):
         """Create updateOnSalesChannel request.
@@ -33,7 +33,7 @@ class UpdateRangeOnSalesChannel(APIRequest):
             self.value = str(value)
         self.option_id = option_id
         self.channel_ids = channel_ids
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -51,7 +51,6 @@ class UpdateRangeOnSalesChannel(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             (
                 "Sales channel not updated for Product Range with "
@@ -14,7 +14,7 @@ class UpdateRangeSettings(APIRequest):
 
     uri = "Handlers/Range/updateRangeSettings.ashx"
 
-    def __new__(
+    def __init__(
         self,
         *,
         range_id,
@@ -60,7 +60,7 @@ class UpdateRangeSettings(APIRequest):
         self.new_pre_order = new_pre_order
         self.new_group_items = new_group_items
         self.channels = channels
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -84,7 +84,6 @@ class UpdateRangeSettings(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self,
             response,
             (
                 "Range settings not updated for Product Range with "
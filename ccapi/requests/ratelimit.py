@@ -0,0 +1,187 @@
+"""This module contains classes for limiting the rate of Cloud Commerce requests."""
+
+import hashlib
+import os
+import threading
+import time
+
+from ccapi.exceptions import CloudCommerceDeadlineExceededError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket.
+
+    Tokens are added at rate tokens per second up to capacity. Acquiring a token
+    waits until one is available.
+
+    Args:
+        rate: The number of tokens added per second.
+
+    Kwargs:
+        capacity: The maximum number of tokens held, which is the largest burst of
+            requests allowed. If None rate is used, with a minimum of one.
+            Default: None.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """Create a token bucket."""
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be greater than zero.")
+        self.rate = rate
+        self.capacity = capacity or max(1, rate)
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def acquire(self, tokens=1, deadline=None):
+        """
+        Wait until tokens are available and remove them from the bucket.
+
+        Kwargs:
+            tokens: The number of tokens to remove. Default: 1.
+            deadline: The time.monotonic value after which not to wait. If None
+                there is no limit. Default: None.
+
+        Returns: True if the tokens were removed, or False if they would not be
+            available before deadline.
+        """
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def try_acquire(self, tokens=1):
+        """Remove tokens if available and return 0, otherwise the time to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = self._take(self._tokens, self._updated, now, tokens)
+            self._updated = now
+            return wait
+
+    def _take(self, available, updated, now, tokens):
+        available = min(self.capacity, available + (now - updated) * self.rate)
+        if available >= tokens:
+            return available - tokens, 0
+        return available, (tokens - available) / self.rate
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket shared between processes through a lock file.
+
+    The bucket state is stored in path and updated while holding an exclusive lock
+    on the file, so every process using the same path shares the same tokens.
+
+    Args:
+        path: The path of the file holding the bucket state.
+        rate: The number of tokens added per second.
+
+    Kwargs:
+        capacity: The maximum number of tokens held. If None rate is used, with a
+            minimum of one. Default: None.
+    """
+
+    def __init__(self, path, rate, capacity=None):
+        """Create a file backed token bucket."""
+        if fcntl is None:  # pragma: no cover
+            raise RuntimeError("File based rate limiting requires fcntl.")
+        super().__init__(rate, capacity=capacity)
+        self.path = str(path)
+
+    def try_acquire(self, tokens=1):
+        """Remove tokens if available and return 0, otherwise the time to wait."""
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                now = time.time()
+                available, updated = self._read_state(fd, now)
+                available, wait = self._take(available, updated, now, tokens)
+                self._write_state(fd, available, now)
+                return wait
+            finally:
+                os.close(fd)
+
+    def _read_state(self, fd, now):
+        os.lseek(fd, 0, os.SEEK_SET)
+        try:
+            available, updated = os.read(fd, 64).decode().split()
+            return float(available), float(updated)
+        except ValueError:
+            return self.capacity, now
+
+    def _write_state(self, fd, available, now):
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{available!r} {now!r}".encode())
+
+
+class RateLimiter:
+    """
+    Limit the rate of requests globally and for individual endpoints.
+
+    A RateLimiter can be shared by any number of threads and sessions. If directory
+    is given the token buckets are stored in files in that directory so the limits
+    are shared by every process using it.
+
+    Kwargs:
+        rate: The maximum number of requests per second to all endpoints. If None
+            there is no global limit. Default: None.
+        capacity: The largest burst of requests allowed by the global limit. If
+            None rate is used. Default: None.
+        endpoint_limits: A dict of request URIs to the maximum number of requests
+            per second to that URI, or a tuple of (rate, capacity). Default: None.
+        directory: A directory in which to store token buckets shared between
+            processes. If None buckets are shared between threads only.
+            Default: None.
+    """
+
+    def __init__(self, rate=None, capacity=None, endpoint_limits=None, directory=None):
+        """Create a rate limiter."""
+        self.directory = directory
+        self.global_bucket = None
+        if rate is not None:
+            self.global_bucket = self.create_bucket("global", rate, capacity)
+        self.endpoint_buckets = {}
+        for uri, limit in (endpoint_limits or {}).items():
+            if not isinstance(limit, (tuple, list)):
+                limit = (limit, None)
+            key = self.normalise_uri(uri)
+            self.endpoint_buckets[key] = self.create_bucket(key, *limit)
+
+    @staticmethod
+    def normalise_uri(uri):
+        """Return uri in the form used to look up endpoint limits."""
+        return uri.strip("/").lower()
+
+    def create_bucket(self, name, rate, capacity=None):
+        """Return a token bucket for name."""
+        if self.directory is None:
+            return TokenBucket(rate, capacity=capacity)
+        filename = hashlib.sha1(name.encode()).hexdigest() + ".bucket"
+        return FileTokenBucket(
+            os.path.join(self.directory, filename), rate, capacity=capacity
+        )
+
+    def acquire(self, uri, deadline=None):
+        """
+        Wait until a request may be made to uri.
+
+        Raises ccapi.exceptions.CloudCommerceDeadlineExceededError without waiting
+        if the request could not be made before deadline, a time.monotonic value.
+        """
+        for bucket in (
+            self.endpoint_buckets.get(self.normalise_uri(uri)),
+            self.global_bucket,
+        ):
+            if bucket is not None and not bucket.acquire(deadline=deadline):
+                raise CloudCommerceDeadlineExceededError(uri)
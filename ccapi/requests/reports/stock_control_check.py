@@ -4,10 +4,10 @@ StockControlCheck request.
 Creates a stock control report for a product range.
 """
 
-import datetime as dt
-
 from bs4 import BeautifulSoup
 
+from ccapi.timestamps import parse_timestamp
+
 from ..apirequest import APIRequest
 
 
@@ -15,8 +15,10 @@ class StockControlCheck(APIRequest):
     """AddNewRange request."""
 
     uri = "Handlers/Reports/StockControlCheck.ashx"
+    idempotent = True
+    read_timeout = 120
 
-    def __new__(self, *, range_id):
+    def __init__(self, *, range_id):
         """Create StockControlCheck request.
 
         Args:
@@ -24,12 +26,12 @@ class StockControlCheck(APIRequest):
 
         """
         self.range_id = range_id
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
         self.raise_for_non_200(
-            self, response, f'Error creating stock control check "{self.range_id}"'
+            response, f'Error creating stock control check "{self.range_id}"'
         )
         try:
             return _StockControlReport(response.text)
@@ -60,7 +62,7 @@ class _StockControlReportEntry:
         self.title = column_values[0]
         self.sku = column_values[1]
         self.reason = column_values[2]
-        self.date = self._parse_date(column_values[3])
+        self.date = parse_timestamp(column_values[3])
         self.quantity = int(column_values[4])
         self.dispatched = int(column_values[5])
         self.order_number = (
@@ -74,10 +76,6 @@ class _StockControlReportEntry:
             return font_tag.text.strip()
         return html.text.strip()
 
-    def _parse_date(self, date_string):
-        day, month, year = date_string.split("/")
-        return dt.datetime(day=int(day), month=int(month), year=int(year))
-
 
 class _StockControlReport:
     def __init__(self, report_html):
@@ -0,0 +1,120 @@
+"""This module contains the RetryPolicy class."""
+
+import http
+import random
+import time
+
+import requests
+
+
+class RetryPolicy:
+    """
+    Policy for retrying failed Cloud Commerce requests.
+
+    Requests are retried after a connection error, a read timeout or a response with
+    a status code in retry_statuses. The delay before each retry grows exponentially
+    from backoff_factor up to max_backoff and, if jitter is True, a random delay
+    between zero and that value is used. No retry is made once max_elapsed seconds
+    have passed since the first attempt or if it could not start before the
+    request's deadline.
+
+    Only requests whose idempotent attribute is True are retried unless
+    retry_non_idempotent is True or retrying is requested for a request when it is
+    sent.
+
+    Kwargs:
+        max_attempts: The maximum number of attempts, including the first.
+            Default: 3.
+        backoff_factor: The delay in seconds before the first retry. Default: 0.5.
+        max_backoff: The maximum delay in seconds between attempts. Default: 30.
+        max_elapsed: The maximum time in seconds after the first attempt at which a
+            retry may be started. Default: 60.
+        jitter: If True a random delay up to the backoff is used. Default: True.
+        retry_statuses: Response status codes which will be retried.
+            Default: (500, 502, 503, 504).
+        retry_non_idempotent: If True requests that are not idempotent will also be
+            retried. Default: False.
+    """
+
+    RETRY_STATUSES = (500, 502, 503, 504)
+    RETRY_EXCEPTIONS = (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.ChunkedEncodingError,
+        requests.exceptions.ReadTimeout,
+        http.client.RemoteDisconnected,
+    )
+
+    def __init__(
+        self,
+        *,
+        max_attempts=3,
+        backoff_factor=0.5,
+        max_backoff=30,
+        max_elapsed=60,
+        jitter=True,
+        retry_statuses=RETRY_STATUSES,
+        retry_non_idempotent=False,
+    ):
+        """Create a retry policy."""
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_elapsed = max_elapsed
+        self.jitter = jitter
+        self.retry_statuses = tuple(retry_statuses)
+        self.retry_non_idempotent = retry_non_idempotent
+
+    @classmethod
+    def no_retry(cls):
+        """Return a policy which never retries."""
+        return cls(max_attempts=1)
+
+    def allows_retry(self, request, retry=None):
+        """
+        Return True if request may be retried.
+
+        Args:
+            request: The ccapi.requests.APIRequest being sent.
+
+        Kwargs:
+            retry: If True or False overrides the idempotency of the request.
+                Default: None.
+        """
+        if retry is not None:
+            return retry
+        return bool(getattr(request, "idempotent", False)) or self.retry_non_idempotent
+
+    def is_retryable(self, *, response=None, exception=None):
+        """Return True if the response or exception is a transient failure."""
+        if exception is not None:
+            return isinstance(exception, self.RETRY_EXCEPTIONS)
+        return response is not None and response.status_code in self.retry_statuses
+
+    def get_backoff(self, attempt):
+        """Return the delay in seconds before retrying after attempt."""
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return backoff
+
+    def get_retry_delay(self, attempt, started, deadline=None):
+        """
+        Return the delay before the next attempt or None if no retry can be made.
+
+        Args:
+            attempt: The number of attempts made so far.
+            started: The time.monotonic value when the first attempt started.
+
+        Kwargs:
+            deadline: The time.monotonic value by which the request must be
+                complete. If None there is no deadline. Default: None.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        backoff = self.get_backoff(attempt)
+        retry_at = time.monotonic() + backoff
+        if retry_at - started > self.max_elapsed:
+            return None
+        if deadline is not None and retry_at >= deadline:
+            return None
+        return backoff
@@ -11,11 +11,12 @@ class GetProductChannelLinks(APIRequest):
     """getProductChannelLinks request."""
 
     uri = "/Handlers/SalesChannels/getProductChannelLinks.ashx"
+    idempotent = True
 
-    def __new__(self, product_id=None):
+    def __init__(self, product_id=None):
         """Make UpdProductFactoryLink request."""
         self.product_id = product_id
-        return super().__new__(self)
+        super().__init__()
 
     def get_data(self):
         """Get data for request."""
@@ -24,4 +25,4 @@ class GetProductChannelLinks(APIRequest):
     def process_response(self, response):
         """Handle request response."""
         response.raise_for_status()
-        return response.json()
+        return self.decode_json(response)
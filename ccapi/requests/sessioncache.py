@@ -0,0 +1,96 @@
+"""This module contains the SessionCache class."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class SessionCache:
+    """
+    Store logged in session cookies on disk so they can be reused by other processes.
+
+    Each login is stored in its own file, keyed by domain and username, with the
+    time of the login and the time at which it expires. Files are only readable by
+    the current user.
+
+    Kwargs:
+        directory: The directory in which to store sessions. If None
+            ~/.cache/ccapi is used. Default: None.
+    """
+
+    DEFAULT_DIRECTORY = os.path.join("~", ".cache", "ccapi")
+
+    def __init__(self, directory=None):
+        """Create a session cache."""
+        if directory is None:
+            directory = os.path.expanduser(self.DEFAULT_DIRECTORY)
+        self.directory = str(directory)
+
+    def get_path(self, domain, username):
+        """Return the path of the cache file for a domain and username."""
+        key = hashlib.sha256(f"{domain}\n{username}".encode()).hexdigest()
+        return os.path.join(self.directory, f"session-{key}.json")
+
+    def load(self, domain, username):
+        """
+        Return a cached login for domain and username if one exists and is valid.
+
+        Returns: dict containing "cookies", "last_login" and "expires" or None.
+        """
+        path = self.get_path(domain, username)
+        try:
+            with open(path, "r") as cache_file:
+                cached = json.load(cache_file)
+            cached["last_login"] = datetime.fromisoformat(cached["last_login"])
+            cached["expires"] = datetime.fromisoformat(cached["expires"])
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring invalid session cache file {path}: {e}")
+            return None
+        if cached["expires"] <= datetime.now():
+            return None
+        return cached
+
+    def save(self, domain, username, *, cookies, last_login, expires):
+        """Store a login for domain and username."""
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        cached = {
+            "domain": domain,
+            "username": username,
+            "cookies": [self.serialise_cookie(cookie) for cookie in cookies],
+            "last_login": last_login.isoformat(),
+            "expires": expires.isoformat(),
+        }
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as cache_file:
+                json.dump(cached, cache_file)
+            os.replace(temp_path, self.get_path(domain, username))
+        except Exception:
+            os.unlink(temp_path)
+            raise
+
+    def invalidate(self, domain, username):
+        """Remove any cached login for domain and username."""
+        try:
+            os.unlink(self.get_path(domain, username))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def serialise_cookie(cookie):
+        """Return a dict of the attributes of a http.cookiejar.Cookie."""
+        return {
+            "name": cookie.name,
+            "value": cookie.value,
+            "domain": cookie.domain,
+            "path": cookie.path,
+            "secure": cookie.secure,
+            "expires": cookie.expires,
+        }
@@ -13,16 +13,19 @@ class FindWarehouse(APIRequest):
     """FindWarehouse request."""
 
     uri = "Handlers/Warehouse/FindWarehouse.ashx"
+    idempotent = True
+    cache_ttl = 3600
 
-    def __new__(self, prog_type="normal"):
+    def __init__(self, prog_type="normal"):
         """Create FindWarehouse request."""
         self.prog_type = prog_type
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
-        if response.json() is not None:
-            return Warehouses([Warehouse(warehouse) for warehouse in response.json()])
+        data = self.decode_json(response)
+        if data is not None:
+            return Warehouses([Warehouse(warehouse) for warehouse in data])
 
     def get_data(self):
         """Get data for request."""
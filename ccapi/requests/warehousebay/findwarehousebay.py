@@ -13,8 +13,10 @@ class FindWarehouseBay(APIRequest):
     """FindWarehouseBay request."""
 
     uri = "Handlers/WarehouseBay/FindWarehouseBay.ashx"
+    skip_argument = "skip_records"
+    take_argument = "take_limit"
 
-    def __new__(
+    def __init__(
         self,
         prog_type=None,
         operation=None,
@@ -32,15 +34,29 @@ class FindWarehouseBay(APIRequest):
         self.warehouse_bay_id = warehouse_bay_id
         self.skip_records = skip_records
         self.take_limit = take_limit
-        return super().__new__(self)
+        super().__init__()
+
+    @property
+    def idempotent(self):
+        """Return True if the request only reads warehouse bays."""
+        return self.prog_type == "normal" or self.operation == "productbays"
+
+    @property
+    def invalidates(self):
+        """Return the cached responses made stale by removing a warehouse bay."""
+        if self.operation != "removebay":
+            return {}
+        if self.warehouse_id is None:
+            return {"FindWarehouseBay": None}
+        return {"FindWarehouseBay": {"WarehouseId": "warehouse_id"}}
 
     def process_response(self, response):
         """Handle request response."""
         response.raise_for_status()
         if self.prog_type == "normal":
-            return [WarehouseBay(bay) for bay in response.json()]
+            return [WarehouseBay(bay) for bay in self.decode_json(response)]
         elif self.operation == "productbays":
-            return [WarehouseBay(bay) for bay in response.json()["Data"]]
+            return [WarehouseBay(bay) for bay in self.decode_json(response)["Data"]]
         else:
             return response
 
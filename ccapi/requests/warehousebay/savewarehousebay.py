@@ -11,8 +11,9 @@ class SaveWarehouseBay(APIRequest):
     """
 
     uri = "Handlers/WarehouseBay/SaveWarehouseBay.ashx"
+    invalidates = {"FindWarehouseBay": {"WarehouseId": "warehouse_id"}}
 
-    def __new__(
+    def __init__(
         self,
         warehouse_id,
         name,
@@ -40,7 +41,7 @@ class SaveWarehouseBay(APIRequest):
         self.status_id = status_id
         self.bay_id = bay_id
         self.add_object = add_object
-        return super().__new__(self)
+        super().__init__()
 
     def process_response(self, response):
         """Handle request response."""
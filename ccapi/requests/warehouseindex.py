@@ -0,0 +1,320 @@
+"""This module contains the WarehouseIndex class."""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import weakref
+
+from ccapi.cc_objects import Warehouse, WarehouseBay
+
+logger = logging.getLogger(__name__)
+
+_open_indexes = weakref.WeakSet()
+
+
+@atexit.register
+def _save_open_indexes():
+    for warehouse_index in list(_open_indexes):
+        try:
+            warehouse_index.close()
+        except Exception as e:
+            logger.exception(e)
+
+
+class WarehouseIndex:
+    """
+    In memory index of Warehouses and Warehouse Bays.
+
+    Warehouses are indexed by name and by ID, and the bays of each warehouse by
+    name and by ID. Warehouses and the bays of each warehouse are loaded once and
+    then updated as bays are added or deleted, so the index does not see changes
+    made by other sessions until it is cleared.
+
+    If path is not None the index is loaded from the file at path when it is
+    created and saved to it, so it can be reused between runs. Warehouses and bays
+    loaded from Cloud Commerce are saved immediately. Bays added or removed are
+    saved at most once every save_interval seconds. Unsaved changes are written
+    by save, by close, on leaving the index's context and when the interpreter
+    exits.
+
+    The lock attribute is a reentrant lock which callers hold while loading the
+    index or creating bays so concurrent callers do not repeat the work.
+
+    Kwargs:
+        path: The path of a file in which to store the index. If None the index
+            is only kept in memory. Default: None.
+        max_age: The time in seconds for which a stored index is used, measured
+            from when it was first populated. Stored indexes older than this are
+            ignored. If None stored indexes are always used. Default: None.
+        save_interval: The minimum time in seconds between saves made when the
+            index changes. If None changes are only saved by save or close.
+            Default: 60.
+    """
+
+    SAVE_INTERVAL = 60
+
+    def __init__(self, path=None, max_age=None, save_interval=SAVE_INTERVAL):
+        """Create a warehouse index."""
+        self.path = None if path is None else str(path)
+        self.max_age = max_age
+        self.save_interval = save_interval
+        self.lock = threading.RLock()
+        self._changed = False
+        self._saved_at = None
+        self._stored_bays = set()
+        self._warehouses = None
+        self._warehouse_names = None
+        self._bays = {}
+        self._bay_names = {}
+        self._created = None
+        if self.path is not None:
+            self.load()
+            _open_indexes.add(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def warehouses_loaded(self):
+        """Return True if Warehouses have been added to the index."""
+        return self._warehouses is not None
+
+    def set_warehouses(self, warehouses):
+        """Index an iterable of ccapi.cc_objects.Warehouse."""
+        with self.lock:
+            self._set_warehouses(warehouses)
+            self._changed = True
+            self.save()
+
+    def get_warehouses(self):
+        """Return a list of the indexed Warehouses."""
+        with self.lock:
+            return list((self._warehouses or {}).values())
+
+    def get_warehouse(self, warehouse_name):
+        """Return the indexed Warehouse named warehouse_name or None."""
+        with self.lock:
+            return (self._warehouse_names or {}).get(warehouse_name)
+
+    def get_warehouse_by_id(self, warehouse_id):
+        """Return the indexed Warehouse with ID warehouse_id or None."""
+        with self.lock:
+            return (self._warehouses or {}).get(str(warehouse_id))
+
+    def bays_loaded(self, warehouse_id):
+        """Return True if the bays of a Warehouse have been indexed."""
+        with self.lock:
+            return str(warehouse_id) in self._bays
+
+    def set_bays(self, warehouse_id, bays):
+        """Index an iterable of ccapi.cc_objects.WarehouseBay for a Warehouse."""
+        with self.lock:
+            self._set_bays(warehouse_id, bays)
+            self._stored_bays.discard(str(warehouse_id))
+            self._changed = True
+            self.save()
+
+    def bays_stored(self, warehouse_id):
+        """
+        Return True if the bays of a Warehouse were loaded from the stored index.
+
+        Stored bays may be missing bays created by other processes. Returns False
+        once the bays have been loaded from Cloud Commerce.
+        """
+        with self.lock:
+            return str(warehouse_id) in self._stored_bays
+
+    def get_bays(self, warehouse_id):
+        """Return a list of the indexed bays of a Warehouse."""
+        with self.lock:
+            return list(self._bays.get(str(warehouse_id), {}).values())
+
+    def get_bay(self, warehouse_id, bay_name):
+        """Return the indexed WarehouseBay named bay_name or None."""
+        with self.lock:
+            return self._bay_names.get(str(warehouse_id), {}).get(bay_name)
+
+    def get_bay_by_id(self, warehouse_id, bay_id):
+        """Return the indexed WarehouseBay with ID bay_id or None."""
+        with self.lock:
+            return self._bays.get(str(warehouse_id), {}).get(str(bay_id))
+
+    def add_bay(self, warehouse_id, bay):
+        """
+        Add a newly created Warehouse Bay to the index.
+
+        The bay is only added if the bays of the warehouse have been indexed, as
+        otherwise it is included when they are loaded.
+
+        Args:
+            warehouse_id: ID of the Warehouse.
+            bay: The new ccapi.cc_objects.WarehouseBay.
+        """
+        with self.lock:
+            if not self.bays_loaded(warehouse_id):
+                return
+            self._index_bay(warehouse_id, bay)
+            self._mark_changed()
+
+    def remove_bay(self, bay_id):
+        """Remove a deleted Warehouse Bay from the index."""
+        with self.lock:
+            removed = False
+            for warehouse_id, bays in self._bays.items():
+                bay = bays.pop(str(bay_id), None)
+                if bay is None:
+                    continue
+                removed = True
+                names = self._bay_names[warehouse_id]
+                if names.get(bay.name) is bay:
+                    del names[bay.name]
+            if removed:
+                self._mark_changed()
+
+    def clear(self, warehouse_id=None):
+        """
+        Remove indexed warehouses and bays so they are loaded again when next used.
+
+        Kwargs:
+            warehouse_id: If not None only the bays of this Warehouse are removed.
+                Default: None.
+        """
+        with self.lock:
+            if warehouse_id is not None:
+                if str(warehouse_id) not in self._bays:
+                    return
+                del self._bays[str(warehouse_id)]
+                self._bay_names.pop(str(warehouse_id), None)
+                self._stored_bays.discard(str(warehouse_id))
+            else:
+                if self._created is None:
+                    return
+                self._reset()
+            self._mark_changed()
+
+    def load(self):
+        """Load the index from path if it exists and is not older than max_age."""
+        with self.lock:
+            try:
+                with open(self.path, "r") as index_file:
+                    stored = json.load(index_file)
+                created = stored["created"]
+                if created is None:
+                    return
+                if self.max_age is not None and created + self.max_age <= time.time():
+                    return
+                self._created = created
+                warehouses = stored["warehouses"]
+                if warehouses is not None:
+                    self._set_warehouses([Warehouse(data) for data in warehouses])
+                for warehouse_id, bays in stored["bays"].items():
+                    self._set_bays(warehouse_id, [WarehouseBay(data) for data in bays])
+                    self._stored_bays.add(str(warehouse_id))
+            except FileNotFoundError:
+                return
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(
+                    f"Ignoring invalid warehouse index file {self.path}: {e}"
+                )
+                self._reset()
+
+    def save(self):
+        """Store the index at path if path is not None and it has changed."""
+        if self.path is None:
+            return
+        with self.lock:
+            if not self._changed:
+                return
+            stored = {
+                "created": self._created,
+                "warehouses": None,
+                "bays": {
+                    warehouse_id: [self._bay_json(bay) for bay in bays.values()]
+                    for warehouse_id, bays in self._bays.items()
+                },
+            }
+            if self._warehouses is not None:
+                stored["warehouses"] = [
+                    warehouse.json for warehouse in self._warehouses.values()
+                ]
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as index_file:
+                    json.dump(stored, index_file)
+                os.replace(temp_path, self.path)
+            except Exception:
+                os.unlink(temp_path)
+                raise
+            self._changed = False
+            self._saved_at = time.monotonic()
+
+    def close(self):
+        """Save any unsaved changes to the index."""
+        self.save()
+
+    def _mark_changed(self):
+        self._changed = True
+        if self.save_interval is None:
+            return
+        if (
+            self._saved_at is None
+            or time.monotonic() - self._saved_at >= self.save_interval
+        ):
+            self.save()
+
+    def _reset(self):
+        self._warehouses = None
+        self._warehouse_names = None
+        self._bays.clear()
+        self._bay_names.clear()
+        self._stored_bays.clear()
+        self._created = None
+
+    def _set_warehouses(self, warehouses):
+        if self._created is None:
+            self._created = time.time()
+        warehouses = list(warehouses)
+        self._warehouses = {str(warehouse.id): warehouse for warehouse in warehouses}
+        self._warehouse_names = {warehouse.name: warehouse for warehouse in warehouses}
+
+    def _set_bays(self, warehouse_id, bays):
+        if self._created is None:
+            self._created = time.time()
+        self._bays[str(warehouse_id)] = {}
+        self._bay_names[str(warehouse_id)] = {}
+        for bay in bays:
+            self._index_bay(warehouse_id, bay)
+
+    def _index_bay(self, warehouse_id, bay):
+        warehouse = self.get_warehouse_by_id(warehouse_id)
+        if warehouse is not None:
+            bay.warehouse = warehouse
+        self._bays[str(warehouse_id)][str(bay.id)] = bay
+        self._bay_names[str(warehouse_id)][bay.name] = bay
+
+    @staticmethod
+    def _bay_json(bay):
+        if bay.json is not None:
+            return bay.json
+        return {
+            "ID": bay.id,
+            "Name": bay.name,
+            "WarehouseID": bay.warehouse_id,
+            "BayNumber": bay.bay_number,
+            "Aisle": bay.aisle,
+            "Shelf": bay.shelf,
+            "AvailableStock": bay.available_stock,
+            "WarehouseBayType": bay.warehouse_bay_type,
+            "WarehouseBayTypeEnum": bay.warehouse_bay_type_enum,
+            "StatusId": bay.status_id,
+            "StatusIdEnum": bay.statud_id_enum,
+        }
@@ -0,0 +1,104 @@
+"""
+Parse the timestamps used by Cloud Commerce.
+
+Timestamps are returned by Cloud Commerce in these formats:
+    "05/11/2018 10:23": Day first, with an optional seconds field.
+    "05/11/2018": Day first date.
+    "2018-11-05T10:23:41.713": ISO 8601, with optional fractional seconds.
+    "2018-11-05": ISO 8601 date.
+
+The same timestamps are often repeated, for instance the dispatch dates of
+orders, so parsed timestamps are cached.
+"""
+
+import datetime
+import functools
+
+CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def parse_timestamp(timestamp_string):
+    """
+    Return a Cloud Commerce timestamp as datetime.datetime.
+
+    The most recently parsed CACHE_SIZE timestamps are cached. Fractional
+    seconds are kept to the nearest microsecond below.
+
+    Args:
+        timestamp_string: A timestamp in one of the formats in the module
+            docstring.
+
+    Raises:
+        ValueError: If the timestamp is not in a recognised format.
+    """
+    try:
+        if "/" in timestamp_string:
+            return _parse_day_first(timestamp_string)
+        return _parse_iso(timestamp_string)
+    except (ValueError, TypeError):
+        raise ValueError(f"Unrecognised timestamp {timestamp_string!r}.") from None
+
+
+def parse_timestamps(timestamp_strings):
+    """
+    Return a list of datetime.datetime for an iterable of timestamps.
+
+    Each distinct timestamp is parsed once.
+
+    Args:
+        timestamp_strings: Iterable of timestamps in the formats accepted by
+            parse_timestamp.
+
+    Raises:
+        ValueError: If a timestamp is not in a recognised format.
+    """
+    timestamp_strings = list(timestamp_strings)
+    parsed = {
+        timestamp_string: parse_timestamp(timestamp_string)
+        for timestamp_string in set(timestamp_strings)
+    }
+    return [parsed[timestamp_string] for timestamp_string in timestamp_strings]
+
+
+def _parse_day_first(timestamp_string):
+    if (
+        len(timestamp_string) == 16
+        and timestamp_string[2] == timestamp_string[5] == "/"
+        and timestamp_string[10] == " "
+        and timestamp_string[13] == ":"
+    ):
+        return datetime.datetime(
+            int(timestamp_string[6:10]),
+            int(timestamp_string[3:5]),
+            int(timestamp_string[0:2]),
+            int(timestamp_string[11:13]),
+            int(timestamp_string[14:16]),
+        )
+    date, _, time = timestamp_string.partition(" ")
+    day, month, year = date.split("/")
+    return _to_datetime(int(year), int(month), int(day), time)
+
+
+def _parse_iso(timestamp_string):
+    date, _, time = timestamp_string.partition("T")
+    year, month, day = date.split("-")
+    return _to_datetime(int(year), int(month), int(day), time)
+
+
+def _to_datetime(year, month, day, time):
+    if not time:
+        return datetime.datetime(year, month, day)
+    hour, minute, *seconds = time.split(":")
+    second = microsecond = 0
+    if seconds:
+        (seconds,) = seconds
+        seconds, _, fraction = seconds.partition(".")
+        second = int(seconds)
+        if fraction:
+            if not fraction.isdigit():
+                raise ValueError(fraction)
+            microsecond = int(fraction[:6].ljust(6, "0"))
+    return datetime.datetime(
+        year, month, day, int(hour), int(minute), second, microsecond
+    )
@@ -7,6 +7,7 @@ import urllib
 import requests_mock
 
 from ccapi.requests.ccapisession import CloudCommerceAPISession
+from ccapi.requests.retry import RetryPolicy
 
 
 class TestCCAPI(unittest.TestCase):
@@ -38,8 +39,10 @@ class TestCCAPI(unittest.TestCase):
     def set_mock_session(self):
         """Mount mock adapters to the session."""
         self.adapter = requests_mock.Adapter()
-        CloudCommerceAPISession.session.mount("https://", self.adapter)
-        CloudCommerceAPISession.session.mount("http://", self.adapter)
+        self.cc_session = CloudCommerceAPISession.current()
+        self.cc_session.retry_policy = RetryPolicy(backoff_factor=0)
+        self.cc_session.session.mount("https://", self.adapter)
+        self.cc_session.session.mount("http://", self.adapter)
         self.set_login_URIs()
 
     def set_login_URIs(self):
@@ -49,7 +52,7 @@ class TestCCAPI(unittest.TestCase):
 
     def mock_login(self):
         """Mock the login process."""
-        CloudCommerceAPISession.get_session(
+        self.cc_session.get_session(
             domain=self.DOMAIN, username=self.USERNAME, password=self.PASSWORD
         )
 
@@ -0,0 +1,90 @@
+"""Tests for AsyncCCAPI."""
+
+import asyncio
+import inspect
+
+from ccapi import CCAPI, AsyncCCAPI, cc_objects, requests
+from ccapi.requests import CloudCommerceAPISession
+
+from .. import test_data, test_requests
+from .test_CCAPI_class import TestCCAPIMethod
+
+
+class TestAsyncCCAPI(TestCCAPIMethod):
+    """Tests for AsyncCCAPI."""
+
+    SKU = test_requests.TestProductOperations.SKU
+    SKU_RESPONSE = test_requests.TestProductOperations.GENERATE_SKU_RESPONSE
+    RANGE_RESPONSE = test_data.GET_PRODUCTS_FOR_RANGE_RESPONSE
+
+    def setUp(self):
+        """Create an AsyncCCAPI using the mock adapter."""
+        super().setUp()
+        self.register_request(requests.ProductOperations, json=self.SKU_RESPONSE)
+        self.register_request(
+            requests.handlers.GetProductsForRange, json=self.RANGE_RESPONSE
+        )
+        self.session = CloudCommerceAPISession()
+        self.session.session.mount("http://", self.adapter)
+        self.api = AsyncCCAPI(
+            username=self.USERNAME,
+            password=self.PASSWORD,
+            domain=self.DOMAIN,
+            session=self.session,
+            max_concurrency=4,
+        )
+
+    def tearDown(self):
+        """Shut down the thread pool."""
+        self.api.close()
+
+    def test_mirrors_CCAPI_methods(self):
+        """Test that every public CCAPI method has a coroutine equivalent."""
+        for name, _ in inspect.getmembers(CCAPI, callable):
+            if not name.startswith("_"):
+                self.assertTrue(inspect.iscoroutinefunction(getattr(AsyncCCAPI, name)))
+
+    def test_logs_in(self):
+        """Test that the session is logged in on creation."""
+        self.assertIsNotNone(self.session.last_login)
+        self.assertEqual(self.session.domain, self.DOMAIN)
+
+    def test_method(self):
+        """Test that methods return the same value as CCAPI methods."""
+        self.assertEqual(asyncio.run(self.api.get_sku()), self.SKU)
+
+    def test_concurrent_calls(self):
+        """Test that many calls can be made concurrently."""
+
+        async def get_ranges():
+            return await asyncio.gather(*(self.api.get_range(i) for i in range(20)))
+
+        ranges = asyncio.run(get_ranges())
+        self.assertEqual(len(ranges), 20)
+        for product_range in ranges:
+            self.assertIsInstance(product_range, cc_objects.ProductRange)
+
+    def test_request(self):
+        """Test that request classes can be sent directly."""
+        response = asyncio.run(self.api.request(requests.ProductOperations, "getsku"))
+        self.assertEqual(response.data, self.SKU)
+
+    def test_uses_own_session(self):
+        """Test that calls are made with the AsyncCCAPI session."""
+        used_sessions = []
+        api_request = self.session.api_request
+
+        def record_session(request, **kwargs):
+            used_sessions.append(CloudCommerceAPISession.current())
+            return api_request(request, **kwargs)
+
+        self.session.api_request = record_session
+        asyncio.run(self.api.get_sku())
+        self.assertEqual(used_sessions, [self.session])
+
+    def test_returned_objects_use_own_session(self):
+        """Test that objects returned by calls use the AsyncCCAPI session."""
+        product_range = asyncio.run(self.api.get_range("4347654"))
+        self.assertIs(product_range.session, self.session)
+        for product in product_range.products:
+            self.assertIs(product.session, self.session)
@@ -4,10 +4,17 @@ import datetime
 import json
 import shutil
 import tempfile
+import urllib
 from decimal import Decimal
 from pathlib import Path
 
 from ccapi import CCAPI, NewOrderItem, VatRates, cc_objects, requests
+from ccapi.requests.orderhandlers.getordersfordispatch import (
+    DispatchOrder,
+    DispatchOrderProduct,
+    LazyDispatchOrder,
+    LazyDispatchOrderProduct,
+)
 
 from .. import test_data, test_requests
 from .test_CCAPI_class import TestCCAPIMethod
@@ -1858,6 +1865,187 @@ class Test_get_range_Method(TestCCAPIMethod):
         self.assertIsInstance(returned_value, cc_objects.ProductRange)
 
 
+class Test_get_ranges_Method(TestCCAPIMethod):
+    """Test the ccapi.CCAPI.get_ranges and ccapi.CCAPI.iter_ranges methods."""
+
+    RESPONSE = test_data.GET_PRODUCTS_FOR_RANGE_RESPONSE
+    RANGE_IDS = [11, 12, 11, 13, 12, 14]
+    PAGE_SIZE = 4
+
+    def setUp(self):
+        """Register request URIs."""
+        super().setUp()
+        self.register_uri(
+            "POST",
+            self.cloud_commerce_URI(requests.GetProducts.uri.lstrip("/")),
+            json=self.get_products_response,
+        )
+        self.register_request(
+            requests.handlers.GetProductsForRange, json=self.get_range_response
+        )
+
+    def get_products_response(self, request, context):
+        """Return a page of search results."""
+        data = urllib.parse.parse_qs(request.text)
+        search_options = json.loads(data["SearchOptions"][0])
+        skip = search_options["SkipRecords"]
+        range_ids = self.RANGE_IDS[skip : skip + search_options["TakeRecords"]]
+        return {"Data": [{"RangeId": range_id} for range_id in range_ids]}
+
+    def get_range_response(self, request, context):
+        """Return a product range with the requested ID."""
+        data = urllib.parse.parse_qs(request.text)
+        range_id = data[requests.handlers.GetProductsForRange.PRODUCT_RANGE_ID][0]
+        return dict(self.RESPONSE, ID=int(range_id))
+
+    def range_requests(self):
+        """Return the number of product ranges requested."""
+        uri = requests.handlers.GetProductsForRange.uri
+        return len([r for r in self.adapter.request_history if uri in r.url])
+
+    def test_get_ranges(self):
+        """Test that each matching range is returned once in search order."""
+        ranges = CCAPI.get_ranges(search_text="test", take_records=self.PAGE_SIZE)
+        self.assertEqual([r.id for r in ranges], [11, 12, 13, 14])
+        self.assertEqual(self.range_requests(), 4)
+
+    def test_iter_ranges_is_lazy(self):
+        """Test that no requests are made until ranges are iterated."""
+        request_count = len(self.adapter.request_history)
+        ranges = CCAPI.iter_ranges(
+            search_text="test", take_records=self.PAGE_SIZE, max_workers=2
+        )
+        self.assertEqual(len(self.adapter.request_history), request_count)
+        self.assertEqual(next(ranges).id, 11)
+
+    def test_iter_ranges_with_short_pages(self):
+        """Test that ranges are found when pages hold fewer results than requested."""
+        get_products_response = self.get_products_response
+
+        def short_page(request, context):
+            response = get_products_response(request, context)
+            return {"Data": response["Data"][:2]}
+
+        self.register_uri(
+            "POST",
+            self.cloud_commerce_URI(requests.GetProducts.uri.lstrip("/")),
+            json=short_page,
+        )
+        ranges = CCAPI.get_ranges(search_text="test", take_records=self.PAGE_SIZE)
+        self.assertEqual([r.id for r in ranges], [11, 12, 13, 14])
+
+    def test_iter_ranges_unordered(self):
+        """Test that unordered ranges contain every matching range."""
+        ranges = CCAPI.iter_ranges(
+            search_text="test", take_records=self.PAGE_SIZE, ordered=False
+        )
+        self.assertEqual(sorted(r.id for r in ranges), [11, 12, 13, 14])
+
+    def test_iter_ranges_raises_failed_requests(self):
+        """Test that exceptions raised requesting a range are raised."""
+        self.register_request(requests.handlers.GetProductsForRange, status_code=500)
+        with self.assertRaises(Exception), self.assertLogs("ccapi.bulk"):
+            list(CCAPI.iter_ranges(search_text="test"))
+
+    def test_get_products(self):
+        """Test that the products of each matching range are returned."""
+        products = CCAPI.get_products(search_text="test", take_records=self.PAGE_SIZE)
+        self.assertEqual(len(products), 4 * len(self.RESPONSE["Products"]))
+        self.assertIsInstance(products[0], cc_objects.Product)
+
+
+class Test_get_orders_for_dispatch_Method(TestCCAPIMethod):
+    """Test the get_orders_for_dispatch and iter_orders_for_dispatch methods."""
+
+    TAKE_LIMIT = 3
+    ORDER_IDS = [1, 2, 3, 3, 4, 5, 6, 7]
+
+    def setUp(self):
+        """Register request URI."""
+        super().setUp()
+        self.skips = []
+        self.register_uri(
+            "POST",
+            self.cloud_commerce_URI(
+                requests.orderhandlers.GetOrdersForDispatch.uri.lstrip("/")
+            ),
+            json=self.orders_response,
+        )
+
+    def orders_response(self, request, context):
+        """Return a page of orders."""
+        skip = int(request.headers["SkipRecords"])
+        take = int(request.headers["TakeLimit"])
+        self.skips.append(skip)
+        return [
+            dict(test_data.DISPATCH_ORDER, OrderID=order_id)
+            for order_id in self.ORDER_IDS[skip : skip + take]
+        ]
+
+    def test_get_orders_for_dispatch(self):
+        """Test that each order is returned once in page order."""
+        orders = CCAPI.get_orders_for_dispatch(take_limit=self.TAKE_LIMIT)
+        self.assertEqual([order.order_id for order in orders], [1, 2, 3, 4, 5, 6, 7])
+
+    def test_default_take_limit(self):
+        """Test that 200 orders are requested per page by default."""
+        CCAPI.get_orders_for_dispatch()
+        self.assertEqual(self.get_sent_request().headers["TakeLimit"], "200")
+
+    def test_iter_orders_for_dispatch_is_lazy(self):
+        """Test that pages are requested as orders are iterated."""
+        orders = CCAPI.iter_orders_for_dispatch(take_limit=self.TAKE_LIMIT)
+        self.assertEqual(self.skips, [])
+        self.assertEqual(next(orders).order_id, 1)
+        self.assertLessEqual(len(self.skips), 1 + CCAPI.PREFETCH_PAGES)
+        orders.close()
+
+    def test_prefetch(self):
+        """Test that pages are prefetched concurrently."""
+        orders = CCAPI.iter_orders_for_dispatch(take_limit=self.TAKE_LIMIT, prefetch=3)
+        self.assertEqual(len(list(orders)), 7)
+        self.assertEqual(sorted(self.skips)[:4], [0, 3, 6, 9])
+
+    def test_no_prefetch(self):
+        """Test that pages are requested one at a time without prefetching."""
+        orders = CCAPI.iter_orders_for_dispatch(take_limit=self.TAKE_LIMIT, prefetch=0)
+        self.assertEqual(len(list(orders)), 7)
+        self.assertEqual(self.skips, [0, 3, 6])
+
+    def test_lazy_orders(self):
+        """Test that lazy views are returned when lazy is True."""
+        orders = CCAPI.get_orders_for_dispatch(take_limit=self.TAKE_LIMIT, lazy=True)
+        self.assertEqual([order.order_id for order in orders], [1, 2, 3, 4, 5, 6, 7])
+        for order in orders:
+            self.assertIsInstance(order, LazyDispatchOrder)
+            self.assertIsInstance(order.products[0], LazyDispatchOrderProduct)
+        self.assertNotIn("lazy", self.get_sent_request_data())
+
+    def test_lazy_orders_match_orders(self):
+        """Test that lazy views have the same attributes as orders."""
+        order = DispatchOrder(test_data.DISPATCH_ORDER)
+        lazy_order = LazyDispatchOrder(test_data.DISPATCH_ORDER)
+        for name in DispatchOrder.__slots__:
+            if name != "products":
+                self.assertEqual(getattr(lazy_order, name), getattr(order, name), name)
+        for name in DispatchOrderProduct.__slots__:
+            self.assertEqual(
+                getattr(lazy_order.products[0], name),
+                getattr(order.products[0], name),
+                name,
+            )
+
+    def test_lazy_orders_decode_on_access(self):
+        """Test that lazy views decode each attribute once, when first accessed."""
+        data = dict(test_data.DISPATCH_ORDER)
+        order = LazyDispatchOrder(data)
+        data["Products"] = [dict(test_data.DISPATCH_ORDER_PRODUCT, SKU="XYZ")]
+        self.assertEqual(order.products[0].sku, "XYZ")
+        self.assertIs(order.products, order.products)
+        order.order_id = 10
+        self.assertEqual(order.order_id, 10)
+
+
 class Test_insert_payment_Method(TestCCAPIMethod):
     """Test the ccapi.CCAPI.get_range method."""
 
@@ -0,0 +1,96 @@
+"""Tests for bulk requests."""
+
+import urllib
+
+from ccapi import CCAPI, BulkExecutor, exceptions, requests
+
+from .test_CCAPI import TestCCAPI
+
+
+class TestBulkExecutor(TestCCAPI):
+    """Tests for ccapi.bulk.BulkExecutor."""
+
+    FAILING_PRODUCT_ID = "13"
+
+    def setUp(self):
+        """Register request URI."""
+        super().setUp()
+        self.register_request(
+            requests.products.GetPendingStock, json=self.pending_stock_response
+        )
+
+    def pending_stock_response(self, request, context):
+        """Return the product ID sent as the pending stock level."""
+        product_id = urllib.parse.parse_qs(request.text)["ProductID"][0]
+        if product_id == self.FAILING_PRODUCT_ID:
+            context.status_code = 500
+        return {"TotalPending": int(product_id)}
+
+    def test_ordered_results(self):
+        """Test that results are returned in input order."""
+        product_ids = [str(i) for i in range(30) if str(i) != self.FAILING_PRODUCT_ID]
+        results = list(CCAPI.map(CCAPI.get_pending_stock, product_ids, max_workers=4))
+        self.assertEqual([result.index for result in results], list(range(29)))
+        self.assertEqual(
+            [result.result for result in results], [int(i) for i in product_ids]
+        )
+        self.assertTrue(all(result.ok for result in results))
+
+    def test_unordered_results(self):
+        """Test that all results are returned when unordered."""
+        product_ids = [str(i) for i in range(30) if str(i) != self.FAILING_PRODUCT_ID]
+        results = list(
+            CCAPI.map(
+                CCAPI.get_pending_stock, product_ids, max_workers=4, ordered=False
+            )
+        )
+        self.assertEqual(
+            sorted(result.result for result in results),
+            sorted(int(i) for i in product_ids),
+        )
+
+    def test_request_class(self):
+        """Test that request classes can be used with keyword arguments."""
+        results = list(
+            CCAPI.map(
+                requests.products.GetPendingStock,
+                [{"product_id": "5"}, {"product_id": "6"}],
+            )
+        )
+        self.assertEqual([result.result for result in results], [5, 6])
+        self.assertEqual(results[0].arguments, {"product_id": "5"})
+
+    def test_errors_are_captured(self):
+        """Test that a failed call does not stop the batch."""
+        results = list(
+            CCAPI.map(CCAPI.get_pending_stock, ["1", self.FAILING_PRODUCT_ID, "2"])
+        )
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertIsInstance(
+            results[1].exception, exceptions.CloudCommerceResponseError
+        )
+        self.assertIsNone(results[1].result)
+        self.assertEqual(results[2].result, 2)
+
+    def test_positional_arguments(self):
+        """Test that tuples are passed as positional arguments."""
+        executor = BulkExecutor(max_workers=2)
+        results = list(executor.map(lambda a, b: a + b, [(1, 2), [3, 4]]))
+        self.assertEqual([result.result for result in results], [3, 7])
+
+    def test_uses_session(self):
+        """Test that calls are made with the executor's session."""
+        executor = BulkExecutor(session=self.cc_session)
+        results = list(
+            executor.map(lambda _: requests.CloudCommerceAPISession.current(), [1, 2])
+        )
+        self.assertEqual([result.result for result in results], [self.cc_session] * 2)
+
+    def test_deadline_applies_to_calls(self):
+        """Test that an active deadline applies to calls made by the executor."""
+        with requests.CloudCommerceAPISession.deadline(0):
+            results = list(CCAPI.map(CCAPI.get_pending_stock, ["1", "2"]))
+        for result in results:
+            self.assertIsInstance(
+                result.exception, exceptions.CloudCommerceDeadlineExceededError
+            )
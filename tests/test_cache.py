@@ -0,0 +1,341 @@
+"""Tests for caching responses to reference data requests."""
+
+import inspect
+import threading
+import time
+import unittest
+import urllib
+from concurrent.futures import ThreadPoolExecutor
+
+from ccapi import requests
+from ccapi.requests import ResponseCache, fresh_reads
+
+from . import test_data
+from .test_CCAPI import TestCCAPI
+
+
+class TestResponseCache(TestCCAPI):
+    """Tests for ccapi.requests.cache.ResponseCache."""
+
+    def setUp(self):
+        """Use a response cache."""
+        super().setUp()
+        self.cache = ResponseCache()
+        self.cc_session.response_cache = self.cache
+        self.option_data_requests = []
+        self.register_request(requests.GetOptionData, json=self.option_data_response)
+        self.register_request(
+            requests.products.GetPendingStock, json={"TotalPending": 3}
+        )
+
+    def tearDown(self):
+        """Remove the response cache."""
+        self.cc_session.response_cache = None
+
+    def option_data_response(self, request, context):
+        """Return option values for an option ID."""
+        option_id = urllib.parse.parse_qs(request.text)["optid"][0]
+        self.option_data_requests.append(option_id)
+        return [
+            {
+                "ID": option_id,
+                "OptionValue": "Red",
+                "BrandID": 341,
+                "OptionID": option_id,
+                "OptionValueTrans": None,
+                "OptionsortOrder": 0,
+                "Selected": False,
+                "ProductCount": 0,
+                "OptionName": "Colour",
+            }
+        ]
+
+    def request_count(self, request_class):
+        """Return the number of requests made to a request class's URI."""
+        return len(
+            [r for r in self.adapter.request_history if request_class.uri in r.url]
+        )
+
+    def test_responses_are_cached(self):
+        """Test that repeated requests use the cached response."""
+        first = requests.GetOptionData("1")
+        second = requests.GetOptionData("1")
+        self.assertEqual(self.option_data_requests, ["1"])
+        self.assertEqual(first[0].id, second[0].id)
+        self.assertIsNot(first[0], second[0])
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_keyed_by_arguments(self):
+        """Test that requests with different arguments are cached separately."""
+        requests.GetOptionData("1")
+        requests.GetOptionData("2")
+        requests.GetOptionData("1")
+        self.assertEqual(self.option_data_requests, ["1", "2"])
+
+    def test_requests_without_ttl_are_not_cached(self):
+        """Test that requests without a cache_ttl are not cached."""
+        requests.products.GetPendingStock("1")
+        requests.products.GetPendingStock("1")
+        self.assertEqual(self.request_count(requests.products.GetPendingStock), 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_ttl(self):
+        """Test that cached responses expire."""
+        self.cache.set_ttl(requests.GetOptionData, 0.1)
+        requests.GetOptionData("1")
+        time.sleep(0.15)
+        requests.GetOptionData("1")
+        self.assertEqual(self.option_data_requests, ["1", "1"])
+
+    def test_ttl_override_enables_caching(self):
+        """Test that a TTL can be set for classes without a cache_ttl."""
+        self.cache.set_ttl("GetPendingStock", 60)
+        requests.products.GetPendingStock("1")
+        requests.products.GetPendingStock("1")
+        self.assertEqual(self.request_count(requests.products.GetPendingStock), 1)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used responses are removed."""
+        self.cache.max_size = 2
+        requests.GetOptionData("1")
+        requests.GetOptionData("2")
+        requests.GetOptionData("1")
+        requests.GetOptionData("3")
+        requests.GetOptionData("1")
+        requests.GetOptionData("2")
+        self.assertEqual(self.option_data_requests, ["1", "2", "3", "2"])
+
+    def test_invalidate(self):
+        """Test that cached responses can be invalidated."""
+        requests.GetOptionData("1")
+        requests.GetOptionData("2")
+        self.assertEqual(self.cache.invalidate(requests.GetOptionData, {"optid": 1}), 1)
+        requests.GetOptionData("1")
+        requests.GetOptionData("2")
+        self.assertEqual(self.option_data_requests, ["1", "2", "1"])
+        self.assertEqual(self.cache.invalidate(requests.GetOptionData), 2)
+
+    def test_fresh_reads(self):
+        """Test that cached responses can be bypassed."""
+        requests.GetOptionData("1")
+        requests.GetOptionData.prepare("1").send(fresh=True)
+        with fresh_reads():
+            requests.GetOptionData("1")
+        self.assertEqual(self.option_data_requests, ["1", "1", "1"])
+
+    def test_failed_responses_are_not_cached(self):
+        """Test that error responses are not cached."""
+        self.register_request(requests.GetOptionData, status_code=404, json=[])
+        requests.GetOptionData("1")
+        self.assertEqual(len(self.cache), 0)
+
+
+class TestResponseCacheDefaults(unittest.TestCase):
+    """Test the request classes cached by default."""
+
+    def test_reference_data_classes_have_ttls(self):
+        """Test that reference data request classes are cacheable."""
+        for request_class in (
+            requests.GetOptions,
+            requests.GetOptionData,
+            requests.FindWarehouse,
+            requests.ShippingRules,
+            requests.FindFactories,
+            requests.GetPaymentTerms,
+            requests.PreEmployee,
+        ):
+            self.assertTrue(request_class.idempotent)
+            self.assertGreater(request_class.cache_ttl, 0)
+
+
+class TestWriteInvalidation(TestCCAPI):
+    """Test that write requests invalidate the cached responses they affect."""
+
+    def setUp(self):
+        """Use a response cache and cache FindProductSelectedOptionsOnly."""
+        super().setUp()
+        self.cache = ResponseCache(ttls={"FindProductSelectedOptionsOnly": 60})
+        self.cc_session.response_cache = self.cache
+        self.register_request(requests.GetOptionData, json=[])
+        self.register_request(requests.AddOptionValue, json=1)
+        self.register_request(requests.DeleteOptionValue, text="ok")
+        self.register_request(
+            requests.FindProductSelectedOptionsOnly,
+            json=test_data.FIND_PRODUCT_SELECTED_OPTIONS_ONLY_TEST_RESLULT,
+        )
+        self.register_request(
+            requests.UpdateProductStockLevel, text="ok", status_code=200
+        )
+
+    def tearDown(self):
+        """Remove the response cache."""
+        self.cc_session.response_cache = None
+
+    def cached_option_ids(self):
+        """Return the option IDs with cached GetOptionData responses."""
+        return {
+            entry.data["optid"]
+            for entry in self.cache._entries.values()
+            if entry.request_name == "GetOptionData"
+        }
+
+    def test_add_option_value(self):
+        """Test that adding a value invalidates the option's values."""
+        requests.GetOptionData("1")
+        requests.GetOptionData("2")
+        requests.AddOptionValue("1", "Red")
+        self.assertEqual(self.cached_option_ids(), {"2"})
+
+    def test_delete_option_value(self):
+        """Test that deleting a value invalidates all option values."""
+        requests.GetOptionData("1")
+        requests.GetOptionData("2")
+        requests.DeleteOptionValue("99")
+        self.assertEqual(self.cached_option_ids(), set())
+
+    def cached_product_ids(self):
+        """Return the product IDs with cached FindProductSelectedOptionsOnly responses."""
+        return {
+            entry.data["ProductID"]
+            for entry in self.cache._entries.values()
+            if entry.request_name == "FindProductSelectedOptionsOnly"
+        }
+
+    def test_update_stock_level(self):
+        """Test that updating a stock level invalidates the product's options."""
+        requests.FindProductSelectedOptionsOnly("1")
+        requests.FindProductSelectedOptionsOnly("2")
+        requests.UpdateProductStockLevel(
+            product_id="1", new_stock_level=5, old_stock_level=4
+        )
+        self.assertEqual(self.cached_product_ids(), {"2"})
+
+    def test_failed_write_invalidates(self):
+        """Test that cached responses are invalidated when a write request fails."""
+        self.register_request(
+            requests.UpdateProductStockLevel, text="error", status_code=500
+        )
+        requests.FindProductSelectedOptionsOnly("1")
+        with self.assertRaises(Exception):
+            requests.UpdateProductStockLevel(
+                product_id="1", new_stock_level=5, old_stock_level=4
+            )
+        self.assertEqual(self.cached_product_ids(), set())
+
+    def test_save_warehouse_bay(self):
+        """Test that saving a bay invalidates the bays of its warehouse."""
+        self.cache.set_ttl(requests.FindWarehouseBay, 60)
+        self.register_request(requests.FindWarehouseBay, json=[])
+        self.register_request(requests.SaveWarehouseBay, text="ok")
+        for warehouse_id in ("1", "2"):
+            requests.FindWarehouseBay(prog_type="normal", warehouse_id=warehouse_id)
+        requests.SaveWarehouseBay(warehouse_id="1", name="Bay")
+        self.assertEqual(
+            {
+                entry.data["WarehouseId"]
+                for entry in self.cache._entries.values()
+                if entry.request_name == "FindWarehouseBay"
+            },
+            {"2"},
+        )
+
+    def test_invalidation_maps(self):
+        """Test that invalidation maps name cached classes and request attributes."""
+        for name in dir(requests):
+            request_class = getattr(requests, name)
+            if not isinstance(request_class, type) or not issubclass(
+                request_class, requests.APIRequest
+            ):
+                continue
+            if isinstance(request_class.invalidates, property):
+                continue
+            parameters = inspect.signature(request_class.__init__).parameters
+            for cached_name, fields in request_class.invalidates.items():
+                self.assertTrue(
+                    issubclass(getattr(requests, cached_name), requests.APIRequest)
+                )
+                for attribute in (fields or {}).values():
+                    self.assertIn(attribute, parameters, request_class)
+
+    def cached_warehouse_ids(self):
+        """Return the warehouse IDs with cached FindWarehouseBay responses."""
+        return {
+            entry.data["WarehouseId"]
+            for entry in self.cache._entries.values()
+            if entry.request_name == "FindWarehouseBay"
+        }
+
+    def test_remove_bay(self):
+        """Test that removing a bay invalidates the warehouse bays."""
+        self.cache.set_ttl(requests.FindWarehouseBay, 60)
+        self.register_request(requests.FindWarehouseBay, json={"Data": []})
+        for warehouse_id in ("1", "2"):
+            requests.FindWarehouseBay(
+                operation="productbays", warehouse_id=warehouse_id
+            )
+        requests.FindWarehouseBay(
+            operation="removebay", warehouse_id="1", warehouse_bay_id="9"
+        )
+        self.assertEqual(self.cached_warehouse_ids(), {"2"})
+        requests.FindWarehouseBay(operation="removebay", warehouse_bay_id="9")
+        self.assertEqual(self.cached_warehouse_ids(), set())
+
+
+class TestInvalidationDuringRead(TestCCAPI):
+    """Test that reads overlapping a write do not cache or share stale data."""
+
+    def setUp(self):
+        """Use a response cache and mock option values changed by writes."""
+        super().setUp()
+        self.cc_session.response_cache = ResponseCache()
+        self.values = ["Small"]
+        self.read_started = threading.Event()
+        self.write_done = threading.Event()
+        self.register_request(requests.GetOptionData, json=self.option_data)
+        self.register_request(requests.AddOptionValue, json=self.add_value)
+
+    def tearDown(self):
+        """Remove the response cache."""
+        self.cc_session.response_cache = None
+
+    def option_data(self, request, context):
+        """Return the option values, finishing the first read after a write."""
+        values = list(self.values)
+        if not self.read_started.is_set():
+            self.read_started.set()
+            self.write_done.wait(5)
+        return [
+            {
+                "ID": i,
+                "OptionValue": value,
+                "BrandID": 341,
+                "OptionID": 1,
+                "OptionValueTrans": value,
+                "OptionsortOrder": i,
+                "Selected": False,
+                "ProductCount": 0,
+                "OptionName": "Size",
+            }
+            for i, value in enumerate(values)
+        ]
+
+    def add_value(self, request, context):
+        """Add an option value."""
+        self.values.append(urllib.parse.parse_qs(request.text)["val"][0])
+        return len(self.values)
+
+    def get_values(self):
+        """Return the names of the values of the option."""
+        return [value.value for value in requests.GetOptionData("1")]
+
+    def test_read_overlapping_write(self):
+        """Test that a read sent before a write is not cached or shared after it."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            slow_read = executor.submit(self.get_values)
+            self.read_started.wait(5)
+            requests.AddOptionValue("1", "Large")
+            later_read = executor.submit(self.get_values)
+            self.assertEqual(later_read.result(timeout=5), ["Small", "Large"])
+            self.write_done.set()
+            self.assertEqual(slow_read.result(timeout=5), ["Small"])
+        self.assertEqual(self.get_values(), ["Small", "Large"])
@@ -0,0 +1,173 @@
+"""Tests for recording and replaying requests."""
+
+import datetime
+import os
+import tempfile
+import time
+import unittest
+
+import requests_mock
+from requests import Session as RequestsSession
+from requests.models import PreparedRequest
+
+from ccapi import CCAPI, exceptions, requests
+from ccapi.requests import (
+    Cassette,
+    CloudCommerceAPISession,
+    RecordingAdapter,
+    ReplayAdapter,
+)
+
+from .test_CCAPI import TestCCAPI
+
+
+class TestCassette(unittest.TestCase):
+    """Tests for ccapi.requests.cassette."""
+
+    DOMAIN = TestCCAPI.DOMAIN
+    USERNAME = TestCCAPI.USERNAME
+    PASSWORD = TestCCAPI.PASSWORD
+    SESSION_COOKIE = "ASP.NET_SessionId=3ebd5e9a0b4c; path=/; HttpOnly"
+    SKU_RESPONSE = {
+        "Success": None,
+        "Message": None,
+        "RecordCount": 1,
+        "Data": "VSG-H3R-G0R",
+    }
+
+    def setUp(self):
+        """Create a mock adapter and a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.adapter = requests_mock.Adapter()
+        self.adapter.register_uri("POST", f"http://{self.DOMAIN}", text="mock_text")
+        self.adapter.register_uri(
+            "POST",
+            f"http://{self.DOMAIN}/{TestCCAPI.LOGIN_HANDLER_URI}",
+            headers={"Set-Cookie": self.SESSION_COOKIE},
+        )
+        self.adapter.register_uri(
+            "POST",
+            f"http://{self.DOMAIN}/{requests.ProductOperations.uri}",
+            json=self.SKU_RESPONSE,
+        )
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def get_path(self, filename="cassette.json"):
+        """Return a path in the temporary directory."""
+        return os.path.join(self.directory.name, filename)
+
+    def create_session(self, transport):
+        """Return a logged in session using transport."""
+        session = CloudCommerceAPISession(transport=transport)
+        session.get_session(
+            domain=self.DOMAIN, username=self.USERNAME, password=self.PASSWORD
+        )
+        return session
+
+    def record(self, path):
+        """Record a request to a cassette at path."""
+        with Cassette(path) as cassette:
+            session = self.create_session(RecordingAdapter(cassette, self.adapter))
+            with session.activate():
+                self.assertEqual(CCAPI.get_sku(), "VSG-H3R-G0R")
+        return cassette
+
+    def test_record(self):
+        """Test that requests are recorded."""
+        cassette = self.record(self.get_path())
+        self.assertEqual(len(cassette.interactions), 3)
+        self.assertEqual(len(Cassette(self.get_path()).interactions), 3)
+
+    def test_credentials_are_not_recorded(self):
+        """Test that login credentials are not written to the cassette."""
+        self.record(self.get_path())
+        with open(self.get_path()) as cassette_file:
+            text = cassette_file.read()
+        self.assertNotIn(self.PASSWORD, text)
+        self.assertNotIn(self.USERNAME, text)
+
+    def test_cookies_are_not_recorded(self):
+        """Test that session cookies are not written to the cassette."""
+        self.record(self.get_path())
+        with open(self.get_path()) as cassette_file:
+            text = cassette_file.read()
+        self.assertNotIn("3ebd5e9a0b4c", text)
+        self.assertIn(Cassette.REDACTED, text)
+
+    def test_replay(self):
+        """Test that recorded responses are replayed."""
+        self.record(self.get_path("cassette.json.gz"))
+        cassette = Cassette(self.get_path("cassette.json.gz"))
+        session = self.create_session(ReplayAdapter(cassette))
+        with session.activate():
+            for _ in range(3):
+                self.assertEqual(CCAPI.get_sku(), "VSG-H3R-G0R")
+
+    def test_unrecorded_request(self):
+        """Test that an unrecorded request raises an exception."""
+        self.record(self.get_path())
+        session = self.create_session(ReplayAdapter(Cassette(self.get_path())))
+        with session.activate():
+            with self.assertRaises(exceptions.RecordedResponseNotFoundError):
+                CCAPI.get_range("1")
+
+    def test_latency(self):
+        """Test that latency is added to replayed responses."""
+        self.record(self.get_path())
+        session = self.create_session(
+            ReplayAdapter(Cassette(self.get_path()), latency=0.1)
+        )
+        start = time.monotonic()
+        with session.activate():
+            CCAPI.get_sku()
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+    def get_orders_key(self, cassette, **kwargs):
+        """Return the cassette key of a GetOrdersForDispatch request."""
+        request = requests.GetOrdersForDispatch.prepare(**kwargs)
+        prepared = PreparedRequest()
+        prepared.prepare(
+            method="POST",
+            url=f"http://{self.DOMAIN}/{request.uri}",
+            headers=request.get_headers(),
+            data=request.get_data(),
+        )
+        return cassette.get_key(cassette.serialise_request(prepared))
+
+    def test_request_headers_are_matched(self):
+        """Test that requests differing only by headers are matched separately."""
+        cassette = Cassette(self.get_path())
+        self.assertNotEqual(
+            self.get_orders_key(cassette, skip_records=0),
+            self.get_orders_key(cassette, skip_records=200),
+        )
+
+    def test_default_dates_are_not_matched(self):
+        """Test that requests made on different days are matched."""
+        cassette = Cassette(self.get_path())
+        self.assertEqual(
+            self.get_orders_key(cassette, date=datetime.datetime(2020, 1, 1)),
+            self.get_orders_key(cassette, date=datetime.datetime(2020, 1, 2)),
+        )
+
+    def test_replay_pages(self):
+        """Test that pages requested with headers are replayed in any order."""
+        url = f"http://{self.DOMAIN}/orders"
+        self.adapter.register_uri(
+            "POST",
+            url,
+            text=lambda request, context: request.headers["SkipRecords"],
+        )
+        with Cassette(self.get_path()) as cassette:
+            session = RequestsSession()
+            session.mount("http://", RecordingAdapter(cassette, self.adapter))
+            for skip in range(3):
+                session.post(url, headers={"SkipRecords": str(skip)})
+        session = RequestsSession()
+        session.mount("http://", ReplayAdapter(Cassette(self.get_path())))
+        for skip in (2, 0, 1):
+            response = session.post(url, headers={"SkipRecords": str(skip)})
+            self.assertEqual(response.text, str(skip))
@@ -0,0 +1,80 @@
+"""Tests for dropping the JSON kept by Cloud Commerce objects."""
+
+import tempfile
+from pathlib import Path
+
+from ccapi import CCAPI, cc_objects, requests
+from ccapi.cc_objects import keep_json, keeping_json, set_keep_json
+from ccapi.requests import WarehouseIndex
+from ccapi.requests.orderhandlers.getordersfordispatch import DispatchOrder
+
+from .. import test_data
+from .test_cc_objects import TestCCObjects
+
+
+class TestKeepJSON(TestCCObjects):
+    """Tests for ccapi.cc_objects.rawjson."""
+
+    PRODUCT_DATA = test_data.FIND_PRODUCT_SELECTED_OPTIONS_ONLY_TEST_RESLULT["product"]
+
+    def setUp(self):
+        """Restore the global setting after each test."""
+        super().setUp()
+        self.addCleanup(set_keep_json, True)
+
+    def test_json_is_kept_by_default(self):
+        """Test that objects keep their JSON unless disabled."""
+        self.assertTrue(keeping_json())
+        product = cc_objects.Product(self.PRODUCT_DATA)
+        self.assertIs(product.json, self.PRODUCT_DATA)
+
+    def test_set_keep_json(self):
+        """Test that objects do not keep their JSON when disabled globally."""
+        set_keep_json(False)
+        product = cc_objects.Product(self.PRODUCT_DATA)
+        self.assertIsNone(product.json)
+        self.assertEqual(product.id, self.PRODUCT_DATA["ID"])
+
+    def test_keep_json_context(self):
+        """Test that keep_json overrides the global setting within its context."""
+        set_keep_json(False)
+        with keep_json(True):
+            kept = DispatchOrder(test_data.DISPATCH_ORDER)
+        dropped = DispatchOrder(test_data.DISPATCH_ORDER)
+        self.assertIs(kept.json, test_data.DISPATCH_ORDER)
+        self.assertIsNone(dropped.json)
+        self.assertIsNone(dropped.products[0].json)
+
+    def test_models_use_slots(self):
+        """Test that model instances do not have an instance dict."""
+        product = cc_objects.Product(self.PRODUCT_DATA)
+        order = DispatchOrder(test_data.DISPATCH_ORDER)
+        for instance in (product, order, order.products[0]):
+            self.assertFalse(hasattr(instance, "__dict__"))
+        with self.assertRaises(AttributeError):
+            product.not_an_attribute = None
+
+    def test_keep_json_applies_to_paged_requests(self):
+        """Test that keep_json applies to pages requested in other threads."""
+        self.register_uri(
+            "POST",
+            self.cloud_commerce_URI(
+                requests.orderhandlers.GetOrdersForDispatch.uri.lstrip("/")
+            ),
+            json=[test_data.DISPATCH_ORDER],
+        )
+        with keep_json(False):
+            orders = list(CCAPI.iter_orders_for_dispatch(prefetch=2))
+        self.assertEqual(len(orders), 1)
+        self.assertIsNone(orders[0].json)
+
+    def test_warehouse_index_stores_bays_without_json(self):
+        """Test that bays without JSON can be stored in a warehouse index."""
+        set_keep_json(False)
+        bay = cc_objects.WarehouseBay({"ID": 101, "Name": "A1", "WarehouseID": 1})
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "warehouses.json"
+            WarehouseIndex(path=path).set_bays(1, [bay])
+            stored_bay = WarehouseIndex(path=path).get_bay(1, "A1")
+        self.assertEqual(stored_bay.id, 101)
+        self.assertEqual(stored_bay.warehouse_id, 1)
@@ -0,0 +1,128 @@
+"""Tests for coalescing identical requests."""
+
+import threading
+import time
+import urllib
+from concurrent.futures import ThreadPoolExecutor
+
+from ccapi import CCAPI, requests
+
+from .test_CCAPI import TestCCAPI
+
+
+class TestRequestCoalescer(TestCCAPI):
+    """Tests for ccapi.requests.coalesce.RequestCoalescer."""
+
+    def setUp(self):
+        """Register slow request URIs."""
+        super().setUp()
+        self.calls = []
+        self.calls_lock = threading.Lock()
+        self.register_request(
+            requests.products.GetPendingStock, json=self.pending_stock_response
+        )
+        self.register_request(requests.AddOptionValue, json=self.option_response)
+
+    def tearDown(self):
+        """Re-enable request coalescing."""
+        self.cc_session.coalescer = requests.RequestCoalescer()
+
+    def pending_stock_response(self, request, context):
+        """Return the product ID as the pending stock level after a delay."""
+        product_id = urllib.parse.parse_qs(request.text)["ProductID"][0]
+        with self.calls_lock:
+            self.calls.append(product_id)
+        time.sleep(0.1)
+        if product_id == "0":
+            context.status_code = 500
+        return {"TotalPending": int(product_id)}
+
+    def option_response(self, request, context):
+        """Return an option value ID after a delay."""
+        with self.calls_lock:
+            self.calls.append(request.text)
+        time.sleep(0.1)
+        return 1
+
+    def call_concurrently(self, func, arguments):
+        """Call func with each argument at the same time."""
+        barrier = threading.Barrier(len(arguments))
+
+        def call(argument):
+            barrier.wait()
+            try:
+                return func(argument)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=len(arguments)) as executor:
+            return list(executor.map(call, arguments))
+
+    def test_identical_requests_are_coalesced(self):
+        """Test that concurrent identical requests make one request."""
+        results = self.call_concurrently(requests.products.GetPendingStock, ["5"] * 8)
+        self.assertEqual(results, [5] * 8)
+        self.assertEqual(self.calls, ["5"])
+        self.assertEqual(self.cc_session.coalescer.in_flight(), 0)
+
+    def test_different_requests_are_not_coalesced(self):
+        """Test that requests with different arguments are all made."""
+        results = self.call_concurrently(
+            requests.products.GetPendingStock, ["1", "2", "1", "2"]
+        )
+        self.assertEqual(results, [1, 2, 1, 2])
+        self.assertEqual(sorted(self.calls), ["1", "2"])
+
+    def test_requests_with_different_headers_are_not_coalesced(self):
+        """Test that requests differing only by headers are not coalesced."""
+        first = requests.GetOrdersForDispatch.prepare(skip_records=0)
+        second = requests.GetOrdersForDispatch.prepare(skip_records=200)
+        for request in (first, second):
+            request.headers = request.get_headers()
+            request.params = request.get_params()
+            request.data = request.get_data()
+        self.assertNotEqual(
+            self.cc_session.coalescer.get_key(first),
+            self.cc_session.coalescer.get_key(second),
+        )
+
+    def test_sequential_requests_are_not_coalesced(self):
+        """Test that requests made after a response is received are made again."""
+        requests.products.GetPendingStock("5")
+        requests.products.GetPendingStock("5")
+        self.assertEqual(self.calls, ["5", "5"])
+
+    def test_exceptions_are_shared(self):
+        """Test that a failed request raises for every waiting caller."""
+        self.cc_session.retry_policy = requests.RetryPolicy.no_retry()
+        results = self.call_concurrently(requests.products.GetPendingStock, ["0"] * 4)
+        for result in results:
+            self.assertIsInstance(result, Exception)
+        self.assertEqual(self.calls, ["0"])
+
+    def test_non_idempotent_requests_are_not_coalesced(self):
+        """Test that requests which change data are never coalesced."""
+        self.call_concurrently(
+            lambda value: requests.AddOptionValue("1", value), ["a"] * 3
+        )
+        self.assertEqual(len(self.calls), 3)
+
+    def test_generated_skus_are_not_coalesced(self):
+        """Test that concurrent calls for a generated SKU each receive a new SKU."""
+        skus = iter(f"SKU-{i}" for i in range(5))
+
+        def sku_response(request, context):
+            with self.calls_lock:
+                sku = next(skus)
+            time.sleep(0.1)
+            return {"Success": None, "Message": None, "RecordCount": 1, "Data": sku}
+
+        self.register_request(requests.ProductOperations, json=sku_response)
+        results = self.call_concurrently(lambda _: CCAPI.get_sku(), range(5))
+        self.assertEqual(sorted(results), [f"SKU-{i}" for i in range(5)])
+
+    def test_disabled(self):
+        """Test that coalescing can be disabled."""
+        self.cc_session.coalescer = None
+        self.call_concurrently(requests.products.GetPendingStock, ["5"] * 3)
+        self.assertEqual(self.calls, ["5"] * 3)
@@ -6,6 +6,7 @@ from .check_ranges_on_sales_channel_test_data import (
 from .find_product_selected_options_only_test_data import (
     FIND_PRODUCT_SELECTED_OPTIONS_ONLY_TEST_RESLULT,
 )
+from .get_orders_for_dispatch_response import DISPATCH_ORDER, DISPATCH_ORDER_PRODUCT
 from .get_products_for_range_response import GET_PRODUCTS_FOR_RANGE_RESPONSE
 from .product_export_file import PRODUCT_EXPORT_FILE
 from .product_export_update import GET_PRODUCT_EXPORT_UPDATE_RESPONSE
@@ -14,6 +15,8 @@ __all__ = [
     "CHECK_RANGES_ON_SALES_CHANNEL_RESULT",
     "FIND_PRODUCT_SELECTED_OPTIONS_ONLY_TEST_RESLULT",
     "GET_PRODUCTS_FOR_RANGE_RESPONSE",
+    "DISPATCH_ORDER",
+    "DISPATCH_ORDER_PRODUCT",
     "PRODUCT_EXPORT_FILE",
     "GET_PRODUCT_EXPORT_UPDATE_RESPONSE",
 ]
@@ -0,0 +1,93 @@
+"""Example data for testing the GetOrdersForDispatch request."""
+
+DISPATCH_ORDER_PRODUCT = {
+    "intID": 1,
+    "strPrice": "4.99",
+    "strCustomerOrderID": None,
+    "strProductID": None,
+    "strProductRangeID": None,
+    "strProductName": "Product",
+    "strProductFullName": None,
+    "strBarCodeNumber": None,
+    "strImageUrl": None,
+    "CustomerID": None,
+    "CustomerName": None,
+    "pendingDispatch": None,
+    "SKU": "ABC-123-DEF",
+    "Quantity": 1,
+    "Dispatched": None,
+    "Allocated": None,
+    "CanProcessItem": None,
+    "AmountSentToChannel": None,
+    "ExpectedDeliveryDate": None,
+    "ItemHandlingTime": None,
+    "ParentProductID": None,
+    "ParentProductRangeID": None,
+    "ParentProductName": None,
+    "OrderItemProductType": None,
+    "CurrentStockLevel": None,
+    "PerItemWeight": None,
+    "GiftMessage": None,
+    "BayLocations": None,
+    "ListingID": None,
+    "PickFromWarehouseBayId": None,
+    "PickFromWarehouseId": None,
+}
+
+DISPATCH_ORDER = {
+    "OrderID": 1,
+    "isPickListPrinted": None,
+    "Priority": None,
+    "CustomerID": None,
+    "LoginID": None,
+    "CompanyName": "",
+    "TradingName": "",
+    "DateReceived": "01/02/2020 10:30",
+    "DispatchDate": "03/02/2020 00:00",
+    "Note": None,
+    "PickListPrinted": None,
+    "TotalGross": None,
+    "TotalGrossGBP": None,
+    "DefaultCSRuleId": None,
+    "DefaultCSRuleCostGBP": None,
+    "DefaultCSRuleName": None,
+    "Cancelled": None,
+    "Unpaid": None,
+    "ItemsLeftToDispatch": None,
+    "ItemsCount": None,
+    "IntendedForCourier": None,
+    "PredictedOrderWeight": None,
+    "ChannelName": None,
+    "ExternalOrderTypeName": None,
+    "SalesChannelName": None,
+    "countrycode": None,
+    "deliverycountrycode": None,
+    "DeliveryName": None,
+    "DeliveryNameFromUDF": None,
+    "AddressConflict": None,
+    "DeliveryAddress": None,
+    "DeliveryUserID": None,
+    "HasUnallocatedItems": None,
+    "CanProcessOrder": None,
+    "OnWatchList": None,
+    "WatchListReason": None,
+    "PickStatus": None,
+    "ExternalTransactionID": None,
+    "EstDeliveryDays": None,
+    "Products": [DISPATCH_ORDER_PRODUCT],
+    "FactoryIds": None,
+    "IsExported": None,
+    "ExportedDate": None,
+    "DeliveryDate": None,
+    "DispatchOrderBy": None,
+    "DeliveryFrom": None,
+    "DeliveryTo": None,
+    "RangedDelivery": None,
+    "CustomerType": None,
+    "RuleBaseWeight": None,
+    "CreationDate": None,
+    "HideUntilDate": None,
+    "TrackingCode": None,
+    "AssignedToWarehouseId": None,
+    "ItemSummary": None,
+}
@@ -0,0 +1,85 @@
+"""Tests for response JSON decoders."""
+
+import codecs
+import json
+import unittest
+from unittest import mock
+
+import requests as requests_lib
+
+from ccapi import requests
+from ccapi.requests import JSONDecoder, OrjsonDecoder
+from ccapi.requests.decoder import get_default_decoder, orjson
+
+from .test_CCAPI import TestCCAPI
+
+
+def make_response(content, content_type="application/json"):
+    """Return a requests.Response with content."""
+    response = requests_lib.models.Response()
+    response._content = content
+    response.headers["Content-Type"] = content_type
+    response.encoding = requests_lib.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+class TestJSONDecoder(unittest.TestCase):
+    """Tests for ccapi.requests.decoder.JSONDecoder."""
+
+    DATA = {"Name": "Café", "Values": [1, 2.5, None, True]}
+
+    def decoders(self):
+        """Return each available decoder."""
+        if orjson is None:
+            return [JSONDecoder()]
+        return [JSONDecoder(), OrjsonDecoder()]
+
+    def test_decodes_bytes(self):
+        """Test that responses are decoded from the response bytes."""
+        response = make_response(json.dumps(self.DATA).encode("utf8"), "text/plain")
+        for decoder in self.decoders():
+            with mock.patch.object(decoder, "loads", wraps=decoder.loads) as loads:
+                self.assertEqual(decoder.decode_response(response), self.DATA)
+            self.assertIsInstance(loads.call_args.args[0], bytes)
+
+    def test_byte_order_mark(self):
+        """Test that a UTF-8 byte order mark is ignored."""
+        content = codecs.BOM_UTF8 + json.dumps(self.DATA).encode("utf8")
+        for decoder in self.decoders():
+            self.assertEqual(decoder.decode_response(make_response(content)), self.DATA)
+
+    def test_declared_charset(self):
+        """Test that responses declaring another character set are decoded as text."""
+        content = json.dumps(self.DATA, ensure_ascii=False).encode("latin-1")
+        response = make_response(content, "application/json; charset=ISO-8859-1")
+        for decoder in self.decoders():
+            self.assertEqual(decoder.decode_response(response), self.DATA)
+
+    def test_invalid_json(self):
+        """Test that invalid JSON raises json.JSONDecodeError."""
+        for decoder in self.decoders():
+            with self.assertRaises(json.JSONDecodeError):
+                decoder.decode_response(make_response(b"<html>"))
+
+    def test_default_decoder(self):
+        """Test that orjson is used by default when it is installed."""
+        expected = JSONDecoder if orjson is None else OrjsonDecoder
+        self.assertIs(type(get_default_decoder()), expected)
+
+
+class TestSessionDecoder(TestCCAPI):
+    """Test that requests use the session's decoder."""
+
+    def test_requests_use_session_decoder(self):
+        """Test that request classes decode responses with the session decoder."""
+        self.register_request(
+            requests.products.GetPendingStock, json={"TotalPending": 3}
+        )
+        decoder = mock.Mock(wraps=JSONDecoder())
+        original_decoder = self.cc_session.json_decoder
+        self.cc_session.json_decoder = decoder
+        try:
+            self.assertEqual(requests.products.GetPendingStock("1"), 3)
+        finally:
+            self.cc_session.json_decoder = original_decoder
+        decoder.decode_response.assert_called_once()
@@ -2,10 +2,17 @@
 
 import datetime
 import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
-from ccapi import requests
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ReadTimeout as RequestsReadTimeout
+
+from ccapi import CCAPI, exceptions, requests
+from ccapi.requests import RetryPolicy
 from ccapi.requests.ccapisession import CloudCommerceAPISession
 
+from . import test_data
 from .test_CCAPI import TestCCAPI
 
 
@@ -27,23 +34,23 @@ class TestCloudCommerceAPISession(TestCCAPI):
 
     def test_login_sets_the_domain(self):
         """Test that the session domain is set when the session is created."""
-        self.assertEqual(CloudCommerceAPISession.domain, self.DOMAIN)
+        self.assertEqual(self.cc_session.domain, self.DOMAIN)
 
     def test_login_sets_the_username(self):
         """Test that the session username is set when the session is created."""
-        self.assertEqual(CloudCommerceAPISession.username, self.USERNAME)
+        self.assertEqual(self.cc_session.username, self.USERNAME)
 
     def test_login_sets_the_password(self):
         """Test that the session password is set when the session is created."""
-        self.assertEqual(CloudCommerceAPISession.password, self.PASSWORD)
+        self.assertEqual(self.cc_session.password, self.PASSWORD)
 
     def test_session_timeout(self):
         """Test the session_logout."""
         CloudCommerceAPISession.timeout = datetime.timedelta(seconds=0.25)
         self.mock_login()
-        self.assertFalse(CloudCommerceAPISession.session_timed_out())
+        self.assertFalse(self.cc_session.session_timed_out())
         time.sleep(0.3)
-        self.assertTrue(CloudCommerceAPISession.session_timed_out())
+        self.assertTrue(self.cc_session.session_timed_out())
 
     def test_session_is_recreated_if_timed_out(self):
         """Test that a new session is created if a request is made and it has timed out."""
@@ -59,6 +66,448 @@ class TestCloudCommerceAPISession(TestCCAPI):
         CloudCommerceAPISession.timeout = datetime.timedelta(seconds=0.25)
         self.mock_login()
         time.sleep(0.3)
-        self.assertTrue(CloudCommerceAPISession.session_timed_out())
+        self.assertTrue(self.cc_session.session_timed_out())
         requests.ProductOperations("getgeneratedsku")
-        self.assertFalse(CloudCommerceAPISession.session_timed_out())
+        self.assertFalse(self.cc_session.session_timed_out())
+
+
+class TestSessionInstances(TestCCAPI):
+    """Test that sessions are independent instances."""
+
+    def create_session(self, **kwargs):
+        """Return a new session using the mock adapter."""
+        session = CloudCommerceAPISession(**kwargs)
+        session.session.mount("http://", self.adapter)
+        return session
+
+    def test_current_returns_default_session(self):
+        """Test that the default session is used when no session is active."""
+        self.assertIs(
+            CloudCommerceAPISession.current(), CloudCommerceAPISession.get_default()
+        )
+
+    def test_activate(self):
+        """Test that an activated session is used as the current session."""
+        session = self.create_session()
+        with session.activate():
+            self.assertIs(CloudCommerceAPISession.current(), session)
+        self.assertIs(CloudCommerceAPISession.current(), self.cc_session)
+
+    def test_pool_options(self):
+        """Test that the connection pool options are applied to the adapter."""
+        session = CloudCommerceAPISession(pool_connections=4, pool_maxsize=32)
+        adapter = session.session.get_adapter("http://")
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_keep_alive(self):
+        """Test that connections are closed when keep alive is disabled."""
+        session = CloudCommerceAPISession(keep_alive=False)
+        self.assertEqual(session.session.headers["Connection"], "close")
+
+    def test_sessions_have_independent_credentials(self):
+        """Test that logging in one session does not change another."""
+        session = self.create_session()
+        session.get_session(
+            domain=self.DOMAIN, username="other_user", password=self.PASSWORD
+        )
+        self.assertEqual(session.username, "other_user")
+        self.assertEqual(self.cc_session.username, self.USERNAME)
+
+    def test_CCAPI_instance_uses_own_session(self):
+        """Test that methods called on a CCAPI instance use its session."""
+        self.register_request(
+            requests.ProductOperations,
+            json={
+                "Success": None,
+                "Message": None,
+                "RecordCount": 1,
+                "Data": "VSG-H3R-G0R",
+            },
+        )
+        session = self.create_session()
+        api = CCAPI(
+            username=self.USERNAME,
+            password=self.PASSWORD,
+            domain=self.DOMAIN,
+            session=session,
+        )
+        self.assertIs(api.session, session)
+        self.assertIsNotNone(session.last_login)
+        with mock.patch.object(
+            session, "api_request", wraps=session.api_request
+        ) as api_request:
+            self.assertEqual(api.get_sku(), "VSG-H3R-G0R")
+        api_request.assert_called_once()
+
+    def test_objects_from_CCAPI_instance_use_its_session(self):
+        """Test that objects returned by a CCAPI instance use its session."""
+        self.register_request(
+            requests.FindProductSelectedOptionsOnly,
+            json=test_data.FIND_PRODUCT_SELECTED_OPTIONS_ONLY_TEST_RESLULT,
+        )
+        session = self.create_session()
+        api = CCAPI(
+            username=self.USERNAME,
+            password=self.PASSWORD,
+            domain=self.DOMAIN,
+            session=session,
+        )
+        product = api.get_product("1")
+        self.assertIs(product.session, session)
+        with mock.patch.object(
+            session, "api_request", wraps=session.api_request
+        ) as api_request, mock.patch.object(
+            self.cc_session, "api_request", wraps=self.cc_session.api_request
+        ) as default_api_request:
+            self.assertEqual(len(product.options), 12)
+        api_request.assert_called_once()
+        default_api_request.assert_not_called()
+
+
+class TestRetry(TestCCAPI):
+    """Test that failed requests are retried."""
+
+    SKU_RESPONSE = {
+        "Success": None,
+        "Message": None,
+        "RecordCount": 1,
+        "Data": "VSG-H3R-G0R",
+    }
+
+    def register_responses(self, request_class, *responses):
+        """Register a sequence of responses for a request class."""
+        self.register_request(request_class, response_list=list(responses))
+
+    def request_count(self, request_class):
+        """Return the number of requests made to a request class's URI."""
+        return len(
+            [r for r in self.adapter.request_history if request_class.uri in r.url]
+        )
+
+    def test_idempotent_request_is_retried(self):
+        """Test that an idempotent request is retried after a server error."""
+        self.register_responses(
+            requests.ProductOperations,
+            {"status_code": 503},
+            {"json": self.SKU_RESPONSE},
+        )
+        response = requests.ProductOperations("getgeneratedsku")
+        self.assertEqual(response.data, "VSG-H3R-G0R")
+        self.assertEqual(self.request_count(requests.ProductOperations), 2)
+
+    def test_connection_errors_are_retried(self):
+        """Test that an idempotent request is retried after a connection error."""
+        self.register_responses(
+            requests.ProductOperations,
+            {"exc": RequestsConnectionError},
+            {"json": self.SKU_RESPONSE},
+        )
+        response = requests.ProductOperations("getgeneratedsku")
+        self.assertEqual(response.data, "VSG-H3R-G0R")
+
+    def test_max_attempts(self):
+        """Test that requests are not retried more than max_attempts times."""
+        self.cc_session.retry_policy.max_attempts = 2
+        self.register_responses(requests.ProductOperations, {"status_code": 500})
+        with self.assertRaises(exceptions.CloudCommerceResponseError):
+            requests.ProductOperations("getgeneratedsku")
+        self.assertEqual(self.request_count(requests.ProductOperations), 2)
+
+    def test_non_idempotent_request_is_not_retried(self):
+        """Test that a request which is not idempotent is not retried."""
+        self.register_responses(requests.AddProduct, {"status_code": 503})
+        with self.assertRaises(exceptions.CloudCommerceResponseError):
+            requests.AddProduct(
+                range_id="1",
+                name="Name",
+                barcode="1",
+                sku="SKU",
+                description="",
+                vat_rate_id=20,
+            )
+        self.assertEqual(self.request_count(requests.AddProduct), 1)
+
+    def test_non_idempotent_request_opt_in(self):
+        """Test that a request which is not idempotent can be retried on request."""
+        self.register_responses(
+            requests.AddProduct, {"status_code": 503}, {"text": "Success^^123"}
+        )
+        request = requests.AddProduct.prepare(
+            range_id="1",
+            name="Name",
+            barcode="1",
+            sku="SKU",
+            description="",
+            vat_rate_id=20,
+        )
+        self.assertEqual(request.send(retry=True), "123")
+        self.assertEqual(self.request_count(requests.AddProduct), 2)
+
+    def test_max_elapsed(self):
+        """Test that no retry is made after max_elapsed."""
+        self.cc_session.retry_policy = RetryPolicy(
+            backoff_factor=1, max_elapsed=0.5, jitter=False
+        )
+        self.register_responses(requests.ProductOperations, {"status_code": 500})
+        with self.assertRaises(exceptions.CloudCommerceResponseError):
+            requests.ProductOperations("getgeneratedsku")
+        self.assertEqual(self.request_count(requests.ProductOperations), 1)
+
+    def test_backoff(self):
+        """Test the backoff grows exponentially up to max_backoff."""
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+        self.assertEqual(
+            [policy.get_backoff(attempt) for attempt in range(1, 5)], [1, 2, 4, 5]
+        )
+        policy.jitter = True
+        for attempt in range(1, 5):
+            self.assertLessEqual(policy.get_backoff(attempt), 5)
+
+    def test_idempotent_flags(self):
+        """Test that read requests are idempotent and writes are not."""
+        self.assertTrue(requests.GetProducts.idempotent)
+        self.assertFalse(requests.AddProduct.idempotent)
+        self.assertFalse(requests.CreateOrder.idempotent)
+        self.assertTrue(
+            requests.FindWarehouseBay.prepare(prog_type="normal").idempotent
+        )
+        self.assertFalse(
+            requests.FindWarehouseBay.prepare(operation="removebay").idempotent
+        )
+
+
+class TestSingleFlightLogin(TestCCAPI):
+    """Test that concurrent callers share one login."""
+
+    def setUp(self):
+        """Count logins made by the session."""
+        super().setUp()
+        self.logins = []
+        get_session = self.cc_session.get_session
+
+        def counted_get_session(**kwargs):
+            self.logins.append(kwargs)
+            time.sleep(0.05)
+            return get_session(**kwargs)
+
+        self.cc_session.get_session = counted_get_session
+
+    def tearDown(self):
+        """Restore the session."""
+        del self.cc_session.get_session
+        self.cc_session.refresh_before_expiry = None
+
+    def test_single_login_for_concurrent_callers(self):
+        """Test that an expired session is logged in once by concurrent callers."""
+        self.cc_session.last_login = None
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: self.cc_session.check_login(), range(8)))
+        self.assertEqual(len(self.logins), 1)
+        self.assertFalse(self.cc_session.session_timed_out())
+
+    def test_no_login_when_valid(self):
+        """Test that no login is made when the session is valid."""
+        self.cc_session.check_login()
+        self.assertEqual(self.logins, [])
+
+    def test_background_refresh(self):
+        """Test that a session close to expiry is refreshed in the background."""
+        self.cc_session.refresh_before_expiry = CloudCommerceAPISession.timeout
+        last_login = self.cc_session.last_login
+        start = time.monotonic()
+        self.cc_session.check_login()
+        self.cc_session.check_login()
+        self.assertLess(time.monotonic() - start, 0.05)
+        self.cc_session._refresh_thread.join()
+        self.assertEqual(len(self.logins), 1)
+        self.assertGreater(self.cc_session.last_login, last_login)
+
+    def test_session_expires_soon(self):
+        """Test session_expires_soon."""
+        self.assertFalse(self.cc_session.session_expires_soon())
+        self.cc_session.refresh_before_expiry = datetime.timedelta(minutes=5)
+        self.assertFalse(self.cc_session.session_expires_soon())
+        self.cc_session.last_login -= datetime.timedelta(minutes=56)
+        self.assertTrue(self.cc_session.session_expires_soon())
+
+
+class TestSessionExpiryDetection(TestCCAPI):
+    """Test that expired sessions are detected from responses."""
+
+    SKU_RESPONSE = {
+        "Success": None,
+        "Message": None,
+        "RecordCount": 1,
+        "Data": "VSG-H3R-G0R",
+    }
+
+    def setUp(self):
+        """Record the time of the last login."""
+        super().setUp()
+        self.last_login = self.cc_session.last_login
+
+    def request_count(self, uri):
+        """Return the number of requests made to uri."""
+        return len([r for r in self.adapter.request_history if uri in r.url])
+
+    def assertReplayed(self, *responses):
+        """Assert that the request is replayed after a login."""
+        self.register_request(
+            requests.ProductOperations,
+            response_list=[*responses, {"json": self.SKU_RESPONSE}],
+        )
+        response = requests.ProductOperations("getgeneratedsku")
+        self.assertEqual(response.data, "VSG-H3R-G0R")
+        self.assertEqual(self.request_count(requests.ProductOperations.uri), 2)
+        self.assertGreater(self.cc_session.last_login, self.last_login)
+
+    def test_unauthorised(self):
+        """Test that a 401 response logs in and replays the request."""
+        self.assertReplayed({"status_code": 401})
+
+    def test_redirect_to_login(self):
+        """Test that a redirect to the login page logs in and replays the request."""
+        self.register_uri("GET", f"http://{self.DOMAIN}/Login.aspx", text="login")
+        self.assertReplayed(
+            {
+                "status_code": 302,
+                "headers": {"Location": f"http://{self.DOMAIN}/Login.aspx"},
+            }
+        )
+
+    def test_is_login_url(self):
+        """Test that login page URLs are recognised."""
+        self.assertTrue(self.cc_session.is_login_url(f"http://{self.DOMAIN}/"))
+        self.assertTrue(self.cc_session.is_login_url("/login.aspx?ReturnUrl=%2f"))
+        self.assertFalse(self.cc_session.is_login_url("/Handlers/Products.ashx"))
+        self.assertFalse(self.cc_session.is_login_url("http://example.com/login"))
+
+    def test_successful_requests_extend_session(self):
+        """Test that the fallback timeout is counted from the last good response."""
+        self.register_request(requests.ProductOperations, json=self.SKU_RESPONSE)
+        self.cc_session.last_login -= CloudCommerceAPISession.timeout / 2
+        requests.ProductOperations("getgeneratedsku")
+        self.cc_session.last_login -= CloudCommerceAPISession.timeout / 2
+        self.assertFalse(self.cc_session.session_timed_out())
+
+
+class TestTimeouts(TestCCAPI):
+    """Test request timeouts and deadlines."""
+
+    SKU_RESPONSE = TestRetry.SKU_RESPONSE
+
+    def setUp(self):
+        """Record the arguments used to send requests."""
+        super().setUp()
+        self.register_request(requests.ProductOperations, json=self.SKU_RESPONSE)
+        self.register_request(requests.ViewFile, text="export")
+
+    def sent_timeout(self, request_class, *args, **kwargs):
+        """Send a request and return the timeout it was sent with."""
+        with mock.patch.object(
+            self.cc_session.session, "post", wraps=self.cc_session.session.post
+        ) as post:
+            request_class(*args, **kwargs)
+        return post.call_args.kwargs["timeout"]
+
+    def test_default_timeout(self):
+        """Test that requests are sent with the session's default timeouts."""
+        self.assertEqual(
+            self.sent_timeout(requests.ProductOperations, "getgeneratedsku"),
+            (
+                CloudCommerceAPISession.CONNECT_TIMEOUT,
+                CloudCommerceAPISession.READ_TIMEOUT,
+            ),
+        )
+
+    def test_request_class_timeout(self):
+        """Test that request classes can override the read timeout."""
+        self.assertEqual(
+            self.sent_timeout(requests.ViewFile, "export.xlsx"),
+            (CloudCommerceAPISession.CONNECT_TIMEOUT, requests.ViewFile.read_timeout),
+        )
+
+    def test_timeout_limited_by_deadline(self):
+        """Test that timeouts are reduced to the time left before a deadline."""
+        with CloudCommerceAPISession.deadline(5):
+            connect, read = self.sent_timeout(
+                requests.ProductOperations, "getgeneratedsku"
+            )
+        self.assertLessEqual(connect, 5)
+        self.assertLessEqual(read, 5)
+
+    def test_nested_deadline(self):
+        """Test that a nested deadline cannot extend an outer deadline."""
+        with CloudCommerceAPISession.deadline(1) as outer:
+            with CloudCommerceAPISession.deadline(10) as inner:
+                self.assertEqual(inner, outer)
+
+    def test_deadline_exceeded(self):
+        """Test that no request is made after the deadline has passed."""
+        with CloudCommerceAPISession.deadline(0):
+            with self.assertRaises(exceptions.CloudCommerceDeadlineExceededError):
+                requests.ProductOperations("getgeneratedsku")
+
+    def test_login_timeout(self):
+        """Test that login requests are sent with the session's default timeouts."""
+        with mock.patch.object(
+            self.cc_session.session, "post", wraps=self.cc_session.session.post
+        ) as post:
+            self.mock_login()
+        self.assertEqual(post.call_count, 2)
+        for call in post.call_args_list:
+            self.assertEqual(
+                call.kwargs["timeout"],
+                (
+                    CloudCommerceAPISession.CONNECT_TIMEOUT,
+                    CloudCommerceAPISession.READ_TIMEOUT,
+                ),
+            )
+
+    def test_login_timeout_limited_by_deadline(self):
+        """Test that login timeouts are reduced to the time left before a deadline."""
+        with mock.patch.object(
+            self.cc_session.session, "post", wraps=self.cc_session.session.post
+        ) as post:
+            with CloudCommerceAPISession.deadline(5):
+                self.mock_login()
+        for call in post.call_args_list:
+            connect, read = call.kwargs["timeout"]
+            self.assertLessEqual(connect, 5)
+            self.assertLessEqual(read, 5)
+
+    def test_login_deadline_exceeded(self):
+        """Test that no login request is made after the deadline has passed."""
+        self.cc_session.last_login = None
+        with mock.patch.object(
+            self.cc_session.session, "post", wraps=self.cc_session.session.post
+        ) as post:
+            with self.assertRaises(exceptions.CloudCommerceDeadlineExceededError):
+                requests.ProductOperations.prepare("getgeneratedsku").send(deadline=0)
+        post.assert_not_called()
+
+    def test_read_timeouts_are_retried(self):
+        """Test that idempotent requests are retried after a read timeout."""
+        self.register_request(
+            requests.ProductOperations,
+            response_list=[
+                {"exc": RequestsReadTimeout},
+                {"json": self.SKU_RESPONSE},
+            ],
+        )
+        response = requests.ProductOperations("getgeneratedsku")
+        self.assertEqual(response.data, "VSG-H3R-G0R")
+
+    def test_retries_respect_deadline(self):
+        """Test that no retry is made if it could not start before the deadline."""
+        self.register_request(
+            requests.ProductOperations,
+            response_list=[{"status_code": 500}, {"json": self.SKU_RESPONSE}],
+        )
+        self.cc_session.retry_policy = RetryPolicy(backoff_factor=2, jitter=False)
+        start = time.monotonic()
+        request = requests.ProductOperations.prepare("getgeneratedsku")
+        with self.assertRaises(exceptions.CloudCommerceResponseError):
+            request.send(deadline=1)
+        self.assertLess(time.monotonic() - start, 1)
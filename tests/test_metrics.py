@@ -0,0 +1,108 @@
+"""Tests for request metrics."""
+
+import unittest
+from unittest import mock
+
+from ccapi import requests
+from ccapi.requests import Metrics, RetryPolicy
+from ccapi.requests.metrics import Histogram
+
+from .test_CCAPI import TestCCAPI
+
+
+class TestHistogram(unittest.TestCase):
+    """Tests for ccapi.requests.metrics.Histogram."""
+
+    def test_observe(self):
+        """Test that values are counted in the correct buckets."""
+        histogram = Histogram(buckets=(1, 2))
+        for value in (0.5, 1, 1.5, 3):
+            histogram.observe(value)
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.sum, 6)
+        self.assertEqual(
+            histogram.cumulative_counts(), [(1, 2), (2, 3), (float("inf"), 4)]
+        )
+
+    def test_quantile(self):
+        """Test that quantiles return the upper bound of their bucket."""
+        histogram = Histogram(buckets=(1, 2, 3))
+        for value in range(10):
+            histogram.observe(0.5 if value < 9 else 2.5)
+        self.assertEqual(histogram.quantile(0.5), 1)
+        self.assertEqual(histogram.quantile(0.99), 3)
+        self.assertIsNone(Histogram().quantile(0.5))
+
+
+class TestMetrics(TestCCAPI):
+    """Tests for ccapi.requests.metrics.Metrics."""
+
+    SKU_RESPONSE = {
+        "Success": None,
+        "Message": None,
+        "RecordCount": 1,
+        "Data": "VSG-H3R-G0R",
+    }
+
+    def setUp(self):
+        """Use a new metrics collector."""
+        super().setUp()
+        self.original_metrics = self.cc_session.metrics
+        self.metrics = Metrics()
+        self.cc_session.metrics = self.metrics
+
+    def tearDown(self):
+        """Restore the session's metrics collector."""
+        self.cc_session.metrics = self.original_metrics
+
+    def get_endpoint(self, request_class):
+        """Return the snapshot for request_class."""
+        for endpoint in self.metrics.snapshot():
+            if endpoint["request"] == request_class.__name__:
+                return endpoint
+
+    def test_records_requests(self):
+        """Test that calls, latency and bytes are recorded per endpoint."""
+        self.register_request(requests.ProductOperations, json=self.SKU_RESPONSE)
+        for _ in range(3):
+            requests.ProductOperations("getgeneratedsku")
+        endpoint = self.get_endpoint(requests.ProductOperations)
+        self.assertEqual(endpoint["uri"], requests.ProductOperations.uri)
+        self.assertEqual(endpoint["calls"], 3)
+        self.assertEqual(endpoint["errors"], 0)
+        self.assertEqual(endpoint["latency"]["count"], 3)
+        self.assertGreater(endpoint["bytes_sent"], 0)
+        self.assertGreater(endpoint["bytes_received"], 0)
+
+    def test_records_retries_and_errors(self):
+        """Test that retries and failed requests are recorded."""
+        self.cc_session.retry_policy = RetryPolicy(backoff_factor=0, max_attempts=2)
+        self.register_request(requests.ProductOperations, status_code=500)
+        with self.assertRaises(Exception):
+            requests.ProductOperations("getgeneratedsku")
+        endpoint = self.get_endpoint(requests.ProductOperations)
+        self.assertEqual(endpoint["retries"], 1)
+        self.assertEqual(endpoint["errors"], 1)
+
+    def test_hook(self):
+        """Test that hooks are called with each sample."""
+        self.register_request(requests.ProductOperations, json=self.SKU_RESPONSE)
+        hook = mock.Mock()
+        self.metrics.add_hook(hook)
+        requests.ProductOperations("getgeneratedsku")
+        sample = hook.call_args.args[0]
+        self.assertEqual(sample.request_name, "ProductOperations")
+        self.assertEqual(sample.status_code, 200)
+
+    def test_to_prometheus(self):
+        """Test that metrics are exported in the Prometheus text format."""
+        self.register_request(requests.ProductOperations, json=self.SKU_RESPONSE)
+        requests.ProductOperations("getgeneratedsku")
+        text = self.metrics.to_prometheus()
+        labels = f'request="ProductOperations",uri="{requests.ProductOperations.uri}"'
+        self.assertIn(f"ccapi_requests_total{{{labels}}} 1", text)
+        self.assertIn(
+            f'ccapi_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1', text
+        )
+        self.assertIn("# TYPE ccapi_request_duration_seconds histogram", text)
@@ -0,0 +1,134 @@
+"""Tests for indexed Product Option and Product Option Value lookup."""
+
+import time
+import urllib
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from ccapi import CCAPI, cc_objects, requests
+from ccapi.requests import OptionIndex
+
+from . import test_data
+from .test_CCAPI import TestCCAPI
+
+
+class TestOptionIndex(TestCCAPI):
+    """Tests for ccapi.requests.optionindex.OptionIndex."""
+
+    OPTIONS = test_data.FIND_PRODUCT_SELECTED_OPTIONS_ONLY_TEST_RESLULT["options"]
+    OPTION_ID = "32131"
+    VALUES = {"3040682": "4XL", "3040683": "Small"}
+
+    def setUp(self):
+        """Use an empty option index."""
+        super().setUp()
+        self.cc_session.option_index = OptionIndex()
+        self.register_request(requests.GetOptions, json=self.OPTIONS)
+        self.register_request(requests.GetOptionData, json=self.option_data_response)
+        self.register_request(requests.AddOptionValue, text="3040684")
+        self.register_request(requests.DeleteOptionValue, text="ok")
+
+    def option_data_response(self, request, context):
+        """Return option values for an option ID."""
+        option_id = urllib.parse.parse_qs(request.text)["optid"][0]
+        return [
+            {
+                "ID": value_id,
+                "OptionValue": value,
+                "BrandID": 341,
+                "OptionID": option_id,
+                "OptionValueTrans": None,
+                "OptionsortOrder": 0,
+                "Selected": False,
+                "ProductCount": 0,
+                "OptionName": "Size",
+            }
+            for value_id, value in self.VALUES.items()
+        ]
+
+    def request_count(self, request_class):
+        """Return the number of requests made to a request class's URI."""
+        return len(
+            [r for r in self.adapter.request_history if request_class.uri in r.url]
+        )
+
+    def test_get_product_option_id(self):
+        """Test that option names are found without case or whitespace."""
+        self.assertEqual(CCAPI.get_product_option_id(" size "), 32131)
+        self.assertEqual(CCAPI.get_product_option_id("MANUFACTURER"), 34322)
+        self.assertIsNone(CCAPI.get_product_option_id("Colour"))
+        self.assertEqual(self.request_count(requests.GetOptions), 1)
+
+    def test_get_option_value_id(self):
+        """Test that values are loaded once for each option."""
+        self.assertEqual(CCAPI.get_option_value_id(self.OPTION_ID, "small "), "3040683")
+        self.assertEqual(CCAPI.get_option_value_id(self.OPTION_ID, "4xl"), "3040682")
+        self.assertIsNone(CCAPI.get_option_value_id(self.OPTION_ID, "Large"))
+        self.assertEqual(self.request_count(requests.GetOptionData), 1)
+
+    def test_create_option_value_updates_index(self):
+        """Test that created values are added to the index."""
+        value_id = CCAPI.get_option_value_id(self.OPTION_ID, "Large", create=True)
+        self.assertEqual(value_id, "3040684")
+        self.assertEqual(CCAPI.get_option_value_id(self.OPTION_ID, "large"), value_id)
+        option_value = self.cc_session.option_index.get_value_by_id(
+            self.OPTION_ID, value_id
+        )
+        self.assertEqual(option_value.option_name, "Size")
+        self.assertEqual(self.request_count(requests.GetOptionData), 1)
+        self.assertEqual(self.request_count(requests.AddOptionValue), 1)
+
+    def test_delete_option_value_updates_index(self):
+        """Test that deleted values are removed from the index."""
+        value_id = CCAPI.get_option_value_id(self.OPTION_ID, "Small")
+        CCAPI.delete_product_option_value(value_id)
+        self.assertIsNone(CCAPI.get_option_value_id(self.OPTION_ID, "Small"))
+        self.assertEqual(self.request_count(requests.GetOptionData), 1)
+
+    def test_clear(self):
+        """Test that cleared values are loaded again."""
+        CCAPI.get_option_value_id(self.OPTION_ID, "Small")
+        self.cc_session.option_index.clear(self.OPTION_ID)
+        CCAPI.get_option_value_id(self.OPTION_ID, "Small")
+        self.assertEqual(self.request_count(requests.GetOptionData), 2)
+        self.assertEqual(self.request_count(requests.GetOptions), 1)
+
+    def test_product_option_get_value(self):
+        """Test that ProductOption.get_value uses the index."""
+        option = cc_objects.ProductOption(self.OPTIONS[0])
+        self.assertEqual(option.get_value("small").id, "3040683")
+        self.assertEqual(option.get_value("Large", create=True).id, "3040684")
+        with self.assertRaises(Exception):
+            option.get_value("Medium")
+        self.assertEqual(self.request_count(requests.GetOptionData), 1)
+
+    def test_concurrent_get_value_creates_once(self):
+        """Test that concurrent callers creating the same value create it once."""
+        create_option_value = CCAPI.create_option_value
+
+        def slow_create_option_value(option_id, value):
+            time.sleep(0.05)
+            return create_option_value(option_id, value)
+
+        option = cc_objects.ProductOption(self.OPTIONS[0])
+        option.get_value("Small")
+        with mock.patch.object(
+            CCAPI, "create_option_value", staticmethod(slow_create_option_value)
+        ), ThreadPoolExecutor(max_workers=4) as executor:
+            values = list(
+                executor.map(lambda _: option.get_value("Large", create=True), range(4))
+            )
+        self.assertEqual({value.id for value in values}, {"3040684"})
+        self.assertEqual(self.request_count(requests.AddOptionValue), 1)
+
+    def test_product_set_option_value(self):
+        """Test that Product.set_option_value finds IDs with the index."""
+        response = test_data.FIND_PRODUCT_SELECTED_OPTIONS_ONLY_TEST_RESLULT
+        self.register_request(requests.FindProductSelectedOptionsOnly, json=response)
+        self.register_request(requests.SetProductOptionValue, text="ok")
+        for product_id in ("1", "2", "3"):
+            product = CCAPI.get_product(product_id)
+            product.set_option_value("Size", "Small")
+        self.assertEqual(self.request_count(requests.GetOptions), 1)
+        self.assertEqual(self.request_count(requests.GetOptionData), 1)
+        self.assertEqual(self.get_sent_request_data()["OptionValueID"], ["3040683"])
@@ -0,0 +1,118 @@
+"""Tests for iterating over paged requests."""
+
+import urllib
+
+from ccapi import requests
+from ccapi.requests import Paginator
+
+from .test_CCAPI import TestCCAPI
+
+
+class TestPaginator(TestCCAPI):
+    """Tests for ccapi.requests.paginator.Paginator."""
+
+    BAY_COUNT = 25
+
+    def setUp(self):
+        """Register request URI."""
+        super().setUp()
+        self.pages = []
+        self.bay_ids = list(range(self.BAY_COUNT))
+        self.register_request(requests.FindWarehouseBay, json=self.bay_response)
+
+    def bay_response(self, request, context):
+        """Return a page of warehouse bays."""
+        data = urllib.parse.parse_qs(request.text)
+        skip = int(data["SkipRecords"][0])
+        take = int(data["TakeLimit"][0])
+        self.pages.append((skip, take))
+        return [{"ID": bay_id} for bay_id in self.bay_ids[skip : skip + take]]
+
+    def paginator(self, **kwargs):
+        """Return a paginator for warehouse bays."""
+        return Paginator(
+            requests.FindWarehouseBay, warehouse_id=1, prog_type="normal", **kwargs
+        )
+
+    def bay_ids_returned(self, paginator):
+        """Return the IDs of the bays returned by paginator."""
+        return [bay.id for bay in paginator]
+
+    def test_stops_on_short_page(self):
+        """Test that no request is made after a page which is not full."""
+        ids = self.bay_ids_returned(self.paginator(page_size=10))
+        self.assertEqual(ids, self.bay_ids)
+        self.assertEqual(self.pages, [(0, 10), (10, 10), (20, 10)])
+
+    def test_default_page_size(self):
+        """Test that the default take argument of the request class is used."""
+        self.bay_ids_returned(self.paginator())
+        self.assertEqual(self.pages, [(0, 100)])
+
+    def test_take_argument_sets_page_size(self):
+        """Test that the take argument passed for the request sets the page size."""
+        self.bay_ids_returned(self.paginator(take_limit=20, skip_records=5))
+        self.assertEqual(self.pages, [(0, 20), (20, 20)])
+
+    def test_is_lazy(self):
+        """Test that pages are requested as results are iterated."""
+        bays = iter(self.paginator(page_size=10))
+        self.assertEqual(self.pages, [])
+        next(bays)
+        self.assertEqual(self.pages, [(0, 10)])
+
+    def test_key_removes_duplicates(self):
+        """Test that results with a key already seen are skipped."""
+        self.bay_ids = [1, 2, 2, 3, 1, 4]
+        ids = self.bay_ids_returned(self.paginator(page_size=2, key=lambda b: b.id))
+        self.assertEqual(ids, [1, 2, 3, 4])
+
+    def test_key_stops_on_page_without_new_results(self):
+        """Test that iteration stops after a page of results already seen."""
+        self.bay_ids = [1, 2, 1, 2, 3, 4]
+        ids = self.bay_ids_returned(self.paginator(page_size=2, key=lambda b: b.id))
+        self.assertEqual(ids, [1, 2])
+        self.assertEqual(len(self.pages), 2)
+
+    def test_page_size_shrinks_for_slow_pages(self):
+        """Test that the page size is halved when pages take too long."""
+        paginator = self.paginator(page_size=8, min_page_size=2, target_page_time=0)
+        self.assertEqual(self.bay_ids_returned(paginator), self.bay_ids)
+        self.assertEqual([take for _, take in self.pages[:4]], [8, 4, 2, 2])
+
+    def test_page_size_shrinks_for_large_pages(self):
+        """Test that the page size is halved when pages are too large."""
+        paginator = self.paginator(page_size=8, min_page_size=2, max_page_bytes=1)
+        self.assertEqual(self.bay_ids_returned(paginator), self.bay_ids)
+        self.assertEqual([take for _, take in self.pages[:4]], [8, 4, 2, 2])
+
+    def test_page_size_grows_for_fast_pages(self):
+        """Test that the page size is doubled up to max_page_size."""
+        paginator = self.paginator(page_size=2, max_page_size=8)
+        self.assertEqual(self.bay_ids_returned(paginator), self.bay_ids)
+        self.assertEqual(self.pages, [(0, 2), (2, 4), (6, 8), (14, 8), (22, 8)])
+
+    def test_prefetch(self):
+        """Test that pages are requested ahead of the page being iterated."""
+        bays = iter(self.paginator(page_size=5, prefetch=2))
+        next(bays)
+        self.assertGreaterEqual(len(self.pages), 1)
+        self.assertEqual(self.bay_ids_returned(bays), self.bay_ids[1:])
+        self.assertEqual(sorted(self.pages)[:6], [(i, 5) for i in range(0, 30, 5)])
+
+    def test_short_pages(self):
+        """Test that short pages advance by the number of results received."""
+        self.bay_ids = list(range(7))
+
+        def bay_response(request, context):
+            return self.bay_response(request, context)[:3]
+
+        self.register_request(requests.FindWarehouseBay, json=bay_response)
+        ids = self.bay_ids_returned(self.paginator(page_size=5, short_pages=True))
+        self.assertEqual(ids, self.bay_ids)
+        self.assertEqual([skip for skip, _ in self.pages], [0, 3, 6, 7])
+
+    def test_request_class_must_be_paged(self):
+        """Test that a ValueError is raised for request classes without paging."""
+        with self.assertRaises(ValueError):
+            Paginator(requests.FindWarehouse)
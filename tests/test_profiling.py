@@ -0,0 +1,98 @@
+"""Tests for request lifecycle hooks and profiling."""
+
+from unittest import mock
+
+from ccapi import CCAPI, requests
+from ccapi.requests import RequestProfiler, profiling, request_hooks
+
+from .test_CCAPI import TestCCAPI
+
+
+class TestRequestHooks(TestCCAPI):
+    """Tests for request lifecycle hooks."""
+
+    SKU_RESPONSE = {
+        "Success": None,
+        "Message": None,
+        "RecordCount": 1,
+        "Data": "VSG-H3R-G0R",
+    }
+
+    def setUp(self):
+        """Register request URI."""
+        super().setUp()
+        self.register_request(requests.ProductOperations, json=self.SKU_RESPONSE)
+
+    def test_phases_are_reported(self):
+        """Test that each phase of a request is reported to hooks."""
+        hook = mock.Mock()
+        with request_hooks(hook):
+            requests.ProductOperations("getgeneratedsku")
+        timings = [call.args[0] for call in hook.call_args_list]
+        self.assertEqual(
+            [timing.phase for timing in timings],
+            [
+                profiling.BUILD,
+                profiling.NETWORK,
+                profiling.DECODE,
+                profiling.PROCESS,
+            ],
+        )
+        for timing in timings:
+            self.assertEqual(timing.request_name, "ProductOperations")
+            self.assertGreaterEqual(timing.duration, 0)
+
+    def test_session_hooks(self):
+        """Test that hooks can be added to a session."""
+        hook = mock.Mock()
+        self.cc_session.request_hooks.append(hook)
+        try:
+            requests.ProductOperations("getgeneratedsku")
+        finally:
+            self.cc_session.request_hooks.remove(hook)
+        self.assertEqual(hook.call_count, 4)
+
+    def test_hooks_are_scoped(self):
+        """Test that hooks are not called outside their context."""
+        hook = mock.Mock()
+        with request_hooks(hook):
+            pass
+        requests.ProductOperations("getgeneratedsku")
+        hook.assert_not_called()
+
+
+class TestRequestProfiler(TestCCAPI):
+    """Tests for ccapi.requests.profiling.RequestProfiler."""
+
+    SKU_RESPONSE = TestRequestHooks.SKU_RESPONSE
+
+    def setUp(self):
+        """Register request URI."""
+        super().setUp()
+        self.register_request(requests.ProductOperations, json=self.SKU_RESPONSE)
+
+    def test_summary(self):
+        """Test that phase timings are summarised by request class."""
+        with RequestProfiler() as profiler:
+            for _ in range(3):
+                CCAPI.get_sku()
+        summary = profiler.summary()["ProductOperations"]
+        self.assertEqual(set(summary), set(profiling.PHASES))
+        self.assertEqual(summary[profiling.NETWORK]["count"], 3)
+
+    def test_bulk_requests_are_profiled(self):
+        """Test that requests made in worker threads are profiled."""
+        with RequestProfiler() as profiler:
+            list(CCAPI.map(CCAPI.get_sku, [()] * 4))
+        summary = profiler.summary()["ProductOperations"]
+        self.assertEqual(summary[profiling.NETWORK]["count"], 4)
+
+    def test_cprofile_and_memory(self):
+        """Test that cProfile and tracemalloc statistics are collected."""
+        with RequestProfiler(cprofile=True, memory=True) as profiler:
+            CCAPI.get_sku()
+        self.assertGreater(profiler.peak_memory, 0)
+        report = profiler.report()
+        self.assertIn("ProductOperations", report)
+        self.assertIn("function calls", report)
+        self.assertIn("Peak traced memory", report)
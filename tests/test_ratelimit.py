@@ -0,0 +1,141 @@
+"""Tests for request rate limiting."""
+
+import multiprocessing
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from ccapi import exceptions, requests
+from ccapi.requests import FileTokenBucket, RateLimiter, TokenBucket
+
+from .test_CCAPI import TestCCAPI
+
+
+def acquire_from_file_bucket(path):
+    """Acquire tokens from a file token bucket in another process."""
+    bucket = FileTokenBucket(path, rate=20, capacity=5)
+    for _ in range(5):
+        bucket.acquire()
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Tests for ccapi.requests.ratelimit.TokenBucket."""
+
+    def test_burst_up_to_capacity(self):
+        """Test that tokens up to capacity are available immediately."""
+        bucket = TokenBucket(rate=1, capacity=3)
+        self.assertEqual([bucket.try_acquire() for _ in range(3)], [0, 0, 0])
+        self.assertGreater(bucket.try_acquire(), 0)
+
+    def test_acquire_waits_for_tokens(self):
+        """Test that acquire waits for tokens to be added."""
+        bucket = TokenBucket(rate=20, capacity=1)
+        start = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.14)
+
+    def test_shared_between_threads(self):
+        """Test that a bucket limits the total rate of several threads."""
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: bucket.acquire(), range(11)))
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_acquire_deadline(self):
+        """Test that acquire returns False if tokens are not available in time."""
+        bucket = TokenBucket(rate=1, capacity=1)
+        self.assertTrue(bucket.acquire(deadline=time.monotonic()))
+        self.assertFalse(bucket.acquire(deadline=time.monotonic() + 0.5))
+        self.assertGreater(bucket.try_acquire(), 0.5)
+
+    def test_invalid_rate(self):
+        """Test that a rate of zero raises ValueError."""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestFileTokenBucket(unittest.TestCase):
+    """Tests for ccapi.requests.ratelimit.FileTokenBucket."""
+
+    def test_shared_between_processes(self):
+        """Test that a file bucket limits the total rate of several processes."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = f"{directory}/test.bucket"
+            start = time.monotonic()
+            processes = [
+                multiprocessing.Process(target=acquire_from_file_bucket, args=(path,))
+                for _ in range(2)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+            self.assertGreaterEqual(time.monotonic() - start, 0.24)
+
+
+class TestRateLimiter(TestCCAPI):
+    """Tests for ccapi.requests.ratelimit.RateLimiter."""
+
+    def test_endpoint_limits(self):
+        """Test that endpoint limits only apply to their endpoint."""
+        limiter = RateLimiter(
+            endpoint_limits={requests.GetProducts.uri: (1, 1)},
+        )
+        limiter.acquire("Handlers/ProductManager/GetProducts.ashx")
+        bucket = limiter.endpoint_buckets["handlers/productmanager/getproducts.ashx"]
+        self.assertGreater(bucket.try_acquire(), 0)
+        start = time.monotonic()
+        limiter.acquire(requests.GetOptions.uri)
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_directory(self):
+        """Test that buckets are stored in files when a directory is given."""
+        with tempfile.TemporaryDirectory() as directory:
+            limiter = RateLimiter(
+                rate=10, endpoint_limits={"uri": 5}, directory=directory
+            )
+            self.assertIsInstance(limiter.global_bucket, FileTokenBucket)
+            self.assertIsInstance(limiter.endpoint_buckets["uri"], FileTokenBucket)
+
+    def test_session_uses_rate_limiter(self):
+        """Test that the session acquires a token before each request."""
+        self.register_request(
+            requests.products.GetPendingStock, json={"TotalPending": 3}
+        )
+        limiter = mock.Mock()
+        self.cc_session.rate_limiter = limiter
+        try:
+            requests.products.GetPendingStock("1")
+        finally:
+            self.cc_session.rate_limiter = None
+        limiter.acquire.assert_called_once_with(
+            requests.products.GetPendingStock.uri, deadline=None
+        )
+
+    def test_deadline(self):
+        """Test that the limiter does not wait past a deadline."""
+        limiter = RateLimiter(rate=1, capacity=1)
+        limiter.acquire("uri")
+        start = time.monotonic()
+        with self.assertRaises(exceptions.CloudCommerceDeadlineExceededError):
+            limiter.acquire("uri", deadline=time.monotonic() + 0.1)
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_session_request_deadline(self):
+        """Test that a request waiting for the rate limiter respects its deadline."""
+        self.register_request(
+            requests.products.GetPendingStock, json={"TotalPending": 3}
+        )
+        self.cc_session.rate_limiter = RateLimiter(rate=1, capacity=1)
+        try:
+            requests.products.GetPendingStock("1")
+            start = time.monotonic()
+            with self.assertRaises(exceptions.CloudCommerceDeadlineExceededError):
+                requests.products.GetPendingStock.prepare("1").send(deadline=0.2)
+        finally:
+            self.cc_session.rate_limiter = None
+        self.assertLess(time.monotonic() - start, 0.2)
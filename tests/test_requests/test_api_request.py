@@ -0,0 +1,71 @@
+"""Tests for the APIRequest base class."""
+
+import urllib
+from concurrent.futures import ThreadPoolExecutor
+
+from ccapi.requests import products
+
+from .test_request import TestRequest
+
+
+class TestAPIRequest(TestRequest):
+    """Tests for the APIRequest base class."""
+
+    request_class = products.UpdateProductStockLevel
+
+    def setUp(self):
+        """Register request URI."""
+        super().setUp()
+        self.register(text="Success")
+
+    def request_kwargs(self, product_id):
+        """Return kwargs for an UpdateProductStockLevel request."""
+        return {
+            "product_id": product_id,
+            "new_stock_level": int(product_id) + 1,
+            "old_stock_level": int(product_id),
+        }
+
+    def test_prepare_does_not_send_request(self):
+        """Test that prepare returns a request instance without sending it."""
+        request_count = len(self.adapter.request_history)
+        request = self.request_class.prepare(**self.request_kwargs("1"))
+        self.assertIsInstance(request, self.request_class)
+        self.assertEqual(request.product_id, "1")
+        self.assertEqual(len(self.adapter.request_history), request_count)
+
+    def test_send(self):
+        """Test that send makes the request and returns the processed response."""
+        request = self.request_class.prepare(**self.request_kwargs("1"))
+        self.assertEqual(request.send(), "Success")
+        self.assertDataSent("ProductID", "1")
+
+    def test_request_state_is_not_stored_on_class(self):
+        """Test that request arguments are not stored on the request class."""
+        self.mock_request(**self.request_kwargs("1"))
+        self.assertFalse(hasattr(self.request_class, "product_id"))
+
+    def test_concurrent_requests_send_their_own_data(self):
+        """Test that requests made from multiple threads do not share state."""
+        product_ids = [str(i) for i in range(50)]
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(
+                executor.map(
+                    lambda product_id: self.mock_request(
+                        **self.request_kwargs(product_id)
+                    ),
+                    product_ids,
+                )
+            )
+        sent = [
+            urllib.parse.parse_qs(request.text)
+            for request in self.adapter.request_history
+            if self.request_class.uri in request.url
+        ]
+        self.assertEqual(
+            sorted(data["ProductID"][0] for data in sent), sorted(product_ids)
+        )
+        for data in sent:
+            self.assertEqual(
+                int(data["newStockLevel"][0]), int(data["ProductID"][0]) + 1
+            )
@@ -0,0 +1,188 @@
+"""Tests for caching logged in sessions on disk."""
+
+import datetime
+import os
+import stat
+import tempfile
+import unittest
+
+import requests as requests_lib
+
+from ccapi import requests
+from ccapi.requests import CloudCommerceAPISession, SessionCache
+
+from .test_CCAPI import TestCCAPI
+
+
+class TestSessionCache(unittest.TestCase):
+    """Tests for ccapi.requests.sessioncache.SessionCache."""
+
+    DOMAIN = "mockcompany.cloudcommercepro.com"
+    USERNAME = "mock_username"
+
+    def setUp(self):
+        """Create a cache in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = SessionCache(self.directory.name)
+        self.cookies = requests_lib.cookies.RequestsCookieJar()
+        self.cookies.set("ASP.NET_SessionId", "abc123", domain=self.DOMAIN, path="/")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def save(self, expires_in=datetime.timedelta(hours=1)):
+        """Save a login to the cache."""
+        now = datetime.datetime.now()
+        self.cache.save(
+            self.DOMAIN,
+            self.USERNAME,
+            cookies=self.cookies,
+            last_login=now,
+            expires=now + expires_in,
+        )
+        return now
+
+    def test_round_trip(self):
+        """Test that a saved login can be loaded."""
+        last_login = self.save()
+        cached = self.cache.load(self.DOMAIN, self.USERNAME)
+        self.assertEqual(cached["last_login"], last_login)
+        self.assertEqual(cached["cookies"][0]["name"], "ASP.NET_SessionId")
+        self.assertEqual(cached["cookies"][0]["value"], "abc123")
+
+    def test_file_permissions(self):
+        """Test that cache files are only readable by their owner."""
+        self.save()
+        mode = os.stat(self.cache.get_path(self.DOMAIN, self.USERNAME)).st_mode
+        self.assertEqual(stat.S_IMODE(mode), 0o600)
+
+    def test_keyed_by_username(self):
+        """Test that logins for other users are not returned."""
+        self.save()
+        self.assertIsNone(self.cache.load(self.DOMAIN, "other_user"))
+
+    def test_expired(self):
+        """Test that expired logins are not returned."""
+        self.save(expires_in=datetime.timedelta(seconds=-1))
+        self.assertIsNone(self.cache.load(self.DOMAIN, self.USERNAME))
+
+    def test_invalid_file(self):
+        """Test that an unreadable cache file is ignored."""
+        self.save()
+        with open(self.cache.get_path(self.DOMAIN, self.USERNAME), "w") as f:
+            f.write("not json")
+        self.assertIsNone(self.cache.load(self.DOMAIN, self.USERNAME))
+
+    def test_invalidate(self):
+        """Test that invalidate removes a cached login."""
+        self.save()
+        self.cache.invalidate(self.DOMAIN, self.USERNAME)
+        self.assertIsNone(self.cache.load(self.DOMAIN, self.USERNAME))
+        self.cache.invalidate(self.DOMAIN, self.USERNAME)
+
+
+class TestCachedLogin(TestCCAPI):
+    """Test that sessions reuse cached logins."""
+
+    SKU_RESPONSE = {
+        "Success": None,
+        "Message": None,
+        "RecordCount": 1,
+        "Data": "VSG-H3R-G0R",
+    }
+
+    def setUp(self):
+        """Create a session cache in a temporary directory."""
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = SessionCache(self.directory.name)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def create_session(self):
+        """Return a new session using the cache and the mock adapter."""
+        session = CloudCommerceAPISession(session_cache=self.cache)
+        session.session.mount("http://", self.adapter)
+        return session
+
+    def login(self, session):
+        """Log in session."""
+        session.session.cookies.set("ASP.NET_SessionId", "abc123", domain=self.DOMAIN)
+        session.get_session(
+            domain=self.DOMAIN, username=self.USERNAME, password=self.PASSWORD
+        )
+
+    def login_count(self):
+        """Return the number of login handler requests made."""
+        return len(
+            [r for r in self.adapter.request_history if self.LOGIN_HANDLER_URI in r.url]
+        )
+
+    def test_login_is_saved(self):
+        """Test that logging in stores the session in the cache."""
+        self.login(self.create_session())
+        cached = self.cache.load(self.DOMAIN, self.USERNAME)
+        self.assertEqual(cached["cookies"][0]["value"], "abc123")
+
+    def test_cached_login_is_reused(self):
+        """Test that a new session restores a cached login without logging in."""
+        self.login(self.create_session())
+        logins = self.login_count()
+        session = self.create_session()
+        session.get_session(
+            domain=self.DOMAIN, username=self.USERNAME, password=self.PASSWORD
+        )
+        self.assertEqual(self.login_count(), logins)
+        self.assertIsNotNone(session.last_login)
+        self.assertEqual(session.session.cookies["ASP.NET_SessionId"], "abc123")
+
+    def test_background_refresh_logs_in(self):
+        """Test that a background refresh logs in rather than restoring the cache."""
+        session = self.create_session()
+        self.login(session)
+        session.last_login -= datetime.timedelta(minutes=56)
+        session.save_cached_login()
+        session.refresh_before_expiry = datetime.timedelta(minutes=5)
+        logins = self.login_count()
+        session.check_login()
+        session._refresh_thread.join()
+        self.assertEqual(self.login_count(), logins + 1)
+        self.assertFalse(session.session_expires_soon())
+        cached = self.cache.load(self.DOMAIN, self.USERNAME)
+        self.assertEqual(cached["last_login"], session.last_login)
+
+    def test_rejected_login_is_replaced(self):
+        """Test that a request rejected as not logged in logs in and is resent."""
+        self.login(self.create_session())
+        session = self.create_session()
+        self.login(session)
+        logins = self.login_count()
+        self.register_request(
+            requests.ProductOperations,
+            response_list=[
+                {"status_code": 401},
+                {"json": self.SKU_RESPONSE},
+            ],
+        )
+        with session.activate():
+            response = requests.ProductOperations("getsku")
+        self.assertEqual(response.data, "VSG-H3R-G0R")
+        self.assertEqual(self.login_count(), logins + 1)
+
+    def test_rejected_request_is_only_resent_once(self):
+        """Test that a request is not resent more than once."""
+        session = self.create_session()
+        self.login(session)
+        self.register_request(requests.ProductOperations, status_code=401)
+        with session.activate():
+            with self.assertRaises(Exception):
+                requests.ProductOperations("getsku")
+        sent = [
+            r
+            for r in self.adapter.request_history
+            if requests.ProductOperations.uri in r.url
+        ]
+        self.assertEqual(len(sent), 2)
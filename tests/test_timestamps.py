@@ -0,0 +1,76 @@
+"""Tests for parsing Cloud Commerce timestamps."""
+
+import datetime
+import unittest
+
+from ccapi.timestamps import parse_timestamp, parse_timestamps
+
+
+class TestParseTimestamp(unittest.TestCase):
+    """Tests for ccapi.timestamps.parse_timestamp."""
+
+    def setUp(self):
+        """Clear the timestamp cache."""
+        parse_timestamp.cache_clear()
+
+    def test_day_first(self):
+        """Test parsing day first timestamps."""
+        self.assertEqual(
+            parse_timestamp("05/11/2018 10:23"), datetime.datetime(2018, 11, 5, 10, 23)
+        )
+        self.assertEqual(
+            parse_timestamp("5/11/2018 10:23:41"),
+            datetime.datetime(2018, 11, 5, 10, 23, 41),
+        )
+
+    def test_day_first_date(self):
+        """Test parsing day first dates."""
+        self.assertEqual(parse_timestamp("05/11/2018"), datetime.datetime(2018, 11, 5))
+
+    def test_iso(self):
+        """Test parsing ISO 8601 timestamps."""
+        self.assertEqual(
+            parse_timestamp("2018-11-05T10:23:41"),
+            datetime.datetime(2018, 11, 5, 10, 23, 41),
+        )
+        self.assertEqual(
+            parse_timestamp("2018-11-05T10:23:41.7133333"),
+            datetime.datetime(2018, 11, 5, 10, 23, 41, 713333),
+        )
+        self.assertEqual(
+            parse_timestamp("2018-11-05T10:23:41.7"),
+            datetime.datetime(2018, 11, 5, 10, 23, 41, 700000),
+        )
+
+    def test_iso_date(self):
+        """Test parsing ISO 8601 dates."""
+        self.assertEqual(parse_timestamp("2018-11-05"), datetime.datetime(2018, 11, 5))
+
+    def test_invalid_timestamps(self):
+        """Test that a ValueError is raised for unrecognised timestamps."""
+        for timestamp in ("", "???", "31/02/2018", "05/11/2018 10", None):
+            with self.subTest(timestamp=timestamp):
+                with self.assertRaises(ValueError):
+                    parse_timestamp(timestamp)
+
+    def test_cache(self):
+        """Test that repeated timestamps are parsed once."""
+        first = parse_timestamp("05/11/2018 10:23")
+        self.assertIs(parse_timestamp("05/11/2018 10:23"), first)
+        self.assertEqual(parse_timestamp.cache_info().hits, 1)
+
+
+class TestParseTimestamps(unittest.TestCase):
+    """Tests for ccapi.timestamps.parse_timestamps."""
+
+    def test_parse_timestamps(self):
+        """Test that timestamps are returned in order."""
+        timestamps = ["05/11/2018 10:23", "2018-11-06", "05/11/2018 10:23"]
+        self.assertEqual(
+            parse_timestamps(iter(timestamps)),
+            [parse_timestamp(timestamp) for timestamp in timestamps],
+        )
+
+    def test_empty(self):
+        """Test that an empty list is returned for no timestamps."""
+        self.assertEqual(parse_timestamps([]), [])
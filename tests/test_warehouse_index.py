@@ -0,0 +1,250 @@
+"""Tests for indexed Warehouse and Warehouse Bay lookup."""
+
+import os
+import tempfile
+import time
+import urllib
+from pathlib import Path
+from unittest import mock
+
+from ccapi import CCAPI, requests
+from ccapi.requests import WarehouseIndex, warehouseindex
+
+from .test_CCAPI import TestCCAPI
+
+
+class TestWarehouseIndex(TestCCAPI):
+    """Tests for ccapi.requests.warehouseindex.WarehouseIndex."""
+
+    WAREHOUSE_ID = 1
+    WAREHOUSE_NAME = "Main"
+    BAYS = {101: "A1", 102: "A2"}
+
+    def setUp(self):
+        """Use an empty warehouse index."""
+        super().setUp()
+        self.cc_session.warehouse_index = WarehouseIndex()
+        self.save_response = "103"
+        self.register_request(requests.FindWarehouse, json=[self.warehouse_data()])
+        self.register_request(requests.FindWarehouseBay, json=self.bay_response)
+        self.register_request(
+            requests.SaveWarehouseBay, text=lambda request, context: self.save_response
+        )
+
+    def warehouse_data(self):
+        """Return warehouse JSON."""
+        return {
+            "ID": self.WAREHOUSE_ID,
+            "Name": self.WAREHOUSE_NAME,
+            "DateCreated": None,
+            "DateUpdated": None,
+            "WarehouseTypeEnum": 0,
+            "SalesChannelInboundLinks": [],
+            "SalesChannelOutboundLinks": [],
+            "WarehouseType": None,
+            "BrandDetailsId": 341,
+            "StatusId": 1,
+            "AddressId": 0,
+        }
+
+    def bay_response(self, request, context):
+        """Return a page of warehouse bays."""
+        data = urllib.parse.parse_qs(request.text)
+        if data.get("operation") == ["removebay"]:
+            return None
+        if data["SkipRecords"] != ["0"]:
+            return []
+        return [
+            {"ID": bay_id, "Name": name, "WarehouseID": self.WAREHOUSE_ID}
+            for bay_id, name in self.BAYS.items()
+        ]
+
+    def request_count(self, request_class):
+        """Return the number of requests made to a request class's URI."""
+        return len(
+            [r for r in self.adapter.request_history if request_class.uri in r.url]
+        )
+
+    def bay_page_count(self):
+        """Return the number of pages of bays requested."""
+        return len(
+            [
+                r
+                for r in self.adapter.request_history
+                if requests.FindWarehouseBay.uri in r.url
+                and "SkipRecords" in urllib.parse.parse_qs(r.text)
+            ]
+        )
+
+    def test_get_bay_id(self):
+        """Test that bays are loaded once for each warehouse."""
+        self.assertEqual(CCAPI.get_bay_id("A2", self.WAREHOUSE_NAME), 102)
+        self.assertEqual(CCAPI.get_bay_id("A1", self.WAREHOUSE_NAME), 101)
+        self.assertIsNone(CCAPI.get_bay_id("B1", self.WAREHOUSE_NAME))
+        self.assertEqual(self.request_count(requests.FindWarehouse), 1)
+        self.assertEqual(self.bay_page_count(), 1)
+
+    def test_get_bay_id_for_missing_warehouse(self):
+        """Test that a KeyError is raised for an unknown warehouse."""
+        with self.assertRaises(KeyError):
+            CCAPI.get_bay_id("A1", "Missing")
+
+    def test_create_bay_updates_index(self):
+        """Test that created bays are added to the index without reloading bays."""
+        bay_id = CCAPI.get_bay_id("B1", self.WAREHOUSE_NAME, create=True)
+        self.assertEqual(bay_id, 103)
+        self.assertEqual(CCAPI.get_bay_id("B1", self.WAREHOUSE_NAME), 103)
+        self.assertEqual(self.bay_page_count(), 1)
+
+    def test_create_bay_without_id_reloads_bays_once(self):
+        """Test that bays are reloaded once if the new bay's ID is not returned."""
+        CCAPI.get_bay_id("A1", self.WAREHOUSE_NAME)
+        self.save_response = "ok"
+        self.BAYS = {**self.BAYS, 104: "B2"}
+        self.assertEqual(CCAPI.get_bay_id("B2", self.WAREHOUSE_NAME, create=True), 104)
+        self.assertEqual(self.bay_page_count(), 2)
+
+    def test_delete_bay_updates_index(self):
+        """Test that deleted bays are removed from the index."""
+        CCAPI.delete_bay(CCAPI.get_bay_id("A1", self.WAREHOUSE_NAME))
+        self.assertIsNone(CCAPI.get_bay_id("A1", self.WAREHOUSE_NAME))
+
+    def test_warehouse_add_bay(self):
+        """Test that Warehouse.add_bay does not reload bays."""
+        warehouse = CCAPI.get_warehouses()[self.WAREHOUSE_NAME]
+        self.assertEqual(warehouse.add_bay("B1"), 103)
+        self.assertEqual(warehouse.get_bay("B1").id, 103)
+        self.save_response = "104"
+        self.assertEqual(warehouse.get_bay("C1", create=True).id, 104)
+        self.assertEqual(self.bay_page_count(), 1)
+
+    def test_warehouse_reload_bays(self):
+        """Test that Warehouse.reload_bays downloads bays again."""
+        warehouse = CCAPI.get_warehouses()[self.WAREHOUSE_NAME]
+        self.assertEqual(len(warehouse.bays), 2)
+        warehouse.reload_bays()
+        self.assertEqual(self.bay_page_count(), 2)
+
+    def test_persistence(self):
+        """Test that a stored index is used by a new index."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "warehouses.json"
+            with WarehouseIndex(path=path) as warehouse_index:
+                self.cc_session.warehouse_index = warehouse_index
+                CCAPI.get_bay_id("B1", self.WAREHOUSE_NAME, create=True)
+            warehouse_index = WarehouseIndex(path=path)
+            self.assertEqual(
+                warehouse_index.get_warehouse(self.WAREHOUSE_NAME).id,
+                self.WAREHOUSE_ID,
+            )
+            self.assertEqual(warehouse_index.get_bay(self.WAREHOUSE_ID, "B1").id, 103)
+            self.cc_session.warehouse_index = warehouse_index
+            self.assertEqual(CCAPI.get_bay_id("A1", self.WAREHOUSE_NAME), 101)
+            self.assertEqual(self.request_count(requests.FindWarehouse), 1)
+            self.assertEqual(self.bay_page_count(), 1)
+
+    def test_expired_index_is_ignored(self):
+        """Test that stored indexes older than max_age are not used."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "warehouses.json"
+            self.cc_session.warehouse_index = WarehouseIndex(path=path)
+            CCAPI.get_bay_id("A1", self.WAREHOUSE_NAME)
+            time.sleep(0.02)
+            warehouse_index = WarehouseIndex(path=path, max_age=0.01)
+            self.assertFalse(warehouse_index.warehouses_loaded)
+
+    def test_invalid_index_file_is_ignored(self):
+        """Test that invalid index files are ignored."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "warehouses.json"
+            path.write_text("not json")
+            with self.assertLogs("ccapi.requests.warehouseindex", level="WARNING"):
+                warehouse_index = WarehouseIndex(path=path)
+            self.assertFalse(warehouse_index.warehouses_loaded)
+
+    def saves(self, warehouse_index, func):
+        """Return the number of times warehouse_index is written by func."""
+        with mock.patch(
+            "ccapi.requests.warehouseindex.os.replace", wraps=os.replace
+        ) as replace:
+            func(warehouse_index)
+        return replace.call_count
+
+    def test_added_bays_are_saved_once_per_interval(self):
+        """Test that bays added within save_interval are saved together."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "warehouses.json"
+            warehouse_index = WarehouseIndex(path=path, save_interval=60)
+            self.cc_session.warehouse_index = warehouse_index
+
+            def create_bays(warehouse_index):
+                for bay_id, bay_name in ((103, "B1"), (104, "B2"), (105, "B3")):
+                    self.save_response = str(bay_id)
+                    CCAPI.get_bay_id(bay_name, self.WAREHOUSE_NAME, create=True)
+
+            self.assertEqual(self.saves(warehouse_index, create_bays), 2)
+            stored_index = WarehouseIndex(path=path)
+            self.assertIsNotNone(stored_index.get_bay(self.WAREHOUSE_ID, "A1"))
+            self.assertIsNone(stored_index.get_bay(self.WAREHOUSE_ID, "B1"))
+            self.assertEqual(self.saves(warehouse_index, WarehouseIndex.close), 1)
+            self.assertEqual(
+                WarehouseIndex(path=path).get_bay(self.WAREHOUSE_ID, "B1").id, 103
+            )
+
+    def test_loaded_bays_survive_reload(self):
+        """Test that loaded bays are stored without closing the index."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "warehouses.json"
+            self.cc_session.warehouse_index = WarehouseIndex(path=path)
+            CCAPI.get_bay_id("A1", self.WAREHOUSE_NAME)
+            self.cc_session.warehouse_index = WarehouseIndex(path=path)
+            self.assertEqual(CCAPI.get_bay_id("A2", self.WAREHOUSE_NAME), 102)
+            self.assertEqual(self.request_count(requests.FindWarehouse), 1)
+            self.assertEqual(self.bay_page_count(), 1)
+
+    def test_unsaved_changes_are_saved_at_exit(self):
+        """Test that unsaved changes are written when the interpreter exits."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "warehouses.json"
+            self.cc_session.warehouse_index = WarehouseIndex(path=path)
+            CCAPI.get_bay_id("B1", self.WAREHOUSE_NAME, create=True)
+            warehouseindex._save_open_indexes()
+            self.assertEqual(
+                WarehouseIndex(path=path).get_bay(self.WAREHOUSE_ID, "B1").id, 103
+            )
+
+    def test_stored_bays_are_loaded_before_creating(self):
+        """Test that a bay missing from a stored index is not created twice."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "warehouses.json"
+            with WarehouseIndex(path=path) as warehouse_index:
+                self.cc_session.warehouse_index = warehouse_index
+                CCAPI.get_bay_id("A1", self.WAREHOUSE_NAME)
+            self.BAYS = {**self.BAYS, 104: "B2"}
+            self.cc_session.warehouse_index = WarehouseIndex(path=path)
+            self.assertEqual(
+                CCAPI.get_bay_id("B2", self.WAREHOUSE_NAME, create=True), 104
+            )
+            self.assertEqual(self.request_count(requests.SaveWarehouseBay), 0)
+            self.assertEqual(
+                CCAPI.get_bay_id("B3", self.WAREHOUSE_NAME, create=True), 103
+            )
+            self.assertEqual(self.bay_page_count(), 2)
+
+    def test_unchanged_index_is_not_saved(self):
+        """Test that the index is not written if nothing has changed."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "warehouses.json"
+            warehouse_index = WarehouseIndex(path=path, save_interval=0)
+            self.cc_session.warehouse_index = warehouse_index
+            CCAPI.get_bay_id("A1", self.WAREHOUSE_NAME)
+
+            def remove_missing_bay(warehouse_index):
+                warehouse_index.remove_bay(999)
+                warehouse_index.clear(999)
+                warehouse_index.close()
+
+            self.assertEqual(self.saves(warehouse_index, remove_missing_bay), 0)
+            self.assertEqual(
+                self.saves(warehouse_index, lambda index: index.remove_bay(101)), 1
+            )